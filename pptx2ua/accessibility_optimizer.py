@@ -139,6 +139,11 @@ class AccessibilityOptimizer:
         self._docling_available = self._check_docling()
         self._docling_analysis = None
 
+    @property
+    def is_available(self) -> bool:
+        """Prüft ob das LLM beim Anlegen erreichbar war."""
+        return self._llm_available
+
     def _check_llm(self) -> bool:
         """Prüft ob LLM verfügbar."""
         try:
@@ -220,7 +225,7 @@ class AccessibilityOptimizer:
                     print("   ⚠️  Keine Folienbilder extrahiert")
                 return False
 
-            slides_with_images = sum(1 for s in model.slides if s.slide_image)
+            slides_with_images = sum(1 for s in model.slides if s.has_slide_image)
             if verbose:
                 print(f"   ✅ {slides_with_images} Folienbilder geladen")
 
@@ -331,6 +336,10 @@ class AccessibilityOptimizer:
     
     def _analyze_document(self, model: SlideModel):
         """Analysiert das Dokument und sammelt Metadaten."""
+        # Sammlungen gelten pro Dokument (Instanz kann wiederverwendet werden)
+        self._seen_hashes = {}
+        self._footnotes = {}
+
         # Fußnoten sammeln
         for slide in model.slides:
             self._extract_footnotes(slide)
@@ -389,7 +398,7 @@ class AccessibilityOptimizer:
         for slide in model.slides:
             for block in slide.blocks:
                 if self._is_decorative(block, slide):
-                    if not hasattr(block, 'a11y'):
+                    if block.a11y is None:
                         block.a11y = AccessibilityAnnotation(role=ElementRole.DECORATIVE)
                     else:
                         block.a11y.role = ElementRole.DECORATIVE
@@ -490,7 +499,7 @@ Antworte nur mit A oder B."""
                     if len(occurrences) >= self.config.redundancy_hash_threshold:
                         # Nur auf erster Folie vorlesen
                         if slide.number != min(occurrences):
-                            if not hasattr(block, 'a11y'):
+                            if block.a11y is None:
                                 block.a11y = AccessibilityAnnotation(
                                     role=ElementRole.REDUNDANT,
                                     skip_reason=f"Bereits auf Folie {min(occurrences)} vorgelesen"
@@ -614,7 +623,7 @@ Antworte nur mit A oder B."""
 
     def _mark_as_skip(self, block: Block, role: ElementRole, reason: str):
         """Markiert Block zum Überspringen."""
-        if not hasattr(block, 'a11y') or block.a11y is None:
+        if block.a11y is None:
             block.a11y = AccessibilityAnnotation(role=role, skip_reason=reason)
         else:
             block.a11y.role = role
@@ -634,7 +643,7 @@ Antworte nur mit A oder B."""
                 if narrative:
                     # Markiere alle bestehenden Blöcke als "ersetzt"
                     for block in slide.blocks:
-                        if not hasattr(block, 'a11y') or block.a11y is None:
+                        if block.a11y is None:
                             block.a11y = AccessibilityAnnotation(
                                 role=ElementRole.REDUNDANT,
                                 skip_reason="Ersetzt durch Folien-Narrative"
@@ -856,7 +865,7 @@ Maximal 200 Wörter, Fließtext.""",
         intro = type_intros.get(slide_type, "Hier ist ein komplexes Schaubild abgebildet")
 
         # Wenn Folienbild verfügbar: Vision-LLM mit Bild
-        if slide.slide_image:
+        if slide.has_slide_image:
             narrative = self._analyze_slide_with_vision(slide, type_instruction)
         else:
             # Fallback: Text-basierte Analyse
@@ -1043,7 +1052,7 @@ Deine Beschreibung:"""
                     paragraphs=[Paragraph(runs=[TextRun(text=context)])]
                 )
                 
-                if not hasattr(context_block, 'a11y'):
+                if context_block.a11y is None:
                     context_block.a11y = AccessibilityAnnotation(
                         role=ElementRole.CONTEXTUAL,
                         context_from_notes=notes
@@ -1117,7 +1126,7 @@ Antworte direkt mit dem Kontextsatz oder KEIN_KONTEXT."""
             # Filtere nicht zu lesende Elemente
             readable_blocks = [
                 b for b in slide.blocks 
-                if not (hasattr(b, 'a11y') and b.a11y.role in 
+                if not (b.a11y is not None and b.a11y.role in 
                        [ElementRole.DECORATIVE, ElementRole.REDUNDANT])
             ]
             
@@ -1138,7 +1147,7 @@ Antworte direkt mit dem Kontextsatz oder KEIN_KONTEXT."""
                     return (0, 0, 0)
                 
                 # Kontext aus Notes
-                if hasattr(block, 'a11y') and block.a11y.role == ElementRole.CONTEXTUAL:
+                if block.a11y is not None and block.a11y.role == ElementRole.CONTEXTUAL:
                     return (1, 0, 0)
                 
                 # Andere Überschriften
@@ -1184,7 +1193,7 @@ Antworte direkt mit dem Kontextsatz oder KEIN_KONTEXT."""
             for slide in model.slides:
                 readable_blocks = [
                     b for b in slide.blocks
-                    if not (hasattr(b, 'a11y') and b.a11y.role in
+                    if not (b.a11y is not None and b.a11y.role in
                            [ElementRole.DECORATIVE, ElementRole.REDUNDANT])
                 ]
                 for i, block in enumerate(readable_blocks):
@@ -1207,7 +1216,7 @@ Antworte direkt mit dem Kontextsatz oder KEIN_KONTEXT."""
                 natural_text = self._table_to_natural_language(table, slide)
                 
                 if natural_text:
-                    if not hasattr(block, 'a11y'):
+                    if block.a11y is None:
                         block.a11y = AccessibilityAnnotation(role=ElementRole.ESSENTIAL)
                     block.a11y.screen_reader_text = natural_text
 
@@ -1381,7 +1390,7 @@ Deine Beschreibung:"""
             # Zähle "lesbare" Blöcke
             readable = [
                 b for b in slide.blocks
-                if not (hasattr(b, 'a11y') and b.a11y.role in 
+                if not (b.a11y is not None and b.a11y.role in 
                        [ElementRole.DECORATIVE, ElementRole.REDUNDANT])
             ]
             
@@ -1400,7 +1409,7 @@ Deine Beschreibung:"""
                     ])]
                 )
                 
-                if not hasattr(summary_block, 'a11y'):
+                if summary_block.a11y is None:
                     summary_block.a11y = AccessibilityAnnotation(
                         role=ElementRole.CONTEXTUAL
                     )
@@ -1475,8 +1484,8 @@ Dein Satz:"""
             # Entferne markierte und leere Blöcke
             slide.blocks = [
                 b for b in slide.blocks
-                if not (hasattr(b, 'a11y') and b.a11y and b.a11y.role in skip_roles)
-                and (not b.is_empty or (hasattr(b, 'a11y') and b.a11y and b.a11y.screen_reader_text))
+                if not (b.a11y and b.a11y.role in skip_roles)
+                and (not b.is_empty or (b.a11y and b.a11y.screen_reader_text))
             ]
 
             # Sortiere nach Reading Order
@@ -1504,7 +1513,7 @@ Dein Satz:"""
         for slide in model.slides:
             stats["total_remaining"] += len(slide.blocks)
             for block in slide.blocks:
-                if hasattr(block, 'a11y') and block.a11y:
+                if block.a11y:
                     if block.a11y.screen_reader_text:
                         stats["enhanced"] += 1
 
@@ -0,0 +1,120 @@
+"""
+Persistenter Cache
+==================
+
+Gemeinsames Cache-Verzeichnis für teure Zwischenergebnisse
+(z.B. gerenderte Folienbilder).
+
+Ort: $XDG_CACHE_HOME/pptx2ua (Standard: ~/.cache/pptx2ua).
+Mit PPTX2UA_NO_CACHE=1 sind alle persistenten Caches abgeschaltet.
+
+Jeder Cache wird nach dem Schreiben mit prune_cache() begrenzt: Einträge,
+die länger als CACHE_MAX_AGE nicht benutzt wurden, fliegen raus, danach
+die am längsten unbenutzten, bis die Größe unter dem Limit liegt.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+# Grenzen pro Cache-Verzeichnis (z.B. "slides")
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_MAX_AGE = 7 * 24 * 3600  # Sekunden seit der letzten Benutzung
+
+# Halb geschriebene Einträge (mkstemp/mkdtemp) beginnen mit diesem Präfix
+_TMP_PREFIX = ".tmp-"
+
+
+def is_cache_disabled() -> bool:
+    """Prüft ob persistente Caches per PPTX2UA_NO_CACHE abgeschaltet sind."""
+    value = os.environ.get("PPTX2UA_NO_CACHE", "").strip().lower()
+    return value not in ("", "0", "false", "no")
+
+
+def get_cache_dir(name: str) -> Optional[Path]:
+    """
+    Gibt ein Unterverzeichnis des Caches zurück.
+
+    Args:
+        name: Name des Caches (z.B. "slides")
+
+    Returns:
+        Pfad (wird nicht angelegt) oder None wenn Caches abgeschaltet sind
+    """
+    if is_cache_disabled():
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pptx2ua" / name
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 des Dateiinhalts (blockweise gelesen)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def touch_entry(path: Path):
+    """Markiert einen Cache-Eintrag als benutzt (mtime = jetzt)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _entry_size(path: Path) -> int:
+    """Größe eines Eintrags (Datei oder Verzeichnis mit Dateien)."""
+    if not path.is_dir():
+        return path.stat().st_size
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+def prune_cache(
+    entries: Iterable[Path],
+    max_bytes: int = CACHE_MAX_BYTES,
+    max_age: float = CACHE_MAX_AGE,
+    now: Optional[float] = None
+) -> int:
+    """
+    Begrenzt einen Cache nach Alter und Gesamtgröße.
+
+    Args:
+        entries: Einträge des Caches (Dateien oder Verzeichnisse)
+        max_bytes: Maximale Gesamtgröße
+        max_age: Maximale Zeit seit der letzten Benutzung (Sekunden)
+
+    Returns:
+        Anzahl gelöschter Einträge
+    """
+    now = time.time() if now is None else now
+
+    stats = []
+    for path in entries:
+        try:
+            stats.append((path.stat().st_mtime, _entry_size(path), path))
+        except OSError:
+            pass  # parallel gelöscht
+
+    # Älteste zuerst
+    stats.sort(key=lambda item: item[0])
+    total = sum(size for _, size, _ in stats)
+
+    removed = 0
+    for mtime, size, path in stats:
+        expired = now - mtime > max_age
+        # Laufende Schreibvorgänge nur über das Alter aufräumen
+        if not expired and (total <= max_bytes or path.name.startswith(_TMP_PREFIX)):
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import json
+import logging
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -23,7 +24,7 @@ from .renderer import PDFUARenderer, RendererConfig
 from .validator import PDFUAValidator
 from .accessibility_optimizer import AccessibilityOptimizer, AccessibilityConfig
 from .models import SlideModel
-from .slide_renderer import populate_slide_images, is_libreoffice_available
+from .slide_renderer import populate_slide_images_in_background, is_libreoffice_available
 
 
 class Pipeline:
@@ -45,7 +46,8 @@ class Pipeline:
         enable_ai: bool = True,
         optimize_accessibility: bool = True,
         use_docling: bool = True,  # Docling bevorzugen wenn verfügbar
-        verbose: bool = True
+        verbose: bool = True,
+        debug_html: bool = False
     ):
         self.language = language
         self.enable_ai = enable_ai
@@ -77,7 +79,7 @@ class Pipeline:
             self.enricher = None
             self.optimizer = None
 
-        self.renderer = PDFUARenderer(RendererConfig())
+        self.renderer = PDFUARenderer(RendererConfig(debug_html=debug_html))
         self.validator = PDFUAValidator()
     
     def convert(
@@ -121,6 +123,12 @@ class Pipeline:
                 print(f"   ✓ {model.slide_count} Folien gefunden")
                 print(f"   ✓ {len(model.all_figures)} Abbildungen extrahiert")
             
+            # Folienbilder schon jetzt im Hintergrund rendern: soffice und
+            # die Alt-Text-Generierung warten beide auf externe Prozesse
+            slide_render = None
+            if is_libreoffice_available():
+                slide_render = populate_slide_images_in_background(model, input_pptx)
+            
             # 2. Enrich (AI Alt-Texts)
             if self.verbose:
                 print("\n🤖 Schritt 2/5: KI Alt-Text-Generierung...")
@@ -141,10 +149,10 @@ class Pipeline:
             if self.verbose:
                 print("\n🖼️  Schritt 2b: Folienbilder rendern...")
 
-            if is_libreoffice_available():
-                success = populate_slide_images(model, input_pptx)
+            if slide_render is not None:
+                success = slide_render.result()
                 if success and self.verbose:
-                    slides_with_images = sum(1 for s in model.slides if s.slide_image)
+                    slides_with_images = sum(1 for s in model.slides if s.has_slide_image)
                     print(f"   ✓ {slides_with_images} Folienbilder für Vision-Analyse")
             elif self.verbose:
                 print("   ⚠️  LibreOffice nicht installiert - Vision-Analyse nur text-basiert")
@@ -224,7 +232,8 @@ def cmd_convert(args):
         vision_model=args.model,
         enable_ai=not args.no_ai,
         use_docling=not args.no_docling,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        debug_html=args.debug_html
     )
     
     result = pipeline.convert(
@@ -316,6 +325,23 @@ def cmd_inspect(args):
     return 0
 
 
+def configure_logging(quiet: bool = False):
+    """
+    Richtet nur den Logger des Pakets ein.
+
+    Der Root-Logger bleibt unangetastet, damit Meldungen anderer
+    Bibliotheken (httpx, pikepdf, ...) nicht mit ausgegeben werden.
+    """
+    package_logger = logging.getLogger("pptx2ua")
+    package_logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+        # Nicht zusätzlich über Handler des Root-Loggers ausgeben
+        package_logger.propagate = False
+
+
 def main():
     """CLI Haupteinstiegspunkt."""
     parser = argparse.ArgumentParser(
@@ -348,6 +374,7 @@ Mehr Info: https://github.com/your-org/pptx2ua
     convert_parser.add_argument("--skip-validation", action="store_true", help="Validierung überspringen")
     convert_parser.add_argument("-q", "--quiet", action="store_true", help="Keine Ausgabe")
     convert_parser.add_argument("--json", action="store_true", help="JSON Output")
+    convert_parser.add_argument("--debug-html", action="store_true", help="HTML-Zwischenstand neben dem PDF speichern")
     
     # Validate
     validate_parser = subparsers.add_parser("validate", help="PDF/UA validieren")
@@ -363,9 +390,13 @@ Mehr Info: https://github.com/your-org/pptx2ua
     serve_parser = subparsers.add_parser("serve", help="Web-Server starten")
     serve_parser.add_argument("--port", type=int, default=3003, help="Port (default: 3003)")
     serve_parser.add_argument("--host", default="0.0.0.0", help="Host (default: 0.0.0.0)")
+    serve_parser.add_argument("--workers", type=int, default=1, help="Worker-Prozesse (default: 1)")
 
     args = parser.parse_args()
 
+    # Fortschritt der KI-Module (Enricher, Docling) läuft über logging
+    configure_logging(quiet=getattr(args, "quiet", False))
+
     if args.command == "convert":
         return cmd_convert(args)
     elif args.command == "validate":
@@ -383,11 +414,11 @@ def cmd_serve(args):
     """Serve-Befehl - startet Web-Server."""
     try:
         from .server import run_server
-        run_server(host=args.host, port=args.port)
+        run_server(host=args.host, port=args.port, workers=args.workers)
         return 0
     except ImportError as e:
         print(f"Fehler: Web-Server Dependencies nicht installiert: {e}")
-        print("Installiere mit: pip install fastapi uvicorn python-multipart")
+        print('Installiere mit: pip install "pptx2ua[web]"')
         return 1
 
 
@@ -45,10 +45,10 @@ def _check_docling() -> bool:
             import docling
             _docling_available = True
             _docling_version = getattr(docling, "__version__", "unknown")
-            logger.info(f"Docling {_docling_version} verfügbar")
+            logger.info("Docling %s verfügbar", _docling_version)
         except ImportError as e:
             _docling_available = False
-            logger.debug(f"Docling nicht verfügbar: {e}")
+            logger.debug("Docling nicht verfügbar: %s", e)
     return _docling_available
 
 
@@ -226,7 +226,7 @@ class DoclingAnalyzer:
         try:
             return self._vlm_describe_image(image_data, context)
         except Exception as e:
-            logger.debug(f"Docling Alt-Text fehlgeschlagen: {e}")
+            logger.debug("Docling Alt-Text fehlgeschlagen: %s", e)
             return None
 
     def _vlm_describe_image(
@@ -281,7 +281,7 @@ class DoclingAnalyzer:
                     md = result.document.export_to_markdown()
                     if md and len(md.strip()) > 10:
                         description = self._polish_description(md.strip())
-                        logger.debug(f"Alt-Text generiert: {description[:50]}...")
+                        logger.debug("Alt-Text generiert: %.50s...", description)
                         return description
 
             finally:
@@ -291,7 +291,7 @@ class DoclingAnalyzer:
             return None
 
         except Exception as e:
-            logger.warning(f"VLM Beschreibung fehlgeschlagen: {e}")
+            logger.warning("VLM Beschreibung fehlgeschlagen: %s", e)
             return None
 
     def _get_german_prompt(self, context: Optional[str] = None) -> str:
@@ -509,12 +509,18 @@ class DoclingEnricher:
         if verbose:
             print(f"   Generiere Alt-Texte für {len(figures_to_process)} Bilder mit Docling VLM...")
 
+        slides_by_number = model.slides_by_number
+        # Titel ändern sich während des Enrichments nicht -> einmal pro Folie
+        slide_titles: dict[int, Optional[str]] = {}
+
         for slide_num, figure in figures_to_process:
             self.stats["processed"] += 1
 
             # Kontext aus Folie holen
-            slide = next((s for s in model.slides if s.number == slide_num), None)
-            context = slide.title if slide else None
+            if slide_num not in slide_titles:
+                slide = slides_by_number.get(slide_num)
+                slide_titles[slide_num] = slide.title if slide else None
+            context = slide_titles[slide_num]
 
             # Alt-Text generieren
             alt_text = self.analyzer.generate_alt_text(
@@ -15,7 +15,12 @@ DSGVO-konform: Alles läuft lokal.
 
 import base64
 import hashlib
+import io
 import json
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -24,6 +29,15 @@ import requests
 
 from .models import SlideModel, Figure
 
+logger = logging.getLogger(__name__)
+
+# Optional: Pillow für wahrnehmungsbasierte Bild-Hashes
+try:
+    from PIL import Image
+    _pil_available = True
+except ImportError:
+    _pil_available = False
+
 
 class EnricherBackend(Enum):
     """Verfügbare Backends für Alt-Text-Generierung."""
@@ -56,10 +70,153 @@ class EnricherConfig:
     # Cache-Verzeichnis für Bild-Hashes
     cache_dir: Optional[Path] = None
 
+    # Cache-Treffer auch für neu kodierte/skalierte Kopien desselben Bildes
+    # (Perceptual Hash, benötigt Pillow)
+    perceptual_cache: bool = False
+
+    # Große Bilder vor dem Upload auf diese Kantenlänge verkleinern
+    # (px, 0 = aus, benötigt Pillow)
+    vision_max_edge: int = 1024
+
     # Timeouts
     vision_timeout: int = 120
     text_timeout: int = 30
 
+    # Wie lange Ollama die Modelle nach dem letzten Call im Speicher hält
+    keep_alive: str = "30m"
+
+    # Vision-Modell beim Start vorladen (vermeidet Kaltstart beim ersten Bild)
+    warmup: bool = True
+
+    # Gestreamte Antworten ab dieser Länge abbrechen (Zeichen)
+    max_response_chars: int = 1000
+
+    # Vorfilter: Bilder ohne jeden Inhalt (einfarbig oder vollständig
+    # transparent) gelten als dekorativ und gehen nicht ans Vision-LLM
+    skip_uniform_images: bool = True
+
+
+# JPEG Start-of-Frame Marker (ohne DHT/JPG/DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _image_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """
+    Liest Breite und Höhe aus dem Datei-Header (PNG, GIF, JPEG).
+
+    Dekodiert das Bild nicht. Gibt None zurück bei unbekanntem Format.
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+        return (
+            int.from_bytes(data[16:20], "big"),
+            int.from_bytes(data[20:24], "big"),
+        )
+
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return (
+            int.from_bytes(data[6:8], "little"),
+            int.from_bytes(data[8:10], "little"),
+        )
+
+    if data[:2] == b"\xff\xd8":
+        # Segmente bis zum ersten SOF-Marker überspringen
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker == 0xFF or marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                i += 1 if marker == 0xFF else 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                return (
+                    int.from_bytes(data[i + 7:i + 9], "big"),
+                    int.from_bytes(data[i + 5:i + 7], "big"),
+                )
+            i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+
+    return None
+
+
+def _uniform_image_reason(data: bytes) -> Optional[str]:
+    """
+    Prüft die dekodierten Pixel auf fehlenden Bildinhalt.
+
+    Gibt den Grund zurück ("einfarbig" / "vollständig transparent")
+    oder None, wenn das Bild Inhalt hat, nicht dekodierbar ist oder
+    Pillow fehlt. Kleine Bilder (Icons, Piktogramme) zählen bewusst
+    nicht als dekorativ.
+    """
+    if not _pil_available:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.mode not in ("L", "LA", "RGB", "RGBA"):
+                img = img.convert("RGBA")
+            extrema = img.getextrema()
+            bands = img.getbands()
+    except Exception:
+        return None
+
+    if len(bands) == 1:
+        extrema = (extrema,)
+
+    if "A" in bands and extrema[bands.index("A")][1] == 0:
+        return "vollständig transparent"
+
+    if all(low == high for low, high in extrema):
+        return "einfarbig"
+
+    return None
+
+
+def _ollama_generate(
+    url: str,
+    payload: dict,
+    timeout: int,
+    max_chars: int
+) -> Optional[str]:
+    """
+    Ruft /api/generate im Streaming-Modus auf.
+
+    Sammelt die Tokens bis Ollama "done" meldet oder max_chars
+    erreicht ist; danach wird die Verbindung geschlossen und die
+    Generierung damit abgebrochen.
+
+    Returns:
+        Generierter Text oder None bei HTTP-/Ollama-Fehler
+    """
+    parts: list[str] = []
+    length = 0
+
+    with requests.post(
+        f"{url}/api/generate",
+        json={**payload, "stream": True},
+        stream=True,
+        timeout=timeout
+    ) as response:
+        if response.status_code != 200:
+            return None
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+
+            chunk = json.loads(line)
+            if "error" in chunk:
+                return None
+
+            token = chunk.get("response", "")
+            parts.append(token)
+            length += len(token)
+
+            if chunk.get("done") or length >= max_chars:
+                break
+
+    return "".join(parts)
+
 
 class AltTextCache:
     """
@@ -108,8 +265,38 @@ class AltTextCache:
     
     @staticmethod
     def compute_hash(image_data: bytes) -> str:
-        """Berechnet Hash für Bild-Daten."""
-        return hashlib.md5(image_data).hexdigest()
+        """Berechnet Hash für Bild-Daten (identisch zum Parser)."""
+        return hashlib.blake2b(image_data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def compute_perceptual_hash(image_data: bytes) -> Optional[str]:
+        """
+        Berechnet einen Difference-Hash (dHash) über den Bildinhalt.
+
+        Gleiche Logos als PNG/JPEG oder in anderer Auflösung ergeben
+        denselben Hash. Gibt None zurück wenn Pillow fehlt, das Bild
+        nicht dekodierbar ist oder keine Struktur hat (einfarbig).
+        """
+        if not _pil_available:
+            return None
+
+        try:
+            with Image.open(io.BytesIO(image_data)) as img:
+                # JPEG: direkt in reduzierter Auflösung dekodieren
+                img.draft("L", (64, 64))
+                pixels = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+        except Exception:
+            return None
+
+        bits = 0
+        for row in range(0, 72, 9):
+            for col in range(row, row + 8):
+                bits = (bits << 1) | (pixels[col] > pixels[col + 1])
+
+        if not bits:
+            return None
+
+        return f"p:{bits:016x}"
 
 
 class VisionLLM:
@@ -147,9 +334,13 @@ Rules:
 
 Reply ONLY with the description, no introduction."""
 
+    # Anzahl Base64-kodierter Bilder die pro Instanz vorgehalten werden
+    B64_CACHE_SIZE = 32
+
     def __init__(self, config: EnricherConfig):
         self.config = config
         self.available = self._check_availability()
+        self._b64_cache: OrderedDict[str, str] = OrderedDict()
     
     def _check_availability(self) -> bool:
         """Prüft ob Ollama erreichbar ist und Modell geladen."""
@@ -174,12 +365,17 @@ Reply ONLY with the description, no introduction."""
         except Exception:
             return False
     
-    def generate_description(self, image_data: bytes) -> Optional[str]:
+    def generate_description(
+        self,
+        image_data: bytes,
+        image_hash: Optional[str] = None
+    ) -> Optional[str]:
         """
         Generiert Bildbeschreibung via Vision-LLM.
         
         Args:
             image_data: Rohe Bild-Bytes
+            image_hash: Hash der Bild-Bytes (aktiviert Base64-Cache)
             
         Returns:
             Beschreibung oder None bei Fehler
@@ -187,8 +383,7 @@ Reply ONLY with the description, no introduction."""
         if not self.available:
             return None
         
-        # Bild zu Base64
-        image_b64 = base64.b64encode(image_data).decode('utf-8')
+        image_b64 = self._encode_image(image_data, image_hash)
         
         # Prompt basierend auf Sprache
         prompt = (
@@ -201,7 +396,7 @@ Reply ONLY with the description, no introduction."""
             "model": self.config.vision_model,
             "prompt": prompt,
             "images": [image_b64],
-            "stream": False,
+            "keep_alive": self.config.keep_alive,
             "options": {
                 "temperature": 0.3,  # Niedrig für Konsistenz
                 "num_predict": 200,  # Kurze Antworten
@@ -209,23 +404,103 @@ Reply ONLY with the description, no introduction."""
         }
         
         try:
-            response = requests.post(
-                f"{self.config.ollama_url}/api/generate",
-                json=payload,
-                timeout=self.config.vision_timeout
+            description = _ollama_generate(
+                self.config.ollama_url,
+                payload,
+                timeout=self.config.vision_timeout,
+                max_chars=self.config.max_response_chars
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
+            if description is not None:
+                return description.strip()
                 
         except requests.Timeout:
-            print(f"⚠️  Vision-LLM Timeout ({self.config.vision_timeout}s)")
+            logger.warning("⚠️  Vision-LLM Timeout (%ss)", self.config.vision_timeout)
         except Exception as e:
-            print(f"⚠️  Vision-LLM Fehler: {e}")
+            logger.warning("⚠️  Vision-LLM Fehler: %s", e)
         
         return None
 
+    def warm_up(self):
+        """
+        Lädt das Vision-Modell in Ollama vor.
+
+        Ein Request ohne Prompt lädt nur das Modell; keep_alive hält es
+        für die Dauer der Konvertierung im Speicher.
+        """
+        if not self.available:
+            return
+
+        try:
+            requests.post(
+                f"{self.config.ollama_url}/api/generate",
+                json={
+                    "model": self.config.vision_model,
+                    "stream": False,
+                    "keep_alive": self.config.keep_alive,
+                },
+                timeout=self.config.vision_timeout
+            )
+        except Exception as e:
+            logger.warning("⚠️  Vision-LLM Warm-up fehlgeschlagen: %s", e)
+
+    def _encode_image(self, image_data: bytes, image_hash: Optional[str]) -> str:
+        """Bild verkleinern und Base64-kodieren, mit LRU-Cache pro Hash."""
+        if image_hash:
+            cached = self._b64_cache.get(image_hash)
+            if cached is not None:
+                self._b64_cache.move_to_end(image_hash)
+                return cached
+
+        image_b64 = base64.b64encode(self._prepare_for_vision(image_data)).decode('ascii')
+
+        if image_hash:
+            self._b64_cache[image_hash] = image_b64
+            if len(self._b64_cache) > self.B64_CACHE_SIZE:
+                self._b64_cache.popitem(last=False)
+
+        return image_b64
+
+    def _prepare_for_vision(self, image_data: bytes) -> bytes:
+        """
+        Verkleinert große Bilder und kodiert sie als JPEG neu.
+
+        Das Vision-Modell skaliert intern ohnehin herunter; so sinken
+        Upload-Größe und Rechenzeit. Ohne Pillow oder bei kleinen
+        Bildern werden die Originaldaten zurückgegeben.
+        """
+        max_edge = self.config.vision_max_edge
+        if not max_edge or not _pil_available:
+            return image_data
+
+        dimensions = _image_dimensions(image_data)
+        if dimensions and max(dimensions) <= max_edge:
+            return image_data
+
+        try:
+            with Image.open(io.BytesIO(image_data)) as img:
+                if max(img.size) <= max_edge:
+                    return image_data
+
+                img.draft("RGB", (max_edge, max_edge))
+                img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+                # Transparenz auf weißen Hintergrund legen (JPEG kennt kein Alpha)
+                if img.mode in ("RGBA", "LA", "P"):
+                    rgba = img.convert("RGBA")
+                    img = Image.new("RGB", rgba.size, (255, 255, 255))
+                    img.paste(rgba, mask=rgba.getchannel("A"))
+                elif img.mode != "RGB":
+                    img = img.convert("RGB")
+
+                buffer = io.BytesIO()
+                img.save(buffer, "JPEG", quality=85, optimize=True)
+        except Exception:
+            return image_data
+
+        resized = buffer.getvalue()
+        return resized if len(resized) < len(image_data) else image_data
+
 
 class TextLLM:
     """
@@ -268,6 +543,30 @@ Rules:
 
 Reply ONLY with the optimized alt text."""
 
+    # Typische KI-Präfixe, einmalig kleingeschrieben für den Präfix-Vergleich
+    _PREFIXES_LOWER: tuple[str, ...] = tuple(
+        prefix.lower() for prefix in (
+            # Deutsch
+            "Das Bild zeigt ",
+            "Auf dem Bild ist ",
+            "Zu sehen ist ",
+            "Dieses Bild zeigt ",
+            "Die Abbildung zeigt ",
+            "Es ist ",
+            "Es zeigt ",
+            # Englisch
+            "The image shows ",
+            "This image shows ",
+            "The picture shows ",
+            "We can see ",
+            "This is ",
+            "It shows ",
+        )
+    )
+
+    # Optimale Alt-Text-Länge (Zeichen) laut Polish-Prompt
+    MAX_CLEAN_LENGTH = 125
+
     def __init__(self, config: EnricherConfig):
         self.config = config
         self.available = self._check_availability()
@@ -299,6 +598,10 @@ Reply ONLY with the optimized alt text."""
         if not draft:
             return ""
         
+        # Bereits konform: zweiten LLM-Roundtrip sparen
+        if self._is_already_clean(draft):
+            return self._rule_based_polish(draft)
+        
         # Versuche LLM-Polishing
         if self.available:
             polished = self._llm_polish(draft)
@@ -308,6 +611,15 @@ Reply ONLY with the optimized alt text."""
         # Fallback: Regelbasiert
         return self._rule_based_polish(draft)
     
+    def _is_already_clean(self, draft: str) -> bool:
+        """Prüft ob der Draft die Alt-Text-Regeln schon erfüllt."""
+        text = draft.strip()
+        return (
+            len(text) <= self.MAX_CLEAN_LENGTH
+            and text.endswith(('.', '!', '?'))
+            and not text.lower().startswith(self._PREFIXES_LOWER)
+        )
+    
     def _llm_polish(self, draft: str) -> Optional[str]:
         """LLM-basiertes Polishing."""
         prompt_template = (
@@ -319,7 +631,7 @@ Reply ONLY with the optimized alt text."""
         payload = {
             "model": self.config.text_model,
             "prompt": prompt_template.format(draft=draft),
-            "stream": False,
+            "keep_alive": self.config.keep_alive,
             "options": {
                 "temperature": 0.2,
                 "num_predict": 150,
@@ -327,22 +639,22 @@ Reply ONLY with the optimized alt text."""
         }
         
         try:
-            response = requests.post(
-                f"{self.config.ollama_url}/api/generate",
-                json=payload,
-                timeout=self.config.text_timeout
+            polished = _ollama_generate(
+                self.config.ollama_url,
+                payload,
+                timeout=self.config.text_timeout,
+                max_chars=self.config.max_response_chars
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                polished = result.get("response", "").strip()
+            if polished is not None:
+                polished = polished.strip()
                 
                 # Sanity Check
                 if polished and len(polished) > 5:
                     return polished
                     
         except Exception as e:
-            print(f"⚠️  Text-LLM Fehler: {e}")
+            logger.warning("⚠️  Text-LLM Fehler: %s", e)
         
         return None
     
@@ -350,31 +662,13 @@ Reply ONLY with the optimized alt text."""
         """Regelbasierte Bereinigung ohne LLM."""
         text = draft.strip()
         
-        # Entferne typische Präfixe
-        prefixes_de = [
-            "Das Bild zeigt ",
-            "Auf dem Bild ist ",
-            "Zu sehen ist ",
-            "Dieses Bild zeigt ",
-            "Die Abbildung zeigt ",
-            "Es ist ",
-            "Es zeigt ",
-        ]
-        prefixes_en = [
-            "The image shows ",
-            "This image shows ",
-            "The picture shows ",
-            "We can see ",
-            "This is ",
-            "It shows ",
-        ]
-        
-        prefixes = prefixes_de + prefixes_en
-        
-        for prefix in prefixes:
-            if text.lower().startswith(prefix.lower()):
-                text = text[len(prefix):]
-                break
+        # Entferne typische Präfixe (Text nur einmal kleinschreiben)
+        lowered = text.lower()
+        if lowered.startswith(self._PREFIXES_LOWER):
+            for prefix in self._PREFIXES_LOWER:
+                if lowered.startswith(prefix):
+                    text = text[len(prefix):]
+                    break
         
         # Erster Buchstabe groß
         if text:
@@ -412,13 +706,16 @@ class Enricher:
         self.text = None
 
         self._init_backend()
+        self.reset_stats()
 
-        # Stats
+    def reset_stats(self):
+        """Setzt die Statistik zurück (z.B. pro Dokument bei geteilter Instanz)."""
         self.stats = {
             "processed": 0,
             "from_cache": 0,
             "generated": 0,
             "failed": 0,
+            "skipped": 0,
             "backend": self._active_backend,
         }
 
@@ -434,7 +731,7 @@ class Enricher:
 
         elif backend == EnricherBackend.DOCLING:
             if not self._try_init_docling():
-                print("⚠️  Docling nicht verfügbar, falle zurück auf Ollama")
+                logger.warning("⚠️  Docling nicht verfügbar, falle zurück auf Ollama")
                 self._try_init_ollama()
 
         elif backend == EnricherBackend.OLLAMA:
@@ -470,6 +767,8 @@ class Enricher:
 
         if self.vision.available:
             self._active_backend = "ollama"
+            if self.config.warmup:
+                self.vision.warm_up()
             return True
 
         return False
@@ -512,43 +811,123 @@ class Enricher:
 
         if not figures_to_process:
             if verbose:
-                print("   Alle Bilder haben bereits Alt-Texte")
+                logger.info("   Alle Bilder haben bereits Alt-Texte")
             return model
 
-        backend_info = f" (Backend: {self._active_backend or 'keins'})"
         if verbose:
-            print(f"🤖 Generiere Alt-Texte für {len(figures_to_process)} Bilder...{backend_info}")
+            logger.info(
+                "🤖 Generiere Alt-Texte für %d Bilder... (Backend: %s)",
+                len(figures_to_process), self._active_backend or "keins",
+            )
 
-        for slide_num, figure in figures_to_process:
-            self.stats["processed"] += 1
+        # Identische Bilder (Logos, wiederkehrende Grafiken) nur einmal
+        # an das LLM schicken und das Ergebnis auf alle Vorkommen verteilen
+        cache_keys = self._compute_cache_keys([figure for _, figure in figures_to_process])
+
+        groups: dict[str, list[tuple[int, Figure]]] = {}
+        for (slide_num, figure), key in zip(figures_to_process, cache_keys):
+            key = key or f"id:{id(figure)}"
+            groups.setdefault(key, []).append((slide_num, figure))
+
+        slides_by_number = model.slides_by_number
+        # Titel ändern sich während des Enrichments nicht -> einmal pro Folie
+        slide_titles: dict[int, Optional[str]] = {}
+
+        for key, occurrences in groups.items():
+            first_slide_num, first_figure = occurrences[0]
+            self.stats["processed"] += len(occurrences)
+
+            # Leere Flächen (Spacer, Hintergründe) gar nicht erst ans
+            # Vision-LLM geben; jede Entscheidung wird protokolliert
+            reason = self._decorative_reason(first_figure)
+            if reason:
+                for slide_num, figure in occurrences:
+                    figure.alt_text = ""
+                    figure.needs_alt_text = False
+                    logger.info(
+                        "   Folie %s: Bild als dekorativ übersprungen (%s)",
+                        slide_num, reason,
+                    )
+                self.stats["skipped"] += len(occurrences)
+                continue
 
             # Kontext für bessere Beschreibungen
-            slide = next((s for s in model.slides if s.number == slide_num), None)
-            context = slide.title if slide else None
-
-            alt_text = self._generate_alt_text(figure, context=context)
-
-            if alt_text:
-                figure.alt_text = alt_text
-                figure.needs_alt_text = False
-
-                if verbose:
-                    preview = alt_text[:60] + "..." if len(alt_text) > 60 else alt_text
-                    print(f"   Folie {slide_num}: \"{preview}\"")
-            else:
-                self.stats["failed"] += 1
-                if verbose:
-                    print(f"   Folie {slide_num}: Fehlgeschlagen")
+            if first_slide_num not in slide_titles:
+                slide = slides_by_number.get(first_slide_num)
+                slide_titles[first_slide_num] = slide.title if slide else None
+            context = slide_titles[first_slide_num]
+
+            alt_text = self._generate_alt_text(first_figure, context=context, cache_key=key)
+
+            for slide_num, figure in occurrences:
+                if alt_text:
+                    figure.alt_text = alt_text
+                    figure.needs_alt_text = False
+                    figure.alt_text_confidence = first_figure.alt_text_confidence
+
+                    if verbose:
+                        preview = alt_text[:60] + "..." if len(alt_text) > 60 else alt_text
+                        logger.info("   Folie %s: \"%s\"", slide_num, preview)
+                else:
+                    self.stats["failed"] += 1
+                    if verbose:
+                        logger.info("   Folie %s: Fehlgeschlagen", slide_num)
+
+            if alt_text and len(occurrences) > 1:
+                self.stats["from_cache"] += len(occurrences) - 1
 
         if verbose:
             self._print_stats()
 
         return model
     
+    def _decorative_reason(self, figure: Figure) -> Optional[str]:
+        """Grund, warum ein Bild sicher dekorativ ist, sonst None."""
+        if not figure.image_data or not self.config.skip_uniform_images:
+            return None
+
+        return _uniform_image_reason(figure.image_data)
+
+    def _compute_cache_keys(self, figures: list[Figure]) -> list[Optional[str]]:
+        """
+        Berechnet die Cache-Schlüssel aller Figures parallel.
+
+        hashlib (und Pillow beim Perceptual Hash) geben bei großen
+        Puffern den GIL frei, daher skalieren Threads hier.
+        """
+        with_data = sum(1 for figure in figures if figure.image_data)
+        if with_data < 2:
+            return [self._cache_key(figure) for figure in figures]
+
+        workers = min(with_data, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._cache_key, figures))
+
+    def _cache_key(self, figure: Figure) -> Optional[str]:
+        """
+        Cache-Schlüssel für eine Figure.
+
+        Setzt figure.image_hash falls noch nicht vorhanden. Mit
+        perceptual_cache wird bevorzugt der Perceptual Hash verwendet.
+        """
+        if not figure.image_data:
+            return figure.image_hash
+
+        if not figure.image_hash:
+            figure.image_hash = AltTextCache.compute_hash(figure.image_data)
+
+        if self.config.perceptual_cache:
+            perceptual = AltTextCache.compute_perceptual_hash(figure.image_data)
+            if perceptual:
+                return perceptual
+
+        return figure.image_hash
+
     def _generate_alt_text(
         self,
         figure: Figure,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        cache_key: Optional[str] = None
     ) -> Optional[str]:
         """Generiert Alt-Text für eine Figure mit Ollama."""
         if not figure.image_data:
@@ -558,20 +937,16 @@ class Enricher:
             return None
 
         # 1. Cache prüfen
-        if figure.image_hash:
-            cached = self.cache.get(figure.image_hash)
-            if cached:
-                self.stats["from_cache"] += 1
-                return cached
-        else:
-            figure.image_hash = AltTextCache.compute_hash(figure.image_data)
-            cached = self.cache.get(figure.image_hash)
-            if cached:
-                self.stats["from_cache"] += 1
-                return cached
+        if not cache_key:
+            cache_key = self._cache_key(figure)
+
+        cached = self.cache.get(cache_key)
+        if cached:
+            self.stats["from_cache"] += 1
+            return cached
 
         # 2. Vision-LLM: Draft generieren
-        draft = self.vision.generate_description(figure.image_data)
+        draft = self.vision.generate_description(figure.image_data, figure.image_hash)
 
         if not draft:
             return None
@@ -582,7 +957,7 @@ class Enricher:
         if polished:
             self.stats["generated"] += 1
             # Im Cache speichern
-            self.cache.set(figure.image_hash, polished)
+            self.cache.set(cache_key, polished)
             figure.alt_text_confidence = 0.8  # Gute Confidence bei 2-Stufen-Prozess
             return polished
         
@@ -590,11 +965,12 @@ class Enricher:
     
     def _print_stats(self):
         """Gibt Statistiken aus."""
-        print(f"\n   📊 Alt-Text Statistik:")
-        print(f"      Verarbeitet: {self.stats['processed']}")
-        print(f"      Aus Cache: {self.stats['from_cache']}")
-        print(f"      Neu generiert: {self.stats['generated']}")
-        print(f"      Fehlgeschlagen: {self.stats['failed']}")
+        logger.info("   📊 Alt-Text Statistik:")
+        logger.info("      Verarbeitet: %d", self.stats["processed"])
+        logger.info("      Aus Cache: %d", self.stats["from_cache"])
+        logger.info("      Neu generiert: %d", self.stats["generated"])
+        logger.info("      Fehlgeschlagen: %d", self.stats["failed"])
+        logger.info("      Dekorativ übersprungen: %d", self.stats["skipped"])
 
 
 # === Convenience Functions ===
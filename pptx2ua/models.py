@@ -10,9 +10,12 @@ bevor sie zu HTML/PDF gerendert werden.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from .accessibility_optimizer import AccessibilityAnnotation
+
 
 class BlockType(Enum):
     """Semantische Block-Typen nach PDF/UA."""
@@ -33,7 +36,7 @@ class ListStyle(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Position und Größe eines Elements."""
     x: float  # in mm
@@ -47,7 +50,7 @@ class BoundingBox:
         self.height = abs(self.height)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextRun:
     """Ein Textabschnitt mit einheitlicher Formatierung."""
     text: str
@@ -60,7 +63,7 @@ class TextRun:
     hyperlink: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """Ein Absatz bestehend aus TextRuns."""
     runs: list[TextRun] = field(default_factory=list)
@@ -77,7 +80,7 @@ class Paragraph:
         return not self.text.strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """Eine Tabellenzelle."""
     paragraphs: list[Paragraph] = field(default_factory=list)
@@ -90,7 +93,7 @@ class TableCell:
         return "\n".join(p.text for p in self.paragraphs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Eine Tabelle mit Zeilen und Zellen."""
     rows: list[list[TableCell]] = field(default_factory=list)
@@ -113,7 +116,7 @@ class Table:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Figure:
     """Eine Abbildung (Bild, Chart, Diagramm)."""
     image_path: Optional[Path] = None
@@ -129,7 +132,7 @@ class Figure:
     image_hash: Optional[str] = None  # Für Caching
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """
     Ein semantischer Block auf einer Folie.
@@ -156,6 +159,9 @@ class Block:
     source_shape_id: Optional[str] = None
     confidence: float = 1.0  # Wie sicher ist die Typ-Erkennung?
     
+    # Barrierefreiheits-Annotation (gesetzt vom AccessibilityOptimizer)
+    a11y: Optional["AccessibilityAnnotation"] = None
+    
     @property
     def text(self) -> str:
         """Gesamter Text des Blocks."""
@@ -178,7 +184,7 @@ class Block:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Slide:
     """Eine einzelne Folie."""
     number: int
@@ -190,17 +196,50 @@ class Slide:
     height_mm: float = 142.9
     background_color: str = "FFFFFF"
 
-    # Folienbild für Vision-Analyse
-    slide_image: Optional[bytes] = None  # PNG-Daten der gerenderten Folie
-    slide_image_path: Optional[Path] = None  # Oder Pfad zum Bild
+    # Folienbild für Vision-Analyse: Bytes oder Pfad zum Bild. Ein Pfad wird
+    # erst beim Zugriff gelesen, damit nicht alle PNGs zugleich im RAM liegen.
+    _slide_image: Optional[bytes] = field(default=None, repr=False)
+    slide_image_path: Optional[Path] = None
+    
+    @property
+    def slide_image(self) -> Optional[bytes]:
+        """PNG-Daten der gerenderten Folie (bei Pfad: bei jedem Zugriff gelesen)."""
+        if self._slide_image is not None:
+            return self._slide_image
+        if self.slide_image_path is not None:
+            return self.slide_image_path.read_bytes()
+        return None
+    
+    @slide_image.setter
+    def slide_image(self, data: Optional[bytes]):
+        self._slide_image = data
+    
+    @property
+    def has_slide_image(self) -> bool:
+        """Prüft ob ein Folienbild vorhanden ist (ohne es zu laden)."""
+        return bool(self._slide_image) or self.slide_image_path is not None
+    
+    def iter_image_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Liefert das Folienbild blockweise (z.B. zum Streamen auf Platte/HTTP)."""
+        if self._slide_image is not None:
+            for start in range(0, len(self._slide_image), chunk_size):
+                yield self._slide_image[start:start + chunk_size]
+        elif self.slide_image_path is not None:
+            with open(self.slide_image_path, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
     
     @property
     def title(self) -> Optional[str]:
         """Findet den Titel der Folie (erstes Heading)."""
-        for block in self.sorted_blocks:
-            if block.block_type == BlockType.HEADING:
-                return block.text
-        return None
+        # min() statt sorted_blocks: kein Sortieren aller Blöcke nötig,
+        # bei gleicher reading_order gewinnt wie beim stabilen Sort der erste
+        first_heading = min(
+            (b for b in self.blocks if b.block_type == BlockType.HEADING),
+            key=lambda b: b.reading_order,
+            default=None,
+        )
+        return first_heading.text if first_heading else None
     
     @property
     def sorted_blocks(self) -> list[Block]:
@@ -219,12 +258,13 @@ class Slide:
     def figures_without_alt(self) -> list[Figure]:
         """Abbildungen die noch Alt-Text brauchen."""
         return [
-            fig for fig in self.figures
-            if fig.needs_alt_text and not fig.alt_text
+            block.figure for block in self.blocks
+            if block.figure is not None
+            and block.figure.needs_alt_text and not block.figure.alt_text
         ]
 
 
-@dataclass 
+@dataclass(slots=True)
 class SlideModel:
     """
     Komplettes Präsentationsmodell.
@@ -251,22 +291,29 @@ class SlideModel:
     def slide_count(self) -> int:
         return len(self.slides)
     
+    @property
+    def slides_by_number(self) -> dict[int, Slide]:
+        """Folien nach Foliennummer (für O(1)-Lookups in Schleifen)."""
+        return {slide.number: slide for slide in self.slides}
+    
     @property
     def all_figures(self) -> list[Figure]:
         """Alle Abbildungen im Dokument."""
-        figures = []
-        for slide in self.slides:
-            figures.extend(slide.figures)
-        return figures
+        return [
+            block.figure
+            for slide in self.slides
+            for block in slide.blocks
+            if block.figure is not None
+        ]
     
     @property
     def figures_needing_alt_text(self) -> list[tuple[int, Figure]]:
         """Abbildungen ohne Alt-Text mit Foliennummer."""
-        result = []
-        for slide in self.slides:
-            for fig in slide.figures_without_alt:
-                result.append((slide.number, fig))
-        return result
+        return [
+            (slide.number, fig)
+            for slide in self.slides
+            for fig in slide.figures_without_alt
+        ]
     
     def to_dict(self) -> dict:
         """Serialisiert zu Dictionary (für JSON-Export)."""
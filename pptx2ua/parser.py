@@ -11,12 +11,14 @@ Kernaufgaben:
 """
 
 import hashlib
+import heapq
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from zipfile import ZipFile
-from xml.etree import ElementTree as ET
+from typing import Iterator, NamedTuple, Optional
 
+from lxml import etree
 from pptx import Presentation
 from pptx.util import Emu, Pt
 from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
@@ -31,6 +33,98 @@ from .models import (
     Figure, BoundingBox, ListStyle
 )
 
+# Optional: numpy für die Sortierung sehr voller Folien
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:
+    _numpy_available = False
+
+
+# OOXML-Namespaces und vorberechnete Tags in Clark-Notation
+# (python-pptx Elemente sind lxml-Elemente)
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_BU_NONE_TAG = f"{{{_A_NS}}}buNone"
+_BU_CHAR_TAG = f"{{{_A_NS}}}buChar"
+_BU_AUTONUM_TAG = f"{{{_A_NS}}}buAutoNum"
+_CNVPR_PATH = f"{{{_P_NS}}}nvPicPr/{{{_P_NS}}}cNvPr"  # Fester Pfad unter p:pic
+
+# Enthält der Textkörper irgendein nicht-leeres a:t? (ein Aufruf in libxml2)
+_HAS_TEXT_XPATH = etree.XPath("boolean(.//a:t[normalize-space()])", namespaces={"a": _A_NS})
+
+# Direkter Zugriff auf Absätze (a:p), Runs (a:r) und Run-Properties (a:rPr)
+# statt python-pptx Paragraph-/Font-Proxies
+_P_TAG = f"{{{_A_NS}}}p"
+_PPR_TAG = f"{{{_A_NS}}}pPr"
+_R_TAG = f"{{{_A_NS}}}r"
+_T_TAG = f"{{{_A_NS}}}t"
+_RPR_TAG = f"{{{_A_NS}}}rPr"
+_LATIN_TAG = f"{{{_A_NS}}}latin"
+_HLINK_CLICK_TAG = f"{{{_A_NS}}}hlinkClick"
+_R_ID_ATTR = f"{{{_R_NS}}}id"
+_XSD_TRUE = frozenset(("1", "true"))
+
+# docProps/core.xml (Dublin Core) -> SlideModel-Feld
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_CORE_FIELDS = {
+    f"{{{_DC_NS}}}title": "title",
+    f"{{{_DC_NS}}}creator": "author",
+    f"{{{_DC_NS}}}subject": "subject",
+}
+
+# Umrechnungsfaktoren (914400 EMU = 1 Zoll)
+_EMU_TO_MM = 25.4 / 914400
+_EMU_TO_PT = 72 / 914400
+
+# PP_PARAGRAPH_ALIGNMENT (LEFT=1 … JUSTIFY=4) als Index
+_ALIGNMENTS = ("left", "left", "center", "right", "justify")
+
+# a:pPr/@algn (ST_TextAlignType) -> Alignment, Rest wird "left"
+_XML_ALIGNMENTS = {"l": "left", "ctr": "center", "r": "right", "just": "justify"}
+
+
+@lru_cache(maxsize=64)
+def _classify_features(
+    title_placeholder: bool,
+    subtitle_placeholder: bool,
+    has_bullets: bool,
+    size_level: int
+) -> tuple[BlockType, int, ListStyle]:
+    """
+    Entscheidungsbaum von PPTXParser._classify_text_block.
+    
+    Hängt nur von wenigen diskreten Merkmalen ab (pro Deck meist
+    unter zehn Kombinationen), daher memoisiert.
+    size_level: 0 = keine Heading-Größe, sonst Heading-Level 1-4.
+    """
+    # 1. Placeholder-Typ prüfen (höchste Priorität)
+    if title_placeholder:
+        return BlockType.HEADING, 1, ListStyle.NONE
+    
+    if subtitle_placeholder:
+        return BlockType.HEADING, 2, ListStyle.NONE
+    
+    # 2. Listen erkennen
+    if has_bullets:
+        return BlockType.LIST, 0, ListStyle.BULLET
+    
+    # 3. Heading durch Formatierung erkennen
+    if size_level:
+        return BlockType.HEADING, size_level, ListStyle.NONE
+    
+    # 4. Default: Paragraph
+    return BlockType.PARAGRAPH, 0, ListStyle.NONE
+
+
+class _ParsedParagraph(NamedTuple):
+    """Ergebnis von PPTXParser._parse_paragraph (ein Durchlauf über die Runs)."""
+    paragraph: Paragraph
+    max_font_size: float
+    has_bullet: bool
+
 
 class PPTXParser:
     """
@@ -43,19 +137,42 @@ class PPTXParser:
     
     # Schwellwerte für Heuristiken
     HEADING_MIN_FONT_SIZE = 18  # pt
-    TITLE_PLACEHOLDER_TYPES = {
+    READING_ORDER_Y_TOLERANCE = 20  # mm
+    NUMPY_SORT_MIN_SHAPES = 64  # Ab hier lohnt np.lexsort
+    TOPOLOGICAL_SORT_MAX_SHAPES = 200  # Darüber nur Y-Bucket-Heuristik (O(n²))
+    TITLE_PLACEHOLDER_TYPES = frozenset({
         PP_PLACEHOLDER.TITLE,
         PP_PLACEHOLDER.CENTER_TITLE,
         PP_PLACEHOLDER.SUBTITLE,
-    }
+    })
     
-    def __init__(self, extract_images: bool = True):
+    # Unter dieser Folienanzahl lohnt der Prozess-Start nicht
+    PARALLEL_MIN_SLIDES = 8
+    
+    def __init__(
+        self,
+        extract_images: bool = True,
+        workers: int = 1,
+        slow_path: bool = False
+    ):
         """
         Args:
             extract_images: Ob Bilder extrahiert werden sollen
+            workers: Anzahl Prozesse für das Folien-Parsing (1 = sequentiell)
+            slow_path: Text über python-pptx-Objekte statt direkt
+                über das XML lesen (Fallback/Vergleich)
         """
         self.extract_images = extract_images
-        self._image_cache: dict[str, bytes] = {}
+        self.workers = workers
+        self.slow_path = slow_path
+        # Shape-Typ -> Parser (ein shape_type-Zugriff pro Shape)
+        self._shape_handlers = {
+            MSO_SHAPE_TYPE.PICTURE: self._parse_picture,
+            MSO_SHAPE_TYPE.TABLE: self._parse_table,
+            MSO_SHAPE_TYPE.CHART: self._parse_chart,
+        }
+        # Bild-Part ("ppt/media/image1.png") -> Hash, pro Datei gefüllt
+        self._media_hashes: dict[str, str] = {}
     
     def parse(self, pptx_path: Path | str) -> SlideModel:
         """
@@ -69,9 +186,7 @@ class PPTXParser:
         """
         pptx_path = Path(pptx_path)
         
-        # Bilder vorab extrahieren (für Hashing)
-        if self.extract_images:
-            self._extract_media(pptx_path)
+        self._media_hashes.clear()
         
         # PPTX laden
         prs = Presentation(str(pptx_path))
@@ -84,28 +199,55 @@ class PPTXParser:
         
         # Dokument-Metadaten
         if prs.core_properties:
-            model.title = prs.core_properties.title
-            model.author = prs.core_properties.author
-            model.subject = prs.core_properties.subject
+            self._read_core_properties(prs.core_properties, model)
         
         # Folien parsen
-        for slide_num, pptx_slide in enumerate(prs.slides, 1):
-            slide = self._parse_slide(pptx_slide, slide_num)
-            model.slides.append(slide)
+        slide_count = len(prs.slides)
+        if self.workers > 1 and slide_count >= self.PARALLEL_MIN_SLIDES:
+            model.slides = self._parse_slides_parallel(pptx_path, slide_count)
+        else:
+            for slide_num, pptx_slide in enumerate(prs.slides, 1):
+                slide = self._parse_slide(pptx_slide, slide_num)
+                model.slides.append(slide)
         
         return model
     
-    def _extract_media(self, pptx_path: Path):
-        """Extrahiert alle Medien und berechnet Hashes."""
-        self._image_cache.clear()
+    @staticmethod
+    def _read_core_properties(core_properties, model: SlideModel):
+        """Liest Titel, Autor und Thema in einem Durchlauf über core.xml."""
+        values = dict.fromkeys(_CORE_FIELDS.values(), "")
+        for child in core_properties._element:
+            field_name = _CORE_FIELDS.get(child.tag)
+            if field_name:
+                values[field_name] = child.text or ""
+        
+        model.title = values["title"]
+        model.author = values["author"]
+        model.subject = values["subject"]
+    
+    def _parse_slides_parallel(self, pptx_path: Path, slide_count: int) -> list[Slide]:
+        """
+        Parst die Folien in einem Prozess-Pool.
         
-        with ZipFile(pptx_path, 'r') as zf:
-            for name in zf.namelist():
-                if name.startswith('ppt/media/'):
-                    data = zf.read(name)
-                    # Key ist Dateiname ohne Pfad
-                    key = Path(name).name
-                    self._image_cache[key] = data
+        Jeder Worker öffnet die Datei einmal und parst einen
+        zusammenhängenden Folienbereich; die Reihenfolge bleibt erhalten.
+        """
+        workers = min(self.workers, slide_count)
+        chunk_size = -(-slide_count // workers)
+        tasks = [
+            (
+                type(self), str(pptx_path), self.extract_images, self.slow_path,
+                start, min(start + chunk_size, slide_count),
+            )
+            for start in range(0, slide_count, chunk_size)
+        ]
+        
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            return [
+                slide
+                for chunk in executor.map(_parse_slide_range, tasks)
+                for slide in chunk
+            ]
     
     def _parse_slide(self, pptx_slide, slide_num: int) -> Slide:
         """Parst eine einzelne Folie."""
@@ -147,24 +289,19 @@ class PPTXParser:
         - Placeholder-Typ (Titel, Untertitel, Content)
         - Formatierung (Schriftgröße, Bold, etc.)
         """
-        # Bilder
-        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-            return self._parse_picture(shape)
-        
-        # Tabellen
-        if shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-            return self._parse_table(shape)
+        shape_type = shape.shape_type
         
-        # Embedded Charts/Diagramme
-        if shape.shape_type == MSO_SHAPE_TYPE.CHART:
-            return self._parse_chart(shape)
+        # Bilder, Tabellen, Embedded Charts/Diagramme
+        handler = self._shape_handlers.get(shape_type)
+        if handler:
+            return handler(shape)
         
         # Text-Shapes
         if shape.has_text_frame:
             return self._parse_text_shape(shape)
         
         # Gruppen rekursiv verarbeiten
-        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        if shape_type == MSO_SHAPE_TYPE.GROUP:
             # TODO: Gruppierte Shapes verarbeiten
             pass
         
@@ -173,7 +310,9 @@ class PPTXParser:
     def _parse_text_shape(self, shape: BaseShape) -> Optional[Block]:
         """Parst ein Text-Shape und bestimmt den semantischen Typ."""
         text_frame = shape.text_frame
-        if not text_frame.paragraphs:
+        
+        # Leere Textrahmen (häufig bei Platzhaltern) ohne Paragraph-Objekte verwerfen
+        if not _HAS_TEXT_XPATH(text_frame._txBody):
             return None
         
         # Paragraphen extrahieren
@@ -181,18 +320,16 @@ class PPTXParser:
         max_font_size = 0
         has_bullets = False
         
-        for pptx_para in text_frame.paragraphs:
-            para = self._parse_paragraph(pptx_para)
-            if para and not para.is_empty:
-                paragraphs.append(para)
+        for parsed in self._parse_paragraphs(text_frame, shape.part):
+            if parsed and not parsed.paragraph.is_empty:
+                paragraphs.append(parsed.paragraph)
                 
                 # Font-Size tracken für Heading-Erkennung
-                for run in para.runs:
-                    if run.font_size and run.font_size > max_font_size:
-                        max_font_size = run.font_size
+                if parsed.max_font_size > max_font_size:
+                    max_font_size = parsed.max_font_size
                 
                 # Bullet-Erkennung
-                if pptx_para.level > 0 or self._has_bullet(pptx_para):
+                if parsed.has_bullet:
                     has_bullets = True
         
         if not paragraphs:
@@ -212,26 +349,111 @@ class PPTXParser:
             source_shape_id=str(shape.shape_id),
         )
     
-    def _parse_paragraph(self, pptx_para) -> Optional[Paragraph]:
-        """Parst einen Absatz mit allen Runs."""
+    def _parse_paragraphs(
+        self,
+        text_frame,
+        part,
+        detect_bullets: bool = True
+    ) -> Iterator[Optional[_ParsedParagraph]]:
+        """
+        Parst alle Absätze eines Textrahmens.
+        
+        Standard ist der direkte Weg über die a:p-Elemente des txBody;
+        mit slow_path über python-pptx Paragraph-Objekte.
+        """
+        if self.slow_path:
+            for pptx_para in text_frame.paragraphs:
+                yield self._parse_paragraph(pptx_para, detect_bullets)
+        else:
+            for p in text_frame._txBody.iterchildren(_P_TAG):
+                yield self._parse_paragraph_element(p, part, detect_bullets)
+    
+    def _parse_paragraph_element(
+        self,
+        p,
+        part,
+        detect_bullets: bool = True
+    ) -> Optional[_ParsedParagraph]:
+        """
+        Parst einen Absatz direkt aus seinem a:p-Element.
+        
+        Gleiches Ergebnis wie _parse_paragraph, aber ohne python-pptx
+        Proxy-Objekte für Absatz, Runs und Fonts.
+        """
         runs = []
+        max_font_size = 0
+        
+        for r in p.iterchildren(_R_TAG):
+            t = r.find(_T_TAG)
+            text = t.text if t is not None else None
+            if not text:
+                continue
+            
+            run = TextRun(text=text)
+            
+            rPr = r.find(_RPR_TAG)
+            if rPr is not None:
+                self._apply_run_properties(run, rPr, part)
+                if run.font_size and run.font_size > max_font_size:
+                    max_font_size = run.font_size
+            
+            runs.append(run)
+        
+        if not runs:
+            return None
+        
+        pPr = p.find(_PPR_TAG)
+        if pPr is not None:
+            alignment = _XML_ALIGNMENTS.get(pPr.get('algn'), "left")
+            level = int(pPr.get('lvl', 0))
+        else:
+            alignment = "left"
+            level = 0
+        
+        paragraph = Paragraph(
+            runs=runs,
+            alignment=alignment,
+            level=level,
+        )
+        return _ParsedParagraph(
+            paragraph=paragraph,
+            max_font_size=max_font_size,
+            has_bullet=detect_bullets and (level > 0 or self._ppr_has_bullet(pPr)),
+        )
+    
+    def _parse_paragraph(
+        self,
+        pptx_para,
+        detect_bullets: bool = True
+    ) -> Optional[_ParsedParagraph]:
+        """
+        Parst einen Absatz mit allen Runs.
+        
+        Liefert neben dem Paragraph die größte Schriftgröße und ob der
+        Absatz ein Aufzählungszeichen hat, damit der Aufrufer die Runs
+        nicht erneut durchlaufen muss.
+        """
+        # Leere Absätze (Platzhalter, Abstände) ohne python-pptx Run-Proxies verwerfen
+        if pptx_para._p.find(_R_TAG) is None:
+            return None
+        
+        runs = []
+        max_font_size = 0
         
         for pptx_run in pptx_para.runs:
-            if not pptx_run.text:
+            text = pptx_run.text
+            if not text:
                 continue
-                
-            run = TextRun(
-                text=pptx_run.text,
-                bold=pptx_run.font.bold or False,
-                italic=pptx_run.font.italic or False,
-                underline=pptx_run.font.underline or False,
-                font_size=self._emu_to_pt(pptx_run.font.size) if pptx_run.font.size else None,
-                font_name=pptx_run.font.name,
-            )
             
-            # Hyperlink
-            if pptx_run.hyperlink and pptx_run.hyperlink.address:
-                run.hyperlink = pptx_run.hyperlink.address
+            run = TextRun(text=text)
+            
+            # Formatierung direkt aus a:rPr lesen (ein Element-Zugriff statt
+            # je einem python-pptx Property-Aufruf pro Attribut)
+            rPr = pptx_run._r.find(_RPR_TAG)
+            if rPr is not None:
+                self._apply_run_properties(run, rPr, pptx_run.part)
+                if run.font_size and run.font_size > max_font_size:
+                    max_font_size = run.font_size
             
             runs.append(run)
         
@@ -239,19 +461,44 @@ class PPTXParser:
             return None
         
         # Alignment
-        alignment_map = {
-            1: "left",
-            2: "center",
-            3: "right",
-            4: "justify",
-        }
-        alignment = alignment_map.get(pptx_para.alignment, "left") if pptx_para.alignment else "left"
+        align = pptx_para.alignment
+        alignment = _ALIGNMENTS[align] if align and 0 < align < len(_ALIGNMENTS) else "left"
+        level = pptx_para.level or 0
         
-        return Paragraph(
+        paragraph = Paragraph(
             runs=runs,
             alignment=alignment,
-            level=pptx_para.level or 0,
+            level=level,
         )
+        return _ParsedParagraph(
+            paragraph=paragraph,
+            max_font_size=max_font_size,
+            has_bullet=detect_bullets and (level > 0 or self._has_bullet(pptx_para)),
+        )
+    
+    @staticmethod
+    def _apply_run_properties(run: TextRun, rPr, part):
+        """Überträgt Formatierung und Hyperlink aus einem a:rPr-Element."""
+        run.bold = rPr.get('b') in _XSD_TRUE
+        run.italic = rPr.get('i') in _XSD_TRUE
+        run.underline = rPr.get('u') not in (None, 'none')
+        
+        sz = rPr.get('sz')
+        if sz:
+            run.font_size = int(sz) / 100  # Hundertstel Punkt
+        
+        latin = rPr.find(_LATIN_TAG)
+        if latin is not None:
+            run.font_name = latin.get('typeface')
+        
+        # Hyperlink nur auflösen wenn a:hlinkClick vorhanden
+        hlink = rPr.find(_HLINK_CLICK_TAG)
+        if hlink is not None:
+            rId = hlink.get(_R_ID_ATTR)
+            if rId:
+                address = part.target_ref(rId)
+                if address:
+                    run.hyperlink = address
     
     def _classify_text_block(
         self, 
@@ -266,36 +513,27 @@ class PPTXParser:
         Returns:
             Tuple von (BlockType, heading_level, list_style)
         """
-        # 1. Placeholder-Typ prüfen (höchste Priorität)
-        if shape.is_placeholder:
-            ph_type = shape.placeholder_format.type
-            
-            if ph_type in self.TITLE_PLACEHOLDER_TYPES:
-                return BlockType.HEADING, 1, ListStyle.NONE
-            
-            if ph_type == PP_PLACEHOLDER.SUBTITLE:
-                return BlockType.HEADING, 2, ListStyle.NONE
-        
-        # 2. Listen erkennen
-        if has_bullets:
-            return BlockType.LIST, 0, ListStyle.BULLET
-        
-        # 3. Heading durch Formatierung erkennen
-        if max_font_size >= self.HEADING_MIN_FONT_SIZE:
-            # Heading-Level basierend auf Font-Size
-            if max_font_size >= 32:
-                level = 1
-            elif max_font_size >= 24:
-                level = 2
-            elif max_font_size >= 20:
-                level = 3
-            else:
-                level = 4
-            
-            return BlockType.HEADING, level, ListStyle.NONE
-        
-        # 4. Default: Paragraph
-        return BlockType.PARAGRAPH, 0, ListStyle.NONE
+        # Placeholder-Typ
+        ph_type = shape.placeholder_format.type if shape.is_placeholder else None
+        
+        # Heading-Level basierend auf Font-Size (0 = kein Heading)
+        if max_font_size < self.HEADING_MIN_FONT_SIZE:
+            size_level = 0
+        elif max_font_size >= 32:
+            size_level = 1
+        elif max_font_size >= 24:
+            size_level = 2
+        elif max_font_size >= 20:
+            size_level = 3
+        else:
+            size_level = 4
+        
+        return _classify_features(
+            ph_type is not None and ph_type in self.TITLE_PLACEHOLDER_TYPES,
+            ph_type == PP_PLACEHOLDER.SUBTITLE,
+            has_bullets,
+            size_level,
+        )
     
     def _parse_picture(self, shape: Picture) -> Optional[Block]:
         """Parst ein Bild-Shape."""
@@ -303,8 +541,13 @@ class PPTXParser:
             image = shape.image
             image_bytes = image.blob
             
-            # Hash für Caching
-            image_hash = hashlib.md5(image_bytes).hexdigest()
+            # Hash für Caching (einmal pro Bild-Part, Logos etc. teilen sich einen)
+            partname = self._image_partname(shape)
+            image_hash = self._media_hashes.get(partname) if partname else None
+            if image_hash is None:
+                image_hash = self._hash_image(image_bytes)
+                if partname:
+                    self._media_hashes[partname] = image_hash
             
             # MIME-Type
             mime_type = f"image/{image.ext}"
@@ -313,11 +556,10 @@ class PPTXParser:
             
             # Alt-Text aus PPTX (falls vorhanden)
             existing_alt = None
-            if hasattr(shape, '_element'):
-                # Versuche descr oder title Attribut zu finden
-                nvPicPr = shape._element.find('.//{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
-                if nvPicPr is not None:
-                    existing_alt = nvPicPr.get('descr') or nvPicPr.get('title')
+            # descr oder title Attribut von p:nvPicPr/p:cNvPr
+            cNvPr = shape._element.find(_CNVPR_PATH)
+            if cNvPr is not None:
+                existing_alt = cNvPr.get('descr') or cNvPr.get('title')
             
             figure = Figure(
                 image_data=image_bytes,
@@ -338,6 +580,25 @@ class PPTXParser:
             print(f"⚠️  Bild-Extraktion fehlgeschlagen: {e}")
             return None
     
+    @staticmethod
+    def _hash_image(data: bytes) -> str:
+        """
+        Bild-Hash für Caching.
+        
+        BLAKE2b: schneller als MD5 und prozessübergreifend stabil,
+        wie vom Alt-Text-Disk-Cache benötigt.
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _image_partname(shape: Picture) -> Optional[str]:
+        """ZIP-Pfad des Bildes eines Picture-Shapes (ohne führenden Slash)."""
+        try:
+            image_part = shape.part.related_part(shape._element.blip_rId)
+            return str(image_part.partname).lstrip('/')
+        except (AttributeError, KeyError):
+            return None
+    
     def _parse_table(self, shape) -> Optional[Block]:
         """Parst eine Tabelle."""
         try:
@@ -353,10 +614,11 @@ class PPTXParser:
                     # Paragraphen in Zelle
                     paragraphs = []
                     if pptx_cell.text_frame:
-                        for pptx_para in pptx_cell.text_frame.paragraphs:
-                            para = self._parse_paragraph(pptx_para)
-                            if para:
-                                paragraphs.append(para)
+                        for parsed in self._parse_paragraphs(
+                            pptx_cell.text_frame, shape.part, detect_bullets=False
+                        ):
+                            if parsed:
+                                paragraphs.append(parsed.paragraph)
                     
                     cell = TableCell(
                         paragraphs=paragraphs,
@@ -411,14 +673,128 @@ class PPTXParser:
         """
         Bestimmt die Lesereihenfolge für Blöcke.
         
-        Heuristik:
         1. Title-Placeholder zuerst
-        2. Dann Top-to-Bottom, Left-to-Right
-        3. Bei gleicher Y-Position: Left-to-Right
+        2. Positionierte Blöcke topologisch sortiert
+           (siehe _topological_reading_order)
+        3. Blöcke ohne Position zuletzt
+        
+        Bei Zyklen im Layout-Graphen greift die Y-Bucket-Heuristik.
         """
         if not shapes_with_order:
             return []
         
+        sorted_items = self._topological_reading_order(shapes_with_order)
+        if sorted_items is None:
+            sorted_items = self._heuristic_reading_order(shapes_with_order)
+        
+        blocks = []
+        for order, (shape, block, bbox) in enumerate(sorted_items, 1):
+            block.reading_order = order
+            blocks.append(block)
+        
+        return blocks
+    
+    def _topological_reading_order(
+        self,
+        shapes_with_order: list[tuple]
+    ) -> Optional[list[tuple]]:
+        """
+        Lesereihenfolge als topologische Sortierung über Überlappungen.
+        
+        Kanten im Graphen:
+        - Überlappen zwei Blöcke auf der X-Achse (gleiche Spalte),
+          kommt der obere zuerst
+        - Überlappen sie auf der Y-Achse (gleiche Zeile),
+          kommt der linke zuerst
+        
+        Unter den freien Blöcken gewinnt der mit der kleinsten
+        Y-Mitte, dann der linke. Anders als feste 20mm-Buckets
+        funktioniert das auch bei leicht versetzten Spalten.
+        
+        Returns:
+            Sortierte Einträge oder None bei Zyklus / zu vielen Shapes
+        """
+        if len(shapes_with_order) > self.TOPOLOGICAL_SORT_MAX_SHAPES:
+            return None
+        
+        titles, positioned, unpositioned = [], [], []
+        for item in shapes_with_order:
+            shape, block, bbox = item
+            if block.block_type == BlockType.HEADING and block.heading_level == 1:
+                titles.append(item)
+            elif bbox:
+                positioned.append(item)
+            else:
+                unpositioned.append(item)
+        
+        boxes = [bbox for shape, block, bbox in positioned]
+        count = len(boxes)
+        successors: list[list[int]] = [[] for _ in range(count)]
+        in_degree = [0] * count
+        
+        for i in range(count):
+            for j in range(i + 1, count):
+                edge = self._reading_order_edge(boxes[i], boxes[j])
+                if edge > 0:
+                    successors[i].append(j)
+                    in_degree[j] += 1
+                elif edge < 0:
+                    successors[j].append(i)
+                    in_degree[i] += 1
+        
+        # Kahn mit Heap: (Y-Mitte, X, Index)
+        ready = [
+            (boxes[i].y + boxes[i].height / 2, boxes[i].x, i)
+            for i in range(count) if in_degree[i] == 0
+        ]
+        heapq.heapify(ready)
+        
+        ordered = []
+        while ready:
+            _, _, i = heapq.heappop(ready)
+            ordered.append(positioned[i])
+            for j in successors[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    heapq.heappush(ready, (boxes[j].y + boxes[j].height / 2, boxes[j].x, j))
+        
+        if len(ordered) < count:
+            return None  # Zyklus
+        
+        return titles + ordered + unpositioned
+    
+    @staticmethod
+    def _reading_order_edge(a: BoundingBox, b: BoundingBox) -> int:
+        """
+        Reihenfolge-Beziehung zweier Blöcke.
+        
+        Returns:
+            1 wenn a vor b, -1 wenn b vor a, 0 wenn unabhängig
+        """
+        # Gleiche Spalte: oben vor unten
+        if min(a.x + a.width, b.x + b.width) > max(a.x, b.x):
+            a_center = a.y + a.height / 2
+            b_center = b.y + b.height / 2
+            if a_center != b_center:
+                return 1 if a_center < b_center else -1
+        
+        # Gleiche Zeile: links vor rechts
+        if min(a.y + a.height, b.y + b.height) > max(a.y, b.y):
+            a_center = a.x + a.width / 2
+            b_center = b.x + b.width / 2
+            if a_center != b_center:
+                return 1 if a_center < b_center else -1
+        
+        return 0
+    
+    def _heuristic_reading_order(self, shapes_with_order: list[tuple]) -> list[tuple]:
+        """
+        Y-Bucket-Heuristik (Fallback).
+        
+        1. Title-Placeholder zuerst
+        2. Dann Top-to-Bottom, Left-to-Right
+        3. Bei gleicher Y-Position (20mm Toleranz): Left-to-Right
+        """
         def sort_key(item):
             shape, block, bbox = item
             
@@ -429,54 +805,98 @@ class PPTXParser:
             if bbox:
                 # Primär: Y-Position (oben nach unten)
                 # Sekundär: X-Position (links nach rechts)
-                y_bucket = int(bbox.y / 20)  # 20mm Toleranz
+                y_bucket = int(bbox.y / self.READING_ORDER_Y_TOLERANCE)
                 return (1, y_bucket, bbox.x)
             
             return (2, 0, 0)
         
-        sorted_items = sorted(shapes_with_order, key=sort_key)
+        if _numpy_available and len(shapes_with_order) >= self.NUMPY_SORT_MIN_SHAPES:
+            return self._sort_reading_order_numpy(shapes_with_order)
+        return sorted(shapes_with_order, key=sort_key)
+    
+    def _sort_reading_order_numpy(self, shapes_with_order: list[tuple]) -> list[tuple]:
+        """
+        Gleiche Sortierung wie sort_key, aber per np.lexsort in C.
         
-        blocks = []
-        for order, (shape, block, bbox) in enumerate(sorted_items, 1):
-            block.reading_order = order
-            blocks.append(block)
+        lexsort ist stabil, die Reihenfolge ist daher identisch zu sorted().
+        """
+        count = len(shapes_with_order)
+        priority = np.fromiter(
+            (
+                0 if block.block_type == BlockType.HEADING and block.heading_level == 1
+                else 1 if bbox else 2
+                for shape, block, bbox in shapes_with_order
+            ),
+            dtype=np.int8, count=count,
+        )
+        y = np.fromiter(
+            (bbox.y if bbox else 0.0 for shape, block, bbox in shapes_with_order),
+            dtype=np.float64, count=count,
+        )
+        x = np.fromiter(
+            (bbox.x if bbox else 0.0 for shape, block, bbox in shapes_with_order),
+            dtype=np.float64, count=count,
+        )
         
-        return blocks
+        # Bucket-Arithmetik vektorisiert; trunc entspricht int() im sort_key
+        positioned = priority == 1
+        y_bucket = np.where(positioned, np.trunc(y / self.READING_ORDER_Y_TOLERANCE), 0).astype(np.int64)
+        x = np.where(positioned, x, 0.0)
+        
+        # lexsort: letzter Schlüssel ist der primäre
+        order = np.lexsort((x, y_bucket, priority))
+        return [shapes_with_order[i] for i in order]
     
     def _get_bounding_box(self, shape: BaseShape) -> Optional[BoundingBox]:
         """Extrahiert Position und Größe eines Shapes."""
-        try:
-            return BoundingBox(
-                x=self._emu_to_mm(shape.left),
-                y=self._emu_to_mm(shape.top),
-                width=self._emu_to_mm(shape.width),
-                height=self._emu_to_mm(shape.height),
-            )
-        except:
+        left, top, width, height = shape.left, shape.top, shape.width, shape.height
+        
+        # Ohne eigene oder geerbte Geometrie liefert python-pptx None
+        if left is None or top is None or width is None or height is None:
             return None
+        
+        return BoundingBox(
+            x=left * _EMU_TO_MM,
+            y=top * _EMU_TO_MM,
+            width=width * _EMU_TO_MM,
+            height=height * _EMU_TO_MM,
+        )
     
     def _has_bullet(self, pptx_para) -> bool:
         """Prüft ob ein Absatz Aufzählungszeichen hat."""
-        try:
-            # python-pptx Bullet-Detection
-            pPr = pptx_para._p.pPr
-            if pPr is not None:
-                buNone = pPr.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}buNone')
-                if buNone is not None:
-                    return False
-                buChar = pPr.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}buChar')
-                buAutoNum = pPr.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}buAutoNum')
-                return buChar is not None or buAutoNum is not None
-        except:
-            pass
-        return False
+        p = getattr(pptx_para, '_p', None)
+        return self._ppr_has_bullet(p.pPr if p is not None else None)
+    
+    @staticmethod
+    def _ppr_has_bullet(pPr) -> bool:
+        """Prüft ein a:pPr-Element (oder None) auf Aufzählungszeichen."""
+        if pPr is None:
+            return False
+        # Aufzählungszeichen sind direkte Kinder von a:pPr
+        if pPr.find(_BU_NONE_TAG) is not None:
+            return False
+        return (
+            pPr.find(_BU_CHAR_TAG) is not None
+            or pPr.find(_BU_AUTONUM_TAG) is not None
+        )
     
     @staticmethod
     def _emu_to_mm(emu: int) -> float:
         """Konvertiert EMUs zu Millimetern."""
-        return emu / 914400 * 25.4
+        return emu * _EMU_TO_MM
     
     @staticmethod
     def _emu_to_pt(emu: int) -> float:
         """Konvertiert EMUs zu Points."""
-        return emu / 914400 * 72
+        return emu * _EMU_TO_PT
+
+
+def _parse_slide_range(task: tuple) -> list[Slide]:
+    """Worker für PPTXParser._parse_slides_parallel (muss picklebar sein)."""
+    parser_cls, pptx_path, extract_images, slow_path, start, stop = task
+    parser = parser_cls(extract_images=extract_images, slow_path=slow_path)
+    pptx_slides = Presentation(pptx_path).slides
+    return [
+        parser._parse_slide(pptx_slides[index], index + 1)
+        for index in range(start, stop)
+    ]
@@ -10,20 +10,124 @@ Pipeline:
 """
 
 import base64
+import hashlib
+import io
+import mimetypes
+import os
 import tempfile
-from dataclasses import dataclass
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, astuple
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from datetime import datetime
-import html
 
-from weasyprint import HTML, CSS
+from weasyprint import HTML, CSS, DEFAULT_OPTIONS
 from weasyprint.text.fonts import FontConfiguration
 
 from .models import (
     SlideModel, Slide, Block, BlockType,
     Paragraph, TextRun, Table, Figure, ListStyle
 )
+from .accessibility_optimizer import ElementRole
+
+# WeasyPrint ≥ 66 kann Tagging unabhängig von der PDF/UA-Variante aktivieren
+_WEASYPRINT_PDF_TAGS = "pdf_tags" in DEFAULT_OPTIONS
+
+# Optional: pikepdf für das PDF/UA-Patching
+try:
+    import pikepdf
+    from pikepdf import Name
+    _pikepdf_available = True
+except ImportError:
+    _pikepdf_available = False
+
+
+# Entspricht html.escape(quote=True), aber in einem einzigen Durchlauf
+# über den String statt fünf replace()-Aufrufen
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _build_wrappers() -> list[tuple[str, str]]:
+    """
+    Öffnende/schließende Tags für alle Kombinationen aus fett, kursiv
+    und unterstrichen, indiziert über (bold << 2) | (italic << 1) | underline.
+    
+    Die Verschachtelung entspricht <u><em><strong>…</strong></em></u>.
+    """
+    wrappers = []
+    for mask in range(8):
+        tags = [
+            tag for bit, tag in ((1, "u"), (2, "em"), (4, "strong"))
+            if mask & bit
+        ]
+        open_tags = "".join(f"<{tag}>" for tag in tags)
+        close_tags = "".join(f"</{tag}>" for tag in reversed(tags))
+        wrappers.append((open_tags, close_tags))
+    return wrappers
+
+
+_WRAPPERS = _build_wrappers()
+
+
+def _b64encode_batch(blobs: list[bytes]) -> list[str]:
+    """
+    Base64-kodiert viele kleine Blobs mit einem einzigen b64encode-Aufruf.
+    
+    Jeder Blob wird mit Nullbytes auf ein Vielfaches von 3 aufgefüllt,
+    damit seine Kodierung an einer 4-Zeichen-Grenze beginnt. Im letzten
+    Quartett stehen für die Füllbytes dann "A" statt "=" – die Bits davor
+    sind identisch, es genügt also, die Padding-Zeichen zu ersetzen.
+    """
+    chunks = []
+    for blob in blobs:
+        chunks.append(blob)
+        remainder = len(blob) % 3
+        if remainder:
+            chunks.append(b"\0" * (3 - remainder))
+    
+    encoded = base64.b64encode(b"".join(chunks)).decode('ascii')
+    
+    result = []
+    offset = 0
+    for blob in blobs:
+        length = -(-len(blob) // 3) * 4
+        b64 = encoded[offset:offset + length]
+        offset += length
+        padding = -len(blob) % 3
+        if padding:
+            b64 = b64[:-padding] + "=" * padding
+        result.append(b64)
+    return result
+
+
+def _render_run(run: TextRun, _esc=_HTML_ESCAPE, _wrappers=_WRAPPERS) -> str:
+    """
+    Rendert einen TextRun mit Formatierung.
+    
+    Modul-Funktion statt Methode: wird pro Run aufgerufen und spart
+    so das Binden von self in den List-Comprehensions der Renderer.
+    Die Default-Argumente machen Escape-Tabelle und Tag-Paare zu
+    lokalen Variablen (LOAD_FAST statt LOAD_GLOBAL).
+    """
+    text = run.text.translate(_esc)
+    
+    # Formatierungen verschachteln (vorberechnete Tag-Paare)
+    mask = (run.bold << 2) | (run.italic << 1) | run.underline
+    if mask:
+        open_tags, close_tags = _wrappers[mask]
+        text = f"{open_tags}{text}{close_tags}"
+    if run.hyperlink:
+        text = f'<a href="{run.hyperlink.translate(_esc)}">{text}</a>'
+    
+    return text
 
 
 @dataclass
@@ -47,50 +151,24 @@ class RendererConfig:
     # PDF Optionen
     pdf_version: str = "1.7"
     embed_fonts: bool = True
-
-
-class HTMLGenerator:
-    """
-    Generiert semantisches HTML aus SlideModel.
-    
-    Das HTML ist optimiert für:
-    - Screenreader (ARIA, semantische Tags)
-    - WeasyPrint Rendering
-    - PDF/UA Tag-Mapping
-    """
+    object_streams: bool = True     # Objekte in komprimierte Object Streams packen (ab PDF 1.5)
+    weasyprint_ua_variant: bool = False  # WeasyPrints eigene PDF/UA-Metadaten (überschreibt der Patcher ohnehin)
+    recompress_streams: bool = False  # Flate-Streams von WeasyPrint neu komprimieren (langsam)
     
-    def __init__(self, config: RendererConfig):
-        self.config = config
+    # Performance
+    render_workers: int = 1  # Prozesse für die HTML-Generierung (1 = sequentiell)
+    external_images: bool = True  # Bilder als Dateien statt Base64-Data-URIs an WeasyPrint
     
-    def generate(self, model: SlideModel) -> str:
-        """Generiert komplettes HTML-Dokument."""
-        slides_html = "\n".join(
-            self._render_slide(slide) 
-            for slide in model.slides
-        )
-        
-        return f"""<!DOCTYPE html>
-<html lang="{model.language}">
-<head>
-    <meta charset="UTF-8">
-    <title>{html.escape(model.title or 'Präsentation')}</title>
-    <meta name="author" content="{html.escape(model.author or '')}">
-    <meta name="subject" content="{html.escape(model.subject or '')}">
-    <meta name="generator" content="pptx2ua">
-    <style>
-{self._generate_css()}
-    </style>
-</head>
-<body>
-{slides_html}
-</body>
-</html>"""
+    # Debug
+    debug_html: bool = False  # Eigenständiges HTML (CSS + Base64-Bilder) neben das PDF schreiben
+
+
+@lru_cache(maxsize=16)
+def _build_css(config_key: tuple) -> str:
+    """Generiert CSS für PDF-Rendering aus einem RendererConfig-Tupel."""
+    cfg = RendererConfig(*config_key)
     
-    def _generate_css(self) -> str:
-        """Generiert CSS für PDF-Rendering."""
-        cfg = self.config
-        
-        return f"""
+    return f"""
 /* Page Setup */
 @page {{
     size: {cfg.page_width_mm}mm {cfg.page_height_mm}mm;
@@ -261,187 +339,330 @@ a {{
     margin: 1em 0;
 }}
 """
+
+
+@lru_cache(maxsize=None)
+def _shared_font_config() -> FontConfiguration:
+    """
+    Prozessweit geteilte FontConfiguration.
     
-    def _render_slide(self, slide: Slide) -> str:
-        """Rendert eine Folie als HTML-Section."""
-        blocks_html = "\n".join(
-            self._render_block(block)
-            for block in slide.sorted_blocks
-        )
+    Die fontconfig-Initialisierung und Font-Enumeration kostet beim
+    ersten Aufruf spürbar Zeit und wird so nur einmal pro Prozess bezahlt,
+    auch wenn (wie im Server) pro Konvertierung ein Renderer entsteht.
+    """
+    return FontConfiguration()
+
+
+class HTMLGenerator:
+    """
+    Generiert semantisches HTML aus SlideModel.
+    
+    Das HTML ist optimiert für:
+    - Screenreader (ARIA, semantische Tags)
+    - WeasyPrint Rendering
+    - PDF/UA Tag-Mapping
+    """
+    
+    # Ab dieser Folienanzahl lohnt sich der Prozess-Pool
+    PARALLEL_MIN_SLIDES = 8
+    
+    # Kleine Bilder werden ab dieser Anzahl gemeinsam Base64-kodiert
+    BATCH_B64_MAX_BYTES = 64 * 1024
+    BATCH_B64_MIN_IMAGES = 20
+    
+    def __init__(self, config: RendererConfig):
+        self.config = config
         
-        # ARIA-Label für Screenreader
-        slide_label = f"Folie {slide.number}"
-        if slide.title:
-            slide_label += f": {slide.title}"
+        # src-Werte pro Bildinhalt (wird pro Dokument zurückgesetzt).
+        # Identische Bilder bekommen denselben src-String, den WeasyPrint
+        # dann als ein gemeinsames Bild-Objekt einbetten kann.
+        self._image_srcs: dict[tuple[str, str], str] = {}
+        self._assets_dir: Optional[Path] = None
         
-        return f"""
-<section class="slide" role="region" aria-label="{html.escape(slide_label)}">
-    <div class="slide-number" aria-hidden="true">Folie {slide.number}</div>
-{blocks_html}
-</section>"""
+        # (Rolle, Block-Typ) → Renderer, einmal pro Instanz aufgebaut
+        self._dispatch = self._build_dispatch()
     
-    def _render_block(self, block: Block) -> str:
-        """Rendert einen Block basierend auf seinem Typ."""
+    def _build_dispatch(self) -> dict:
+        """
+        Baut die Dispatch-Tabelle für _render_block.
         
-        # Prüfe Accessibility-Annotationen
-        if hasattr(block, 'a11y'):
-            from .accessibility_optimizer import ElementRole
-            
-            # Dekorative Elemente: aria-hidden
-            if block.a11y.role == ElementRole.DECORATIVE:
-                return f'    <div aria-hidden="true" class="decorative"><!-- {block.a11y.skip_reason or "Dekorativ"} --></div>'
-            
-            # Redundante Elemente: überspringen
-            if block.a11y.role == ElementRole.REDUNDANT:
-                return f'    <!-- Redundant: {block.a11y.skip_reason or "Bereits vorgelesen"} -->'
-            
-            # Optimierter Screenreader-Text vorhanden?
-            if block.a11y.screen_reader_text:
-                sr_text = html.escape(block.a11y.screen_reader_text)
-                
-                # Bei Tabellen: Sowohl visuelle Tabelle als auch SR-Text
-                if block.block_type == BlockType.TABLE and block.table:
-                    visual_table = self._render_table(block.table)
-                    return f'''    <div class="accessible-table">
-        <p class="sr-summary">{sr_text}</p>
-{visual_table}
-    </div>'''
-                
-                # Bei Figures: SR-Text als verbesserter Alt-Text
-                if block.block_type == BlockType.FIGURE and block.figure:
-                    block.figure.alt_text = block.a11y.screen_reader_text
+        Dekorative und redundante Blöcke werden unabhängig vom Typ
+        ausgeblendet; alle anderen Rollen (oder keine Annotation)
+        rendern nach Block-Typ.
+        """
+        role_handlers = {
+            ElementRole.DECORATIVE: self._render_decorative,
+            ElementRole.REDUNDANT: self._render_redundant,
+        }
+        type_handlers = {
+            BlockType.HEADING: self._render_heading,
+            BlockType.PARAGRAPH: self._render_paragraph_block,
+            BlockType.LIST: self._render_list,
+            BlockType.TABLE: self._render_table_block,
+            BlockType.FIGURE: self._render_figure_block,
+        }
+        
+        return {
+            (role, block_type): (
+                role_handlers.get(role)
+                or type_handlers.get(block_type, self._render_paragraph_block)
+            )
+            for role in (None, *ElementRole)
+            for block_type in BlockType
+        }
+    
+    def generate(
+        self,
+        model: SlideModel,
+        embed_css: bool = True,
+        assets_dir: Optional[Path] = None
+    ) -> str:
+        """
+        Generiert komplettes HTML-Dokument.
+        
+        Alle Renderer hängen ihre Fragmente an einen gemeinsamen
+        Puffer an, der am Ende genau einmal zusammengefügt wird.
+        
+        Args:
+            model: Das zu rendernde SlideModel
+            embed_css: CSS als <style>-Block einbetten. Der PDFUARenderer
+                übergibt das Stylesheet stattdessen vorkompiliert an WeasyPrint.
+            assets_dir: Wenn gesetzt, werden Bilder dort als Dateien abgelegt
+                und per file://-URL referenziert statt als Base64 eingebettet.
+        """
+        buf: list[str] = []
+        append = buf.append
+        self._image_srcs.clear()
+        self._assets_dir = assets_dir
+        
+        append(f"""<!DOCTYPE html>
+<html lang="{model.language}">
+<head>
+    <meta charset="UTF-8">
+    <title>{(model.title or 'Präsentation').translate(_HTML_ESCAPE)}</title>
+    <meta name="author" content="{(model.author or '').translate(_HTML_ESCAPE)}">
+    <meta name="subject" content="{(model.subject or '').translate(_HTML_ESCAPE)}">
+    <meta name="generator" content="pptx2ua">
+""")
+        if embed_css:
+            append("    <style>\n")
+            append(self._generate_css())
+            append("\n    </style>\n")
+        append("</head>\n<body>\n")
+        
+        slides = model.slides
+        if self.config.render_workers > 1 and len(slides) >= self.PARALLEL_MIN_SLIDES:
+            buf.extend(self._render_slides_parallel(slides))
+        else:
+            if assets_dir is None:
+                self._prefill_data_uris(slides)
+            for slide in slides:
+                self._render_slide(slide, buf)
+        
+        append("</body>\n</html>")
+        return "".join(buf)
+    
+    def _render_slides_parallel(self, slides: list[Slide]) -> list[str]:
+        """
+        Rendert die Folien in einem Prozess-Pool.
+        
+        Jeder Worker rendert einen zusammenhängenden Folienbereich zu
+        einem HTML-Fragment; die Reihenfolge bleibt erhalten.
+        """
+        workers = min(self.config.render_workers, len(slides))
+        chunk_size = -(-len(slides) // workers)
+        tasks = [
+            (type(self), self.config, self._assets_dir, slides[start:start + chunk_size])
+            for start in range(0, len(slides), chunk_size)
+        ]
+        
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            return list(executor.map(_render_slide_range, tasks))
+    
+    def _generate_css(self) -> str:
+        """Generiert CSS für PDF-Rendering (pro Konfiguration nur einmal)."""
+        # astuple statt Instanz als Key: die Config darf zwischen zwei
+        # Aufrufen verändert werden, ohne veraltetes CSS zu liefern
+        return _build_css(astuple(self.config))
+    
+    def _render_slide(self, slide: Slide, buf: list[str]):
+        """Rendert eine Folie als HTML-Section."""
+        # ARIA-Label für Screenreader
+        slide_label = f"Folie {slide.number}"
+        title = slide.title
+        if title:
+            slide_label += f": {title}"
         
-        # Standard-Rendering
-        if block.block_type == BlockType.HEADING:
-            return self._render_heading(block)
+        buf.append(
+            f'<section class="slide" role="region" aria-label="{slide_label.translate(_HTML_ESCAPE)}">\n'
+            f'    <div class="slide-number" aria-hidden="true">Folie {slide.number}</div>\n'
+        )
+        
+        for block in slide.sorted_blocks:
+            self._render_block(block, buf)
         
-        if block.block_type == BlockType.PARAGRAPH:
-            return self._render_paragraphs(block.paragraphs)
+        buf.append("</section>\n")
+    
+    def _render_block(self, block: Block, buf: list[str]):
+        """Rendert einen Block basierend auf Accessibility-Rolle und Typ."""
+        a11y = block.a11y
+        role = a11y.role if a11y is not None else None
+        self._dispatch[(role, block.block_type)](block, buf)
+    
+    def _render_decorative(self, block: Block, buf: list[str]):
+        """Dekorative Elemente: aria-hidden."""
+        reason = block.a11y.skip_reason or "Dekorativ"
+        buf.append(f'    <div aria-hidden="true" class="decorative"><!-- {reason} --></div>\n')
+    
+    def _render_redundant(self, block: Block, buf: list[str]):
+        """Redundante Elemente: überspringen."""
+        buf.append(f'    <!-- Redundant: {block.a11y.skip_reason or "Bereits vorgelesen"} -->\n')
+    
+    def _render_paragraph_block(self, block: Block, buf: list[str]):
+        """Absätze eines Blocks (auch Fallback für unbekannte Typen)."""
+        self._render_paragraphs(block.paragraphs, buf)
+    
+    def _render_table_block(self, block: Block, buf: list[str]):
+        """Tabellen-Block, ggf. mit Screenreader-Zusammenfassung."""
+        if not block.table:
+            self._render_paragraphs(block.paragraphs, buf)
+            return
         
-        if block.block_type == BlockType.LIST:
-            return self._render_list(block)
+        # Optimierter Screenreader-Text: sowohl visuelle Tabelle als auch SR-Text
+        a11y = block.a11y
+        if a11y is not None and a11y.screen_reader_text:
+            sr_text = a11y.screen_reader_text.translate(_HTML_ESCAPE)
+            buf.append(
+                f'    <div class="accessible-table">\n'
+                f'        <p class="sr-summary">{sr_text}</p>\n'
+            )
+            self._render_table(block.table, buf)
+            buf.append("    </div>\n")
+            return
         
-        if block.block_type == BlockType.TABLE and block.table:
-            return self._render_table(block.table)
+        self._render_table(block.table, buf)
+    
+    def _render_figure_block(self, block: Block, buf: list[str]):
+        """Abbildungs-Block, ggf. mit optimiertem Alt-Text."""
+        if not block.figure:
+            self._render_paragraphs(block.paragraphs, buf)
+            return
         
-        if block.block_type == BlockType.FIGURE and block.figure:
-            return self._render_figure(block.figure)
+        # Optimierter Screenreader-Text als verbesserter Alt-Text
+        a11y = block.a11y
+        if a11y is not None and a11y.screen_reader_text:
+            block.figure.alt_text = a11y.screen_reader_text
         
-        # Fallback
-        return self._render_paragraphs(block.paragraphs)
+        self._render_figure(block.figure, buf)
     
-    def _render_heading(self, block: Block) -> str:
+    def _render_heading(self, block: Block, buf: list[str]):
         """Rendert eine Überschrift."""
         level = min(block.heading_level, 6)
-        text = html.escape(block.text)
-        return f"    <h{level}>{text}</h{level}>"
+        text = block.text.translate(_HTML_ESCAPE)
+        buf.append(f"    <h{level}>{text}</h{level}>\n")
     
-    def _render_paragraphs(self, paragraphs: list[Paragraph]) -> str:
+    def _render_paragraphs(
+        self,
+        paragraphs: list[Paragraph],
+        buf: list[str],
+        _render_run=_render_run
+    ):
         """Rendert Absätze."""
-        result = []
+        append = buf.append
+        extend = buf.extend
         for para in paragraphs:
             if para.is_empty:
                 continue
             
-            runs_html = "".join(self._render_run(run) for run in para.runs)
-            
             # Alignment als Style
-            style = ""
             if para.alignment != "left":
-                style = f' style="text-align: {para.alignment}"'
+                append(f'    <p style="text-align: {para.alignment}">')
+            else:
+                append("    <p>")
             
-            result.append(f"    <p{style}>{runs_html}</p>")
-        
-        return "\n".join(result)
+            extend([_render_run(run) for run in para.runs])
+            append("</p>\n")
     
-    def _render_run(self, run: TextRun) -> str:
-        """Rendert einen TextRun mit Formatierung."""
-        text = html.escape(run.text)
-        
-        # Formatierungen verschachteln
-        if run.bold:
-            text = f"<strong>{text}</strong>"
-        if run.italic:
-            text = f"<em>{text}</em>"
-        if run.underline:
-            text = f"<u>{text}</u>"
-        if run.hyperlink:
-            text = f'<a href="{html.escape(run.hyperlink)}">{text}</a>'
-        
-        return text
-    
-    def _render_list(self, block: Block) -> str:
+    def _render_list(self, block: Block, buf: list[str], _render_run=_render_run):
         """Rendert eine Liste."""
         tag = "ul" if block.list_style == ListStyle.BULLET else "ol"
+        append = buf.append
+        extend = buf.extend
         
-        items = []
+        append(f"    <{tag}>\n")
         for para in block.paragraphs:
             if para.is_empty:
                 continue
-            runs_html = "".join(self._render_run(run) for run in para.runs)
-            items.append(f"        <li>{runs_html}</li>")
-        
-        items_html = "\n".join(items)
-        return f"    <{tag}>\n{items_html}\n    </{tag}>"
+            append("        <li>")
+            extend([_render_run(run) for run in para.runs])
+            append("</li>\n")
+        append(f"    </{tag}>\n")
     
-    def _render_table(self, table: Table) -> str:
+    def _render_table(
+        self,
+        table: Table,
+        buf: list[str],
+        _render_run=_render_run,
+        _esc=_HTML_ESCAPE
+    ):
         """Rendert eine Tabelle."""
-        rows_html = []
+        append = buf.append
+        extend = buf.extend
+        rows = table.rows
         
-        for row_idx, row in enumerate(table.rows):
-            cells_html = []
-            
-            for cell in row:
-                tag = "th" if cell.is_header else "td"
-                
-                # Zell-Inhalt
-                content = ""
-                for para in cell.paragraphs:
-                    runs = "".join(self._render_run(run) for run in para.runs)
-                    content += runs
-                
-                # Colspan/Rowspan
-                attrs = ""
-                if cell.colspan > 1:
-                    attrs += f' colspan="{cell.colspan}"'
-                if cell.rowspan > 1:
-                    attrs += f' rowspan="{cell.rowspan}"'
-                
-                # Scope für Header
-                if cell.is_header:
-                    attrs += ' scope="col"'
-                
-                cells_html.append(f"            <{tag}{attrs}>{content}</{tag}>")
-            
-            row_html = "\n".join(cells_html)
-            rows_html.append(f"        <tr>\n{row_html}\n        </tr>")
+        append("    <table>\n")
+        
+        # Caption
+        if table.caption:
+            append(f"        <caption>{table.caption.translate(_esc)}</caption>\n")
         
-        # Thead/Tbody Trennung
+        # Thead/Tbody Trennung vorab festlegen statt pro Zeile zu prüfen
         if table.has_header:
-            thead = f"        <thead>\n{rows_html[0]}\n        </thead>"
-            tbody = "        <tbody>\n" + "\n".join(rows_html[1:]) + "\n        </tbody>"
-            body = f"{thead}\n{tbody}"
+            sections = [("        <thead>\n", rows[:1], "        </thead>\n")]
+            if len(rows) > 1:
+                sections.append(("        <tbody>\n", rows[1:], "        </tbody>\n"))
         else:
-            body = "\n".join(rows_html)
+            sections = [("", rows, "")]
         
-        # Caption
-        caption = ""
-        if table.caption:
-            caption = f"        <caption>{html.escape(table.caption)}</caption>\n"
+        for section_open, section_rows, section_close in sections:
+            append(section_open)
+            
+            for row in section_rows:
+                append("        <tr>\n")
+                
+                for cell in row:
+                    tag = "th" if cell.is_header else "td"
+                    append(f"            <{tag}")
+                    
+                    # Colspan/Rowspan
+                    if cell.colspan > 1:
+                        append(f' colspan="{cell.colspan}"')
+                    if cell.rowspan > 1:
+                        append(f' rowspan="{cell.rowspan}"')
+                    
+                    # Scope für Header
+                    append(' scope="col">' if cell.is_header else ">")
+                    
+                    # Zell-Inhalt: Runs direkt in den Puffer
+                    for para in cell.paragraphs:
+                        extend([_render_run(run) for run in para.runs])
+                    
+                    append(f"</{tag}>\n")
+                
+                append("        </tr>\n")
+            
+            append(section_close)
         
-        return f"""    <table>
-{caption}{body}
-    </table>"""
+        append("    </table>\n")
     
-    def _render_figure(self, figure: Figure) -> str:
+    def _render_figure(self, figure: Figure, buf: list[str]):
         """Rendert eine Abbildung."""
         # Alt-Text (Pflicht für Barrierefreiheit!)
-        alt = html.escape(figure.alt_text or "Bild ohne Beschreibung")
+        alt = (figure.alt_text or "Bild ohne Beschreibung").translate(_HTML_ESCAPE)
         
-        # Bild als Base64 Data-URI
+        # Bild als Datei im Asset-Verzeichnis oder als Base64 Data-URI
         if figure.image_data:
-            b64 = base64.b64encode(figure.image_data).decode('utf-8')
-            src = f"data:{figure.mime_type};base64,{b64}"
+            src = self._image_src(figure)
         elif figure.image_path:
             # Externe Referenz
             src = str(figure.image_path)
@@ -449,17 +670,98 @@ a {{
             # Placeholder
             src = ""
         
+        append = buf.append
+        append("    <figure>\n        <img src=\"")
+        append(src)
+        append(f'" alt="{alt}" role="img">')
+        
         # Figcaption
-        caption_html = ""
         if figure.caption:
-            caption_html = f"\n        <figcaption>{html.escape(figure.caption)}</figcaption>"
+            append(f"\n        <figcaption>{figure.caption.translate(_HTML_ESCAPE)}</figcaption>")
         
         # Long Description als aria-describedby
         # (könnte auch als versteckter Text implementiert werden)
         
-        return f"""    <figure>
-        <img src="{src}" alt="{alt}" role="img">{caption_html}
-    </figure>"""
+        append("\n    </figure>\n")
+    
+    def _prefill_data_uris(self, slides: list[Slide]):
+        """
+        Kodiert viele kleine Bilder (Icons, Logos) in einem Rutsch.
+        
+        Bei Decks mit vielen kleinen Bildern dominiert sonst der Overhead
+        der einzelnen b64encode-Aufrufe. Große Bilder und Decks mit wenigen
+        Bildern laufen weiter über _image_src.
+        """
+        pending: dict[tuple[str, str], Figure] = {}
+        for slide in slides:
+            for block in slide.blocks:
+                figure = block.figure
+                if (
+                    figure is not None
+                    and figure.image_data
+                    and len(figure.image_data) <= self.BATCH_B64_MAX_BYTES
+                ):
+                    pending.setdefault(self._image_key(figure), figure)
+        
+        if len(pending) < self.BATCH_B64_MIN_IMAGES:
+            return
+        
+        figures = list(pending.values())
+        encoded = _b64encode_batch([figure.image_data for figure in figures])
+        for key, figure, b64 in zip(pending, figures, encoded):
+            self._image_srcs[key] = f"data:{figure.mime_type};base64,{b64}"
+    
+    @staticmethod
+    def _image_key(figure: Figure) -> tuple[str, str]:
+        """Cache-Schlüssel (Inhalts-Hash, MIME-Typ) einer Abbildung."""
+        # image_hash (BLAKE2b der Bild-Bytes) setzt bereits der Parser
+        content_hash = figure.image_hash or hashlib.blake2b(
+            figure.image_data, digest_size=16
+        ).hexdigest()
+        return content_hash, figure.mime_type
+    
+    def _image_src(self, figure: Figure) -> str:
+        """src-Wert einer Abbildung, pro Bildinhalt nur einmal erzeugt."""
+        key = self._image_key(figure)
+        
+        src = self._image_srcs.get(key)
+        if src is None:
+            if self._assets_dir is not None:
+                src = self._write_asset(figure, key[0])
+            else:
+                b64 = base64.b64encode(figure.image_data).decode('ascii')
+                src = f"data:{figure.mime_type};base64,{b64}"
+            self._image_srcs[key] = src
+        return src
+    
+    def _write_asset(self, figure: Figure, content_hash: str) -> str:
+        """
+        Legt die Bild-Bytes im Asset-Verzeichnis ab und liefert die file://-URL.
+        
+        WeasyPrint liest die Datei dann direkt, ohne Base64-Kodierung im
+        HTML und ohne Dekodierung beim Parsen.
+        """
+        ext = mimetypes.guess_extension(figure.mime_type) or ".bin"
+        asset_path = self._assets_dir / f"img_{content_hash}{ext}"
+        
+        if not asset_path.exists():
+            # Atomar schreiben: parallele Worker können dasselbe Bild ablegen
+            tmp_path = asset_path.with_name(f"{asset_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(figure.image_data)
+            os.replace(tmp_path, asset_path)
+        
+        return asset_path.as_uri()
+
+
+def _render_slide_range(task: tuple) -> str:
+    """Worker für HTMLGenerator._render_slides_parallel (muss picklebar sein)."""
+    generator_cls, config, assets_dir, slides = task
+    generator = generator_cls(config)
+    generator._assets_dir = assets_dir
+    buf: list[str] = []
+    for slide in slides:
+        generator._render_slide(slide, buf)
+    return "".join(buf)
 
 
 class PDFUAPatcher:
@@ -471,18 +773,16 @@ class PDFUAPatcher:
     fügt fehlende Metadaten hinzu.
     """
     
-    def __init__(self):
-        self._pikepdf_available = self._check_pikepdf()
-    
-    def _check_pikepdf(self) -> bool:
-        """Prüft ob pikepdf verfügbar ist."""
-        try:
-            import pikepdf
-            return True
-        except ImportError:
-            return False
+    def __init__(self, config: Optional[RendererConfig] = None):
+        self.config = config or RendererConfig()
+        self._pikepdf_available = _pikepdf_available
     
-    def patch(self, input_pdf: Path, output_pdf: Path, model: SlideModel):
+    def patch(
+        self,
+        input_pdf: Path | bytes | BinaryIO,
+        output_pdf: Path,
+        model: SlideModel
+    ):
         """
         Patcht PDF für PDF/UA Compliance.
         
@@ -491,53 +791,102 @@ class PDFUAPatcher:
         - /Lang für Dokumentsprache
         - /ViewerPreferences
         - Metadaten (Title, Author, etc.)
+        
+        Args:
+            input_pdf: Pfad, PDF-Bytes oder geöffnetes Binär-File
+            output_pdf: Zielpfad für das gepatchte PDF
+            model: Quelle für Sprache und Metadaten
         """
+        if isinstance(input_pdf, (bytes, bytearray)):
+            input_pdf = io.BytesIO(input_pdf)
+        
         if not self._pikepdf_available:
             # Fallback: Einfach kopieren
             import shutil
-            shutil.copy(input_pdf, output_pdf)
+            if isinstance(input_pdf, (str, Path)):
+                shutil.copy(input_pdf, output_pdf)
+            else:
+                with open(output_pdf, 'wb') as out:
+                    shutil.copyfileobj(input_pdf, out)
             print("⚠️  pikepdf nicht installiert - PDF/UA-Patching übersprungen")
             return
         
-        import pikepdf
-        
         with pikepdf.open(input_pdf) as pdf:
+            root = pdf.Root
+            
             # 1. MarkInfo (zeigt an dass PDF getaggt ist)
-            pdf.Root.MarkInfo = pikepdf.Dictionary({
-                "/Marked": True
-            })
+            root.MarkInfo = pikepdf.Dictionary(Marked=True)
 
             # 2. Dokumentsprache
-            pdf.Root.Lang = model.language
+            root.Lang = model.language
 
-            # 3. ViewerPreferences
-            pdf.Root.ViewerPreferences = pikepdf.Dictionary({
-                "/DisplayDocTitle": True
-            })
+            # 3. ViewerPreferences (neu pro PDF: ein Dictionary gehört
+            # zu dem Pdf, dem es zuerst zugewiesen wurde)
+            root.ViewerPreferences = pikepdf.Dictionary(DisplayDocTitle=True)
             
             # 4. Metadaten via Info Dictionary
-            pdf.docinfo['/Title'] = model.title or "Präsentation"
-            pdf.docinfo['/Author'] = model.author or ""
-            pdf.docinfo['/Subject'] = model.subject or ""
-            pdf.docinfo['/Creator'] = "pptx2ua"
-            pdf.docinfo['/Producer'] = "WeasyPrint + pptx2ua"
+            docinfo = pdf.docinfo
+            for key, value in (
+                (Name.Title, model.title or "Präsentation"),
+                (Name.Author, model.author or ""),
+                (Name.Subject, model.subject or ""),
+                (Name.Creator, "pptx2ua"),
+                (Name.Producer, "WeasyPrint + pptx2ua"),
+            ):
+                docinfo[key] = value
             
             # 5. XMP Metadaten (für PDF/UA Part Identifier)
-            # TODO: PDF/UA-1 Identifier hinzufügen
-            # Dies erfordert tieferes XMP-Handling
+            self._write_xmp(pdf, model.language)
             
-            pdf.save(output_pdf)
+            self._save(pdf, output_pdf)
+    
+    def _save(self, pdf, output_pdf: Path):
+        """Speichert mit dichter Kodierung (Object Streams, komprimierte Streams)."""
+        cfg = self.config
+        save_options = {
+            "linearize": False,
+            "compress_streams": True,
+            "object_stream_mode": (
+                pikepdf.ObjectStreamMode.generate
+                if cfg.object_streams
+                else pikepdf.ObjectStreamMode.preserve
+            ),
+        }
+        if cfg.recompress_streams:
+            # Neu-Komprimieren erfordert das Dekodieren der Flate-Streams
+            save_options["recompress_flate"] = True
+            save_options["stream_decode_level"] = pikepdf.StreamDecodeLevel.generalized
+        
+        pdf.save(output_pdf, **save_options)
     
-    def add_pdfua_identifier(self, pdf_path: Path):
+    def add_pdfua_identifier(self, pdf_path: Path, language: Optional[str] = None):
         """
         Fügt PDF/UA-1 Identifier hinzu.
         
         Dies ist der technische Marker der besagt dass das
         Dokument PDF/UA-1 konform sein soll.
+        """
+        if not self._pikepdf_available:
+            print("⚠️  pikepdf nicht installiert - PDF/UA-Identifier übersprungen")
+            return
         
-        TODO: XMP Metadata Manipulation
+        with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+            self._write_xmp(pdf, language)
+            self._save(pdf, pdf_path)
+    
+    @staticmethod
+    def _write_xmp(pdf, language: Optional[str] = None):
+        """
+        Schreibt die XMP-Metadaten inklusive pdfuaid:part.
+        
+        Titel, Autor etc. werden aus dem Info Dictionary übernommen,
+        damit XMP und docinfo konsistent sind (von PDF/UA gefordert).
         """
-        pass
+        with pdf.open_metadata(set_pikepdf_as_editor=False) as meta:
+            meta.load_from_docinfo(pdf.docinfo)
+            meta["pdfuaid:part"] = "1"
+            if language:
+                meta["dc:language"] = [language]
 
 
 class PDFUARenderer:
@@ -552,7 +901,23 @@ class PDFUARenderer:
     def __init__(self, config: Optional[RendererConfig] = None):
         self.config = config or RendererConfig()
         self.html_generator = HTMLGenerator(self.config)
-        self.patcher = PDFUAPatcher()
+        self.patcher = PDFUAPatcher(self.config)
+        
+        # Vorkompiliertes Stylesheet (wird bei geänderter Config neu gebaut)
+        self._font_config = _shared_font_config()
+        self._stylesheet: Optional[CSS] = None
+        self._stylesheet_key: Optional[tuple] = None
+    
+    def _get_stylesheet(self) -> CSS:
+        """Liefert das geparste WeasyPrint-Stylesheet für die aktuelle Config."""
+        key = astuple(self.config)
+        if self._stylesheet is None or key != self._stylesheet_key:
+            self._stylesheet = CSS(
+                string=self.html_generator._generate_css(),
+                font_config=self._font_config,
+            )
+            self._stylesheet_key = key
+        return self._stylesheet
     
     def render(
         self, 
@@ -573,49 +938,21 @@ class PDFUARenderer:
         """
         output_path = Path(output_path)
         
+        # Temporäres Asset-Verzeichnis für Bilder (wird nach dem Rendern entfernt)
+        assets_context = (
+            tempfile.TemporaryDirectory(prefix="pptx2ua-assets-")
+            if self.config.external_images
+            else nullcontext()
+        )
+        
         try:
-            if verbose:
-                print("📝 Generiere HTML...")
-            
-            # 1. HTML generieren
-            html_content = self.html_generator.generate(model)
-            
-            # Debug: HTML speichern
-            debug_html = output_path.with_suffix('.html')
-            debug_html.write_text(html_content, encoding='utf-8')
-            
-            if verbose:
-                print("🖨️  Rendere PDF mit WeasyPrint...")
-            
-            # 2. PDF rendern
-            font_config = FontConfiguration()
-            
-            # WeasyPrint Optionen für besseres Tagging
-            html_doc = HTML(string=html_content, base_url=str(output_path.parent))
-            
-            # Temporäres PDF
-            temp_pdf = output_path.with_suffix('.tmp.pdf')
-            
-            html_doc.write_pdf(
-                temp_pdf,
-                font_config=font_config,
-                # PDF/UA relevante Optionen
-                pdf_variant='pdf/ua-1',  # Experimentell!
-            )
-            
-            if verbose:
-                print("🔧 Patche PDF/UA Metadaten...")
-            
-            # 3. PDF/UA patchen
-            self.patcher.patch(temp_pdf, output_path, model)
-            
-            # Cleanup
-            temp_pdf.unlink(missing_ok=True)
-            
-            if verbose:
-                print(f"✅ PDF erstellt: {output_path}")
-            
-            return True
+            with assets_context as assets_dir:
+                return self._render(
+                    model,
+                    output_path,
+                    Path(assets_dir) if assets_dir else None,
+                    verbose,
+                )
             
         except Exception as e:
             print(f"❌ Rendering fehlgeschlagen: {e}")
@@ -623,6 +960,73 @@ class PDFUARenderer:
             traceback.print_exc()
             return False
     
+    def _render(
+        self,
+        model: SlideModel,
+        output_path: Path,
+        assets_dir: Optional[Path],
+        verbose: bool
+    ) -> bool:
+        """HTML → PDF → PDF/UA-Patch (Fehler behandelt render())."""
+        if verbose:
+            print("📝 Generiere HTML...")
+        
+        # 1. HTML generieren
+        html_content = self.html_generator.generate(
+            model, embed_css=False, assets_dir=assets_dir
+        )
+        
+        html_bytes = html_content.encode('utf-8')
+        
+        # Debug: HTML speichern (nur auf ausdrücklichen Wunsch, kostet einen
+        # zweiten Durchlauf). Eigenständig mit eingebettetem CSS und
+        # Base64-Bildern, weil das Asset-Verzeichnis danach gelöscht wird
+        if self.config.debug_html:
+            output_path.with_suffix('.html').write_text(
+                self.html_generator.generate(model), encoding='utf-8'
+            )
+        
+        if verbose:
+            print("🖨️  Rendere PDF mit WeasyPrint...")
+        
+        # 2. PDF rendern
+        # WeasyPrint Optionen für besseres Tagging
+        html_doc = HTML(
+            file_obj=io.BytesIO(html_bytes),
+            encoding='utf-8',
+            base_url=str(output_path.parent),
+        )
+        
+        # PDF im Speicher halten statt Temp-Datei auf der Platte
+        pdf_buffer = io.BytesIO()
+        
+        # PDF/UA relevante Optionen: Tagging ohne WeasyPrints eigene
+        # PDF/UA-Metadaten, die der Patcher ohnehin neu schreibt.
+        # Ältere WeasyPrint-Versionen taggen nur mit der Variante.
+        if self.config.weasyprint_ua_variant or not _WEASYPRINT_PDF_TAGS:
+            pdf_options = {"pdf_variant": "pdf/ua-1"}  # Experimentell!
+        else:
+            pdf_options = {"pdf_tags": True, "pdf_version": self.config.pdf_version}
+        
+        html_doc.write_pdf(
+            pdf_buffer,
+            stylesheets=[self._get_stylesheet()],
+            font_config=self._font_config,
+            **pdf_options,
+        )
+        pdf_buffer.seek(0)
+        
+        if verbose:
+            print("🔧 Patche PDF/UA Metadaten...")
+        
+        # 3. PDF/UA patchen
+        self.patcher.patch(pdf_buffer, output_path, model)
+        
+        if verbose:
+            print(f"✅ PDF erstellt: {output_path}")
+        
+        return True
+    
     def render_html_only(self, model: SlideModel, output_path: Path | str) -> str:
         """
         Rendert nur HTML (für Debugging/Preview).
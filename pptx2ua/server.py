@@ -7,51 +7,192 @@ Usage:
     python -m pptx2ua.server --port 3003
 
 Oder:
-    pptx2ua serve --port 3003
+    pptx2ua serve --port 3003 --workers 4
+
+Installation mit schnellem Event-Loop (uvloop) und HTTP-Parser (httptools):
+    pip install "pptx2ua[web]"
+
+Zugriff von anderen Origins (z.B. einem separaten Frontend) erlauben:
+    PPTX2UA_CORS_ORIGINS="http://localhost:5173,https://intranet.example" pptx2ua serve
 """
 
 import asyncio
+import gzip
+import json
+import multiprocessing
+import os
+import secrets
 import tempfile
 import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 import logging
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
+import httpx
+from fastapi import FastAPI, Request, UploadFile, File, Form, HTTPException
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from .parser import PPTXParser
 from .enricher import Enricher, EnricherConfig, EnricherBackend
 from .renderer import PDFUARenderer, RendererConfig
 from .validator import PDFUAValidator
 from .accessibility_optimizer import AccessibilityOptimizer, AccessibilityConfig
-from .slide_renderer import populate_slide_images, is_libreoffice_available
+from .slide_renderer import (
+    populate_slide_images_in_background,
+    is_libreoffice_available,
+    warm_libreoffice,
+)
+
+# Optional: orjson für schnellere JSON-Antworten
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
 
 # Logger
 logger = logging.getLogger(__name__)
 
+class OrjsonResponse(JSONResponse):
+    """JSON-Antwort, die per orjson direkt zu bytes serialisiert."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Antwortklasse für Routen, die ihre JSON-Antwort selbst bauen: umgeht
+# FastAPIs jsonable_encoder-Durchlauf über das fertige dict
+FastJSONResponse = OrjsonResponse if _orjson_available else JSONResponse
+
+
+# Ollama-Endpunkt für den Status-Check
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Legt gemeinsame Ressourcen für die Laufzeit des Servers an."""
+    # Ein async HTTP-Client für alle Status-Checks (Connection-Pooling)
+    app.state.http = httpx.AsyncClient(timeout=2.0)
+    app.state.convert_sem = asyncio.Semaphore(MAX_CONCURRENT_CONVERSIONS)
+    app.state.convert_pending = 0
+    # Konvertierungen laufen in Worker-Prozessen (CPU-lastig, GIL);
+    # "spawn" statt fork, weil der Server-Prozess schon Threads hat
+    app.state.pool = ProcessPoolExecutor(
+        max_workers=MAX_CONCURRENT_CONVERSIONS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_pipeline,
+    )
+    # Worker sofort starten, damit das Vorwärmen nicht die erste Anfrage trifft
+    for _ in range(MAX_CONCURRENT_CONVERSIONS):
+        app.state.pool.submit(os.getpid)
+    # Ein Aufräum-Task statt eines schlafenden Tasks pro Anfrage
+    janitor = asyncio.create_task(upload_janitor())
+    try:
+        yield
+    finally:
+        janitor.cancel()
+        for job in JOBS.values():
+            job.task.cancel()
+        app.state.pool.shutdown(wait=False, cancel_futures=True)
+        await app.state.http.aclose()
+
+
 # FastAPI App
 app = FastAPI(
     title="PPTX2UA Converter",
     description="DSGVO-konforme Konvertierung von PowerPoint zu barrierefreien PDFs",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
-# CORS für lokale Entwicklung
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class HTMLJSONGZipMiddleware(GZipMiddleware):
+    """GZip für HTML/JSON; PDF-Downloads gehen unkomprimiert raus."""
+
+    async def __call__(self, scope, receive, send):
+        # PDFs sind bereits komprimiert, GZip würde nur Range-Requests brechen
+        if scope["type"] == "http" and scope["path"].startswith("/api/download/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Kompression für HTML/JSON (bereits komprimierte Antworten bleiben unverändert)
+app.add_middleware(HTMLJSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# CORS nur, wenn erlaubte Origins konfiguriert sind (kommagetrennt, z.B.
+# PPTX2UA_CORS_ORIGINS="http://localhost:5173"). Die eigene UI ist
+# same-origin und braucht keine CORS-Header; ohne Eintrag entfällt die
+# Middleware und damit ein Durchlauf pro Anfrage.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("PPTX2UA_CORS_ORIGINS", "").split(",")
+    if origin.strip()
+]
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # Temp-Verzeichnis für Uploads
 UPLOAD_DIR = Path(tempfile.gettempdir()) / "pptx2ua_uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Blockgröße beim Speichern von Uploads
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Aufbewahrung der Dateien im Upload-Verzeichnis (Sekunden)
+INPUT_TTL = 300
+OUTPUT_TTL = 3600
+JANITOR_INTERVAL = 60
+
+# Anzahl uvicorn-Worker-Prozesse (setzt run_server für die Worker)
+SERVER_WORKERS = max(1, int(os.environ.get("PPTX2UA_SERVER_WORKERS") or 1))
+
+# Parallele Konvertierungen (je eine LibreOffice/Docling/veraPDF-Pipeline)
+# und wartende Anfragen begrenzen; darüber hinaus gibt es 503.
+# Die Grenzen gelten pro Worker-Prozess, daher auf die Worker aufgeteilt.
+MAX_CONCURRENT_CONVERSIONS = max(1, (os.cpu_count() or 2) // 2 // SERVER_WORKERS)
+MAX_PENDING_CONVERSIONS = 4 * MAX_CONCURRENT_CONVERSIONS
+BUSY_RETRY_AFTER = 30
+
+# Standardsprache der Upload-UI (wird beim Start vorgewärmt)
+DEFAULT_LANGUAGE = "de"
+
+
+@dataclass
+class ConversionJob:
+    """Eine angenommene Konvertierung (läuft im Hintergrund)."""
+    task: asyncio.Task
+    created: float = field(default_factory=time.monotonic)
+    started: bool = False
+
+
+# Laufende und abgeschlossene Jobs dieses Prozesses (job_id → ConversionJob).
+# Den Status gibt es zusätzlich als <job_id>_job.json im Upload-Verzeichnis,
+# damit bei mehreren Workern jeder Prozess jeden Job beantworten kann.
+JOBS: dict[str, ConversionJob] = {}
+
+# Gültigkeit des gecachten Backend-Status in Sekunden
+STATUS_TTL = 5
+_status_cache: Optional[tuple[int, dict]] = None
+
 
 # === HTML UI ===
 
@@ -481,11 +622,18 @@ HTML_TEMPLATE = """
                     body: formData
                 });
 
+                let data = await response.json();
+
+                // Konvertierung läuft im Hintergrund: Job-Status abfragen
+                while (data.success && data.status && data.status !== 'done') {
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    const jobResponse = await fetch('/api/jobs/' + data.job_id);
+                    data = await jobResponse.json();
+                }
+
                 clearInterval(progressInterval);
                 progressFill.style.width = '100%';
 
-                const data = await response.json();
-
                 progress.classList.remove('active');
                 result.classList.add('active');
 
@@ -539,106 +687,213 @@ HTML_TEMPLATE = """
 """
 
 
+# Startseite einmalig beim Import kodieren (und gzip-komprimieren),
+# inklusive fertiger Header – pro Anfrage wird nichts mehr berechnet
+# (Vary setzt bei unkomprimierten Antworten die GZipMiddleware selbst)
+_INDEX_BODY = HTML_TEMPLATE.encode("utf-8")
+_INDEX_BODY_GZIP = gzip.compress(_INDEX_BODY, compresslevel=9)
+_INDEX_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "Content-Length": str(len(_INDEX_BODY)),
+}
+_INDEX_GZIP_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "Content-Length": str(len(_INDEX_BODY_GZIP)),
+    "Content-Encoding": "gzip",
+    "Vary": "Accept-Encoding",
+}
+
+
 @app.get("/", response_class=HTMLResponse)
-async def index():
+async def index(request: Request):
     """Startseite mit Upload-UI."""
-    return HTML_TEMPLATE
+    # Neue Response je Anfrage (Middlewares ergänzen Header in-place),
+    # der Body ist aber schon fertig kodiert
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(_INDEX_BODY_GZIP, headers=_INDEX_GZIP_HEADERS)
+    return HTMLResponse(_INDEX_BODY, headers=_INDEX_HEADERS)
 
 
 @app.get("/api/status")
 async def get_status():
     """Gibt den Status der verfügbaren Backends zurück."""
-    # Check Docling
-    docling_available = False
-    try:
-        from .docling_integration import is_docling_available
-        docling_available = is_docling_available()
-    except:
-        pass
-
-    # Check Ollama
-    ollama_available = False
-    try:
-        import requests
-        r = requests.get("http://localhost:11434/api/tags", timeout=2)
-        ollama_available = r.status_code == 200
-    except:
-        pass
-
-    # Check veraPDF
-    verapdf_available = False
-    try:
-        validator = PDFUAValidator()
-        verapdf_available = validator.available
-    except:
-        pass
-
-    return {
-        "docling": docling_available,
-        "ollama": ollama_available,
-        "verapdf": verapdf_available,
-    }
+    global _status_cache
+    # Zeit-Bucket als Cache-Schlüssel: Anfrage-Bursts teilen sich eine Prüfung
+    bucket = int(time.monotonic() // STATUS_TTL)
+    if _status_cache is None or _status_cache[0] != bucket:
+        _status_cache = (bucket, await probe_backends(app.state.http))
+    return FastJSONResponse(_status_cache[1])
 
 
-@app.post("/api/convert")
+@app.post("/api/convert", status_code=202)
 async def convert_pptx(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     enable_ai: bool = Form(True),
     use_docling: bool = Form(True),
     validate: bool = Form(True),
-    language: str = Form("de"),
+    language: str = Form(DEFAULT_LANGUAGE),
 ):
-    """Konvertiert eine PPTX-Datei zu PDF/UA."""
+    """
+    Nimmt eine PPTX-Datei zur Konvertierung zu PDF/UA an.
+
+    Antwortet sofort mit 202 und einer job_id; das Ergebnis liefert
+    GET /api/jobs/{job_id}, sobald die Konvertierung fertig ist.
+    """
 
     # Validierung
     if not file.filename.endswith('.pptx'):
         raise HTTPException(status_code=400, detail="Nur PPTX-Dateien erlaubt")
 
+    # Überlast: lieber sofort ablehnen als die Warteschlange wachsen lassen
+    if app.state.convert_pending >= MAX_PENDING_CONVERSIONS:
+        return FastJSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(BUSY_RETRY_AFTER)},
+            content={
+                "success": False,
+                "error": "Server ausgelastet, bitte später erneut versuchen",
+            },
+        )
+
     # Temp-Dateien
-    import uuid
-    job_id = str(uuid.uuid4())[:8]
+    job_id = secrets.token_hex(4)
     input_path = UPLOAD_DIR / f"{job_id}_input.pptx"
     output_path = UPLOAD_DIR / f"{job_id}_output.pdf"
 
+    # Datei speichern (blockweise im Threadpool, nicht komplett im RAM);
+    # das muss noch während der Anfrage passieren, danach ist der Upload weg
     try:
-        # Datei speichern
-        with open(input_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        # Pipeline ausführen
-        result = run_conversion(
-            input_path=input_path,
-            output_path=output_path,
-            enable_ai=enable_ai,
-            use_docling=use_docling,
-            validate=validate,
-            language=language,
-        )
+        await run_in_threadpool(save_upload, file, input_path)
+    except Exception as e:
+        logger.exception("Upload konnte nicht gespeichert werden")
+        input_path.unlink(missing_ok=True)
+        return FastJSONResponse({
+            "success": False,
+            "error": str(e),
+        })
+
+    # Konvertierung als Hintergrund-Task starten, die Verbindung wird frei
+    app.state.convert_pending += 1
+    write_job_state(job_id, "queued")
+    JOBS[job_id] = ConversionJob(task=asyncio.create_task(run_job(
+        job_id,
+        input_path=input_path,
+        output_path=output_path,
+        enable_ai=enable_ai,
+        use_docling=use_docling,
+        validate=validate,
+        language=language,
+    )))
+
+    return FastJSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "job_id": job_id,
+            "status": "queued",
+        },
+    )
 
-        # Aufräumen der Input-Datei nach 5 Minuten
-        background_tasks.add_task(cleanup_file, input_path, delay=300)
 
-        # Output-Datei nach 1 Stunde aufräumen
-        background_tasks.add_task(cleanup_file, output_path, delay=3600)
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Gibt den Status bzw. das Ergebnis einer Konvertierung zurück."""
+    job = JOBS.get(job_id)
+    if job is not None:
+        if job.task.done():
+            status, result = "done", job.task.result()
+        else:
+            status, result = ("running" if job.started else "queued"), None
+    else:
+        # Job eines anderen Worker-Prozesses
+        state = read_job_state(job_id)
+        if state is None:
+            return FastJSONResponse(
+                status_code=404,
+                content={"success": False, "error": "Job nicht gefunden"},
+            )
+        status, result = state["status"], state.get("result")
+
+    if status != "done":
+        return FastJSONResponse({
+            "success": True,
+            "job_id": job_id,
+            "status": status,
+        })
+
+    return FastJSONResponse({"status": "done", **result})
 
-        return {
+
+def job_state_path(job_id: str) -> Path:
+    """Pfad der Status-Datei eines Jobs im Upload-Verzeichnis."""
+    return UPLOAD_DIR / f"{job_id}_job.json"
+
+
+def write_job_state(job_id: str, status: str, result: Optional[dict] = None):
+    """Schreibt den Job-Status atomar (für alle Worker-Prozesse lesbar)."""
+    path = job_state_path(job_id)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({"status": status, "result": result}))
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.exception("Job-Status konnte nicht gespeichert werden")
+
+
+def read_job_state(job_id: str) -> Optional[dict]:
+    """Liest den Job-Status (None wenn unbekannt oder abgelaufen)."""
+    try:
+        return json.loads(job_state_path(job_id).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+async def run_job(job_id: str, input_path: Path, output_path: Path, **options) -> dict:
+    """Führt eine angenommene Konvertierung aus und liefert die Job-Antwort."""
+    try:
+        # Pipeline im Prozess-Pool ausführen: der Event-Loop bleibt frei
+        # und mehrere Konvertierungen nutzen echt mehrere Kerne;
+        # der Semaphor begrenzt, wie viele Pipelines gleichzeitig laufen
+        async with app.state.convert_sem:
+            JOBS[job_id].started = True
+            write_job_state(job_id, "running")
+            result = await asyncio.get_running_loop().run_in_executor(
+                app.state.pool,
+                partial(
+                    run_conversion,
+                    input_path=input_path,
+                    output_path=output_path,
+                    **options,
+                ),
+            )
+
+        # Input wird nicht mehr gebraucht; die PDF räumt der
+        # upload_janitor() nach OUTPUT_TTL auf
+        input_path.unlink(missing_ok=True)
+
+        response = {
             "success": True,
             "download_id": job_id,
             "stats": result.get("stats", {}),
             "validation": result.get("validation", {}),
         }
+        write_job_state(job_id, "done", response)
+        return response
 
     except Exception as e:
         logger.exception("Konvertierung fehlgeschlagen")
         # Aufräumen bei Fehler
         input_path.unlink(missing_ok=True)
         output_path.unlink(missing_ok=True)
-        return {
+        response = {
             "success": False,
             "error": str(e),
         }
+        write_job_state(job_id, "done", response)
+        return response
+
+    finally:
+        app.state.convert_pending -= 1
 
 
 @app.get("/api/download/{job_id}")
@@ -646,16 +901,182 @@ async def download_pdf(job_id: str):
     """Lädt die konvertierte PDF herunter."""
     output_path = UPLOAD_DIR / f"{job_id}_output.pdf"
 
-    if not output_path.exists():
+    # Ein stat() für Existenz-Check, Content-Length und Last-Modified
+    try:
+        stat_result = os.stat(output_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Datei nicht gefunden")
 
     return FileResponse(
         path=output_path,
+        stat_result=stat_result,
         media_type="application/pdf",
         filename=f"converted_{job_id}.pdf",
     )
 
 
+async def probe_backends(http: httpx.AsyncClient) -> dict:
+    """Prüft, welche Backends verfügbar sind."""
+    # Docling-Import und veraPDF-Suche blockieren → Threadpool
+    docling_available, verapdf_available = await run_in_threadpool(probe_local_backends)
+
+    # Check Ollama
+    ollama_available = False
+    try:
+        r = await http.get(OLLAMA_TAGS_URL)
+        ollama_available = r.status_code == 200
+    except:
+        pass
+
+    return {
+        "docling": docling_available,
+        "ollama": ollama_available,
+        "verapdf": verapdf_available,
+    }
+
+
+def probe_local_backends() -> tuple[bool, bool]:
+    """Prüft die lokal installierten Backends (Docling, veraPDF)."""
+    # Check Docling
+    docling_available = False
+    try:
+        from .docling_integration import is_docling_available
+        docling_available = is_docling_available()
+    except:
+        pass
+
+    # Check veraPDF
+    verapdf_available = False
+    try:
+        verapdf_available = shared_validator().available
+    except:
+        pass
+
+    return docling_available, verapdf_available
+
+
+def save_upload(file: UploadFile, path: Path):
+    """Kopiert einen Upload auf die Platte."""
+    src = file.file
+    src.seek(0)
+    with open(path, "wb") as f:
+        # Große Uploads hat Starlette schon in eine Temp-Datei ausgelagert:
+        # dann kopiert der Kernel direkt, ohne Umweg über Python-Puffer.
+        # (Umbenennen geht nicht, die Temp-Datei hat unter Linux keinen Namen.)
+        # Datei-zu-Datei-sendfile gibt es nur unter Linux (macOS: ENOTSOCK).
+        if getattr(src, "_rolled", False) and sys.platform.startswith("linux"):
+            try:
+                _sendfile_all(src.fileno(), f.fileno())
+                return
+            except OSError:
+                # Von vorn mit normalem Kopieren
+                src.seek(0)
+                f.seek(0)
+                f.truncate()
+        shutil.copyfileobj(src, f, UPLOAD_CHUNK_SIZE)
+
+
+def _sendfile_all(in_fd: int, out_fd: int):
+    """Kopiert den ganzen Inhalt von in_fd per os.sendfile nach out_fd."""
+    size = os.fstat(in_fd).st_size
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
+# === Gemeinsame Pipeline-Instanzen ===
+# Einmal pro (Worker-)Prozess aufbauen statt pro Anfrage (Backend-Checks,
+# Fonts, veraPDF-Suche).
+# Parser, Enricher, Optimizer und Renderer halten Zustand pro Aufruf und
+# sind nicht threadsicher. run_conversion() läuft in den Pool-Workern, die
+# je nur eine Aufgabe gleichzeitig bearbeiten; wer es direkt aufruft, darf
+# es nicht aus mehreren Threads desselben Prozesses parallel tun.
+
+
+@lru_cache(maxsize=1)
+def shared_parser() -> PPTXParser:
+    return PPTXParser()
+
+
+def shared_enricher(language: str, backend: EnricherBackend) -> Enricher:
+    return _shared_ai_stage(
+        ("enricher", language, backend),
+        lambda: Enricher(EnricherConfig(backend=backend, language=language)),
+    )
+
+
+def shared_optimizer(language: str, use_docling: bool) -> AccessibilityOptimizer:
+    return _shared_ai_stage(
+        ("optimizer", language, use_docling),
+        lambda: AccessibilityOptimizer(AccessibilityConfig(
+            language=language,
+            use_docling=use_docling,
+        )),
+    )
+
+
+# KI-Stufen prüfen die Backends beim Anlegen; nicht erreichbare Backends
+# werden nach AI_RETRY_INTERVAL Sekunden mit einer neuen Instanz erneut
+# geprüft, statt bis zum Neustart ohne KI zu laufen
+AI_RETRY_INTERVAL = 30
+_AI_STAGES_MAX = 8
+_ai_stages: dict[tuple, tuple[object, float]] = {}
+_AI_STAGES_LOCK = threading.Lock()
+
+
+def _shared_ai_stage(key: tuple, factory):
+    """Gibt die geteilte KI-Stufe zu key zurück (Enricher oder Optimizer)."""
+    now = time.monotonic()
+    with _AI_STAGES_LOCK:
+        entry = _ai_stages.get(key)
+        if entry is None or (
+            not entry[0].is_available and now - entry[1] > AI_RETRY_INTERVAL
+        ):
+            entry = (factory(), now)
+            _ai_stages.pop(key, None)
+            _ai_stages[key] = entry
+            # Älteste Einträge verwerfen (Sprache kommt aus dem Formular)
+            while len(_ai_stages) > _AI_STAGES_MAX:
+                del _ai_stages[next(iter(_ai_stages))]
+        return entry[0]
+
+
+@lru_cache(maxsize=1)
+def shared_renderer() -> PDFUARenderer:
+    return PDFUARenderer(RendererConfig())
+
+
+@lru_cache(maxsize=1)
+def shared_validator() -> PDFUAValidator:
+    return PDFUAValidator()
+
+
+def warm_pipeline():
+    """Initializer der Worker-Prozesse: teure Imports und Instanzen vorziehen."""
+    shared_parser()
+    shared_renderer()
+    shared_validator()
+    try:
+        from .docling_integration import is_docling_available
+        is_docling_available()
+    except Exception:
+        pass
+
+    # KI-Stufen mit den Standardwerten der UI (Deutsch, Docling an)
+    try:
+        shared_enricher(DEFAULT_LANGUAGE, EnricherBackend.AUTO)
+        shared_optimizer(DEFAULT_LANGUAGE, True)
+    except Exception as e:
+        logger.warning("Vorwärmen der KI-Backends fehlgeschlagen: %s", e)
+
+    # LibreOffice-Profil anlegen (wird nur für Folienbilder gebraucht)
+    if is_libreoffice_available():
+        warm_libreoffice()
+
+
 def run_conversion(
     input_path: Path,
     output_path: Path,
@@ -672,46 +1093,47 @@ def run_conversion(
     }
 
     # 1. Parse
-    parser = PPTXParser()
-    model = parser.parse(input_path)
+    model = shared_parser().parse(input_path)
 
     result["stats"]["slides"] = model.slide_count
     result["stats"]["figures"] = len(model.all_figures)
 
+    # 2b (im Hintergrund). Folienbilder rendern, während Alt-Texte entstehen
+    slide_render = None
+    if enable_ai and is_libreoffice_available():
+        # Kein persistenter Cache: Folienbilder der Uploads sollen nicht
+        # länger liegen bleiben als die Uploads selbst
+        slide_render = populate_slide_images_in_background(model, input_path, use_cache=False)
+
     # 2. Enrich (Alt-Texte)
     if enable_ai:
         backend = EnricherBackend.AUTO if use_docling else EnricherBackend.OLLAMA
-        enricher = Enricher(EnricherConfig(
-            backend=backend,
-            language=language,
-        ))
+        enricher = shared_enricher(language, backend)
         if enricher.is_available:
+            # Statistik pro Anfrage, nicht über die geteilte Instanz summiert
+            enricher.reset_stats()
             model = enricher.enrich(model, verbose=False)
+            result["stats"]["alt_texts_generated"] = enricher.stats["generated"]
+            result["stats"]["alt_texts_cached"] = enricher.stats["from_cache"]
 
-    # 2b. Folienbilder für Vision-Analyse rendern
-    if enable_ai and is_libreoffice_available():
+    # 2b. Folienbilder für Vision-Analyse abholen
+    if slide_render is not None:
         try:
-            populate_slide_images(model, input_path)
-            result["stats"]["slide_images"] = sum(1 for s in model.slides if s.slide_image)
+            slide_render.result()
+            result["stats"]["slide_images"] = sum(1 for s in model.slides if s.has_slide_image)
         except Exception as e:
-            logger.warning(f"Slide rendering failed: {e}")
+            logger.warning("Slide rendering failed: %s", e)
 
     # 3. Accessibility Optimize
     if enable_ai:
-        optimizer = AccessibilityOptimizer(AccessibilityConfig(
-            language=language,
-            use_docling=use_docling,
-        ))
-        model = optimizer.optimize(model, verbose=False)
+        model = shared_optimizer(language, use_docling).optimize(model, verbose=False)
 
     # 4. Render
-    renderer = PDFUARenderer(RendererConfig())
-    renderer.render(model, output_path)
+    shared_renderer().render(model, output_path)
 
     # 5. Validate
     if validate:
-        validator = PDFUAValidator()
-        validation_result = validator.validate(output_path)
+        validation_result = shared_validator().validate(output_path)
         result["validation"] = {
             "compliant": validation_result.is_compliant,
             "errors": validation_result.errors,
@@ -721,17 +1143,66 @@ def run_conversion(
     return result
 
 
-async def cleanup_file(path: Path, delay: int = 0):
-    """Löscht eine Datei nach einer Verzögerung."""
-    if delay > 0:
-        await asyncio.sleep(delay)
-    path.unlink(missing_ok=True)
-
-
-def run_server(host: str = "0.0.0.0", port: int = 3003):
-    """Startet den Server."""
+def sweep_uploads(now: Optional[float] = None) -> int:
+    """Löscht abgelaufene Dateien im Upload-Verzeichnis (nach mtime)."""
+    now = time.time() if now is None else now
+    removed = 0
+    for entry in os.scandir(UPLOAD_DIR):
+        # Inputs wartender oder laufender Jobs (auch anderer Worker)
+        # nie löschen; die entfernt run_job() nach der Konvertierung
+        if entry.name.endswith("_input.pptx"):
+            state = read_job_state(entry.name[:-len("_input.pptx")])
+            if state is not None and state.get("status") != "done":
+                continue
+        # Verwaiste Inputs nach 5 Minuten, fertige PDFs und Job-Status nach 1 Stunde
+        ttl = OUTPUT_TTL if entry.name.endswith(("_output.pdf", "_job.json")) else INPUT_TTL
+        try:
+            if now - entry.stat().st_mtime > ttl:
+                os.unlink(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def prune_jobs(now: Optional[float] = None) -> int:
+    """Vergisst abgeschlossene Jobs, deren PDF nicht mehr vorgehalten wird."""
+    now = time.monotonic() if now is None else now
+    expired = [
+        job_id for job_id, job in JOBS.items()
+        if job.task.done() and now - job.created > OUTPUT_TTL
+    ]
+    for job_id in expired:
+        del JOBS[job_id]
+    return len(expired)
+
+
+async def upload_janitor():
+    """Räumt das Upload-Verzeichnis und die Job-Liste periodisch auf."""
+    while True:
+        await asyncio.sleep(JANITOR_INTERVAL)
+        prune_jobs()
+        try:
+            await run_in_threadpool(sweep_uploads)
+        except Exception:
+            logger.exception("Aufräumen des Upload-Verzeichnisses fehlgeschlagen")
+
+
+def run_server(host: str = "0.0.0.0", port: int = 3003, workers: int = 1):
+    """
+    Startet den Server.
+    
+    Args:
+        host: Bind-Adresse
+        port: Port
+        workers: Anzahl Worker-Prozesse (>1 für Multi-Core-Hosts)
+    """
     import uvicorn
 
+    # Die Worker-Prozesse importieren das Modul neu und teilen die
+    # Konvertierungs-Slots danach auf (siehe MAX_CONCURRENT_CONVERSIONS)
+    os.environ["PPTX2UA_SERVER_WORKERS"] = str(workers)
+
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                     PPTX2UA Server                           ║
@@ -743,7 +1214,19 @@ def run_server(host: str = "0.0.0.0", port: int = 3003):
 ╚══════════════════════════════════════════════════════════════╝
     """)
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    uvicorn.run(
+        # Mehrere Worker brauchen einen Import-String statt der App-Instanz
+        "pptx2ua.server:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        log_level="info",
+        # "auto" wählt uvloop/httptools, sofern installiert (uvicorn[standard])
+        loop="auto",
+        http="auto",
+        workers=workers,
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
 
 
 if __name__ == "__main__":
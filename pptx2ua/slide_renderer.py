@@ -5,33 +5,67 @@ Slide Image Renderer
 Rendert PPTX-Folien als Bilder für Vision-LLM Analyse.
 
 Nutzt LibreOffice im Headless-Modus für hochwertige Konvertierung.
+Ist die UNO-Bridge (Python-Modul `uno`) verfügbar, läuft eine dauerhafte
+LibreOffice-Instanz pro Prozess; sonst wird pro Datei soffice gestartet.
 Fallback: Extrahiert Thumbnails aus der PPTX wenn vorhanden.
 """
 
+import atexit
+import os
+import re
+import socket
 import subprocess
 import tempfile
 import shutil
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 import zipfile
 import io
 
+from .cache import get_cache_dir, file_digest, prune_cache, touch_entry
 from .models import SlideModel, Slide
 
+# Optional: UNO-Bridge zu einer dauerhaft laufenden LibreOffice-Instanz
+# (Debian/Ubuntu: python3-uno, sonst LibreOffice-eigenes Python)
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    _uno_available = True
+except ImportError:
+    _uno_available = False
+
+# Optional: fcntl für die Sperre fester LibreOffice-Profile (nur Unix)
+try:
+    import fcntl
+    _fcntl_available = True
+except ImportError:
+    _fcntl_available = False
+
+# Optional: pypdfium2 rastert PDFs im Prozess (statt pdftoppm-Aufruf)
+try:
+    import pypdfium2 as pdfium
+    _pdfium_available = True
+except ImportError:
+    _pdfium_available = False
+
 
 def is_libreoffice_available() -> bool:
     """Prüft ob LibreOffice installiert ist."""
-    # macOS
-    if Path("/Applications/LibreOffice.app").exists():
-        return True
-    # Linux
-    if shutil.which("libreoffice") or shutil.which("soffice"):
-        return True
-    return False
+    return get_libreoffice_command() is not None
 
 
+@lru_cache(maxsize=1)
 def get_libreoffice_command() -> Optional[str]:
-    """Gibt den LibreOffice-Befehl zurück."""
+    """
+    Gibt den LibreOffice-Befehl zurück.
+
+    Einmal pro Prozess ermittelt (stat + PATH-Suche);
+    refresh_libreoffice() sucht erneut.
+    """
     # macOS
     macos_path = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
     if Path(macos_path).exists():
@@ -44,6 +78,308 @@ def get_libreoffice_command() -> Optional[str]:
     return None
 
 
+def refresh_libreoffice() -> Optional[str]:
+    """Verwirft das Suchergebnis (z.B. nach Installation oder PATH-Änderung)."""
+    get_libreoffice_command.cache_clear()
+    return get_libreoffice_command()
+
+
+_profile_local = threading.local()
+
+# Foliennummer in LibreOffice-/pdftoppm-Dateinamen (slide-3.png)
+_SLIDE_NUMBER_RE = re.compile(r"(\d+)")
+
+# Eingebettete Vorschaubilder (docProps/thumbnail.jpeg, thumbnail2.png, ...)
+_THUMBNAIL_RE = re.compile(r"thumbnail(\d*)\.(?:jpe?g|png)$", re.IGNORECASE)
+
+# zlib-Stufe für selbst gerasterte PNGs: schnell kodieren, die Bilder sind
+# nur Zwischenstufe für die Vision-Analyse (Standard von Pillow wäre 6)
+PNG_COMPRESS_LEVEL = 1
+
+
+def get_profile_argument() -> str:
+    """
+    Gibt das -env:UserInstallation-Argument für das LibreOffice-Profil
+    dieses Threads zurück.
+
+    LibreOffice sperrt sein Profil: ein zweiter soffice-Start mit dem
+    Benutzerprofil übergibt den Auftrag an die laufende Instanz oder
+    scheitert. Parallele Aufrufe brauchen daher eigene Profile.
+    """
+    profile_dir = getattr(_profile_local, "profile_dir", None)
+    if profile_dir is None:
+        profile_dir = _acquire_profile_dir()
+        _profile_local.profile_dir = profile_dir
+    return f"-env:UserInstallation={profile_dir.as_uri()}"
+
+
+# Feste Profil-Slots pro Benutzer (gleichzeitige soffice-Prozesse)
+_PROFILE_SLOTS = 32
+
+# Offene Lock-Dateien halten ihre Slots bis zum Prozessende
+_profile_locks = []
+
+
+def _acquire_profile_dir() -> Path:
+    """
+    Reserviert ein LibreOffice-Profilverzeichnis.
+
+    Bevorzugt einen festen Slot im Cache (<cache>/libreoffice/profile-N),
+    per flock gesperrt solange der Prozess läuft: spätere Läufe finden ein
+    schon angelegtes Profil vor. Ohne Cache oder flock ein Temp-Verzeichnis,
+    das beim Prozessende gelöscht wird.
+    """
+    base = get_cache_dir("libreoffice")
+    if base is not None and _fcntl_available:
+        try:
+            base.mkdir(parents=True, exist_ok=True)
+            for slot in range(_PROFILE_SLOTS):
+                lock_file = open(base / f"profile-{slot}.lock", "w")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_file.close()
+                    continue
+                _profile_locks.append(lock_file)
+                return base / f"profile-{slot}"
+        except OSError:
+            pass
+
+    profile_dir = Path(tempfile.mkdtemp(prefix="pptx2ua_lo_profile_"))
+    atexit.register(shutil.rmtree, profile_dir, True)
+    return profile_dir
+
+
+# Export-Filter von Impress je Zielformat
+_EXPORT_FILTERS = {
+    "pdf": "impress_pdf_Export",
+    "png": "impress_png_Export",
+    "jpg": "impress_jpg_Export",
+}
+
+
+def _uno_properties(**values) -> tuple:
+    """Baut ein Tupel von UNO-PropertyValues."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _free_port() -> int:
+    """Sucht einen freien lokalen TCP-Port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _LibreOfficeServer:
+    """
+    Dauerhaft laufende LibreOffice-Instanz, gesteuert über UNO.
+
+    Spart den Kaltstart von soffice (mehrere Sekunden) bei jeder Datei.
+    Wird beim ersten Gebrauch gestartet und beim Prozessende beendet.
+    Jeder Prozess bekommt einen eigenen Port und ein eigenes Profil (siehe
+    _acquire_profile_dir), damit sich parallele Worker nicht gegenseitig
+    Aufträge übergeben.
+    """
+
+    STARTUP_TIMEOUT = 30  # Sekunden
+    CONVERT_TIMEOUT = 120  # Sekunden, wie beim einzeln gestarteten soffice
+
+    _instance: Optional["_LibreOfficeServer"] = None
+    _instance_lock = threading.Lock()
+    _start_failed = False
+
+    def __init__(self, soffice: str):
+        self.soffice = soffice
+        self.port = _free_port()
+        self.profile_dir = _acquire_profile_dir()
+        self._process: Optional[subprocess.Popen] = None
+        self._desktop = None
+        # Eine Instanz bearbeitet Dokumente nacheinander
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> Optional["_LibreOfficeServer"]:
+        """Gibt die laufende Instanz zurück (startet sie bei Bedarf) oder None."""
+        if not _uno_available or cls._start_failed:
+            return None
+
+        with cls._instance_lock:
+            if cls._instance is None:
+                soffice = get_libreoffice_command()
+                if not soffice:
+                    return None
+                server = cls(soffice)
+                if not server.start():
+                    # Nicht bei jeder Datei erneut den Start abwarten
+                    cls._start_failed = True
+                    return None
+                atexit.register(server.stop)
+                cls._instance = server
+            return cls._instance
+
+    @classmethod
+    def discard(cls):
+        """Beendet die Instanz (z.B. nach Absturz); der nächste Aufruf startet neu."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def start(self) -> bool:
+        """Startet soffice mit UNO-Listener und verbindet sich."""
+        self._process = subprocess.Popen(
+            [
+                self.soffice,
+                f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nofirststartwizard",
+                f"--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ServiceManager",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+
+        # Warten bis der Listener bereit ist
+        deadline = time.monotonic() + self.STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                return False
+            try:
+                context = resolver.resolve(url)
+            except Exception:
+                time.sleep(0.25)
+                continue
+            self._desktop = context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context
+            )
+            return True
+
+        self.stop()
+        return False
+
+    def convert(self, pptx_path: Path, output_dir: Path, format: str) -> Optional[Path]:
+        """
+        Konvertiert eine PPTX über die laufende Instanz.
+
+        Returns:
+            Pfad der Ausgabedatei (<stem>.<format>) oder None wenn das
+            Format nicht unterstützt wird
+        """
+        filter_name = _EXPORT_FILTERS.get(format)
+        if filter_name is None or self._desktop is None:
+            return None
+
+        output_path = output_dir / f"{pptx_path.stem}.{format}"
+        with self._lock:
+            # UNO-Aufrufe haben kein Timeout: hängt LibreOffice an einem
+            # Dokument, beendet der Watchdog den Prozess, der Aufruf bricht
+            # mit einer Exception ab und der Lock wird wieder frei
+            timed_out = threading.Event()
+            watchdog = threading.Timer(self.CONVERT_TIMEOUT, self._kill, args=(timed_out,))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                document = self._desktop.loadComponentFromURL(
+                    pptx_path.resolve().as_uri(), "_blank", 0, _uno_properties(Hidden=True)
+                )
+                try:
+                    document.storeToURL(
+                        output_path.resolve().as_uri(), _uno_properties(FilterName=filter_name)
+                    )
+                finally:
+                    document.close(True)
+            except Exception:
+                if timed_out.is_set():
+                    raise TimeoutError(
+                        f"Keine Antwort nach {self.CONVERT_TIMEOUT}s"
+                    ) from None
+                raise
+            finally:
+                watchdog.cancel()
+        return output_path
+
+    def _kill(self, timed_out: threading.Event):
+        """Watchdog: beendet einen hängenden LibreOffice-Prozess."""
+        timed_out.set()
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+
+    def stop(self):
+        """Beendet LibreOffice."""
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass
+            self._desktop = None
+
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+
+def _convert_via_server(pptx_path: Path, output_dir: Path, format: str) -> bool:
+    """Konvertiert über die dauerhafte LibreOffice-Instanz, falls verfügbar."""
+    server = _LibreOfficeServer.instance()
+    if server is None:
+        return False
+
+    try:
+        return server.convert(pptx_path, output_dir, format) is not None
+    except Exception as e:
+        print(f"   ⚠️  LibreOffice-Instanz fehlgeschlagen, starte soffice einzeln: {e}")
+        _LibreOfficeServer.discard()
+        return False
+
+
+def warm_libreoffice() -> bool:
+    """
+    Startet LibreOffice einmal headless und beendet es gleich wieder.
+
+    Legt dabei das Profil aus get_profile_argument() an und lädt die
+    Programmdateien in den OS-Cache, damit die erste echte Konvertierung
+    nicht den Kaltstart bezahlt.
+    """
+    soffice = get_libreoffice_command()
+    if not soffice:
+        return False
+
+    # Mit UNO-Bridge gleich die dauerhafte Instanz starten
+    if _LibreOfficeServer.instance() is not None:
+        return True
+
+    try:
+        subprocess.run(
+            [soffice, get_profile_argument(), "--headless", "--terminate_after_init"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=120,
+        )
+        return True
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+
 def render_slides_to_images(
     pptx_path: Path,
     output_dir: Optional[Path] = None,
@@ -76,35 +412,35 @@ def render_slides_to_images(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        # LibreOffice Headless-Konvertierung
-        # Konvertiert zu PDF erst, dann zu Bildern
-        cmd = [
-            soffice,
-            "--headless",
-            "--convert-to", format,
-            "--outdir", str(output_dir),
-            str(pptx_path)
-        ]
+        # LibreOffice Headless-Konvertierung: über die dauerhafte Instanz,
+        # sonst mit eigenem soffice-Prozess
+        if not _convert_via_server(pptx_path, output_dir, format):
+            cmd = [
+                soffice,
+                get_profile_argument(),
+                "--headless",
+                "--convert-to", format,
+                "--outdir", str(output_dir),
+                str(pptx_path)
+            ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120  # 2 Minuten Timeout
-        )
+            # stdout wird nie gelesen, stderr nur im Fehlerfall dekodiert
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=120  # 2 Minuten Timeout
+            )
 
-        if result.returncode != 0:
-            print(f"   ⚠️  LibreOffice Fehler: {result.stderr}")
-            return []
+            if result.returncode != 0:
+                print(f"   ⚠️  LibreOffice Fehler: {result.stderr.decode('utf-8', 'replace')}")
+                return []
 
         # Finde generierte Bilder
         # LibreOffice benennt sie: presentation-1.png, presentation-2.png, etc.
         # Oder einfach: presentation.png für einzelne Folie
 
-        image_files = sorted(
-            output_dir.glob(f"*.{format}"),
-            key=lambda p: _extract_slide_number(p.name)
-        )
+        image_files = _sort_by_slide_number(output_dir.glob(f"*.{format}"))
 
         return image_files
 
@@ -138,55 +474,169 @@ def render_pptx_via_pdf(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Schritt 1: PPTX → PDF
-        pdf_cmd = [
-            soffice,
-            "--headless",
-            "--convert-to", "pdf",
-            "--outdir", str(output_dir),
-            str(pptx_path)
-        ]
+        # Schritt 1: PPTX → PDF (dauerhafte Instanz oder eigener Prozess)
+        if not _convert_via_server(pptx_path, output_dir, "pdf"):
+            pdf_cmd = [
+                soffice,
+                get_profile_argument(),
+                "--headless",
+                "--convert-to", "pdf",
+                "--outdir", str(output_dir),
+                str(pptx_path)
+            ]
 
-        subprocess.run(pdf_cmd, capture_output=True, timeout=120)
+            subprocess.run(
+                pdf_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120
+            )
 
         pdf_path = output_dir / f"{pptx_path.stem}.pdf"
         if not pdf_path.exists():
             return []
 
-        # Schritt 2: PDF → PNGs mit pdftoppm (wenn verfügbar)
-        if shutil.which("pdftoppm"):
-            img_prefix = output_dir / "slide"
-            png_cmd = [
-                "pdftoppm",
-                "-png",
-                "-r", str(dpi),
-                str(pdf_path),
-                str(img_prefix)
-            ]
-            subprocess.run(png_cmd, capture_output=True, timeout=60)
+        # Schritt 2: PDF → PNGs
+        return _rasterize_pdf(pdf_path, output_dir, dpi)
+
+    except Exception as e:
+        print(f"   ⚠️  PDF-Render-Fehler: {e}")
+        return []
 
-            return sorted(output_dir.glob("slide-*.png"))
 
-        # Fallback: pdf2image Python-Bibliothek
+def _rasterize_pdf(pdf_path: Path, output_dir: Path, dpi: int = 150) -> list[Path]:
+    """Rendert die Seiten eines PDFs als slide-N.png."""
+    # pypdfium2 im Prozess: kein Prozessstart pro Dokument bzw. Seite
+    if _pdfium_available:
         try:
-            from pdf2image import convert_from_path
-            images = convert_from_path(pdf_path, dpi=dpi)
+            return _rasterize_pdf_pdfium(pdf_path, output_dir, dpi)
+        except Exception as e:
+            print(f"   ⚠️  pdfium-Rendering fehlgeschlagen: {e}")
 
-            image_paths = []
-            for i, img in enumerate(images, 1):
-                img_path = output_dir / f"slide-{i:03d}.png"
-                img.save(img_path, "PNG")
-                image_paths.append(img_path)
+    # pdftoppm (wenn verfügbar)
+    if shutil.which("pdftoppm"):
+        img_prefix = output_dir / "slide"
+        png_cmd = [
+            "pdftoppm",
+            "-png",
+            "-r", str(dpi),
+            str(pdf_path),
+            str(img_prefix)
+        ]
+        subprocess.run(
+            png_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60
+        )
 
-            return image_paths
-        except ImportError:
-            pass
+        return _sort_by_slide_number(output_dir.glob("slide-*.png"))
 
-        return []
+    # Fallback: pdf2image Python-Bibliothek
+    try:
+        from pdf2image import convert_from_path
+        images = convert_from_path(pdf_path, dpi=dpi)
 
-    except Exception as e:
-        print(f"   ⚠️  PDF-Render-Fehler: {e}")
-        return []
+        image_paths = []
+        for i, img in enumerate(images, 1):
+            img_path = output_dir / f"slide-{i:03d}.png"
+            img.save(img_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            image_paths.append(img_path)
+
+        return image_paths
+    except ImportError:
+        pass
+
+    return []
+
+
+def _rasterize_pdf_pdfium(pdf_path: Path, output_dir: Path, dpi: int) -> list[Path]:
+    """Rastert ein PDF mit pypdfium2 zu slide-NNN.png."""
+    image_paths = []
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for i, page in enumerate(pdf, 1):
+            bitmap = page.render(scale=dpi / 72)
+            img_path = output_dir / f"slide-{i:03d}.png"
+            bitmap.to_pil().save(img_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            image_paths.append(img_path)
+            page.close()
+    finally:
+        pdf.close()
+    return image_paths
+
+
+def render_batch(
+    pptx_paths: list[Path],
+    output_dir: Path,
+    format: str = "png",
+    batch_size: int = 10
+) -> dict[Path, Optional[Path]]:
+    """
+    Konvertiert mehrere PPTX-Dateien mit einem soffice-Aufruf pro Batch.
+
+    soffice --convert-to nimmt mehrere Eingabedateien; so fällt der
+    LibreOffice-Start nur einmal pro Batch an. Ein Timeout kostet nur den
+    betroffenen Batch.
+
+    Args:
+        pptx_paths: Pfade zu den PPTX-Dateien
+        output_dir: Ausgabeverzeichnis (je Batch ein Unterordner)
+        format: Zielformat (pdf, png, ...)
+        batch_size: Maximale Dateien pro soffice-Aufruf
+
+    Returns:
+        Dict PPTX-Pfad → Ausgabedatei (None wenn die Konvertierung fehlschlug)
+    """
+    results: dict[Path, Optional[Path]] = {Path(p): None for p in pptx_paths}
+
+    soffice = get_libreoffice_command()
+    if not soffice:
+        print("   ⚠️  LibreOffice nicht gefunden - Folienbilder nicht verfügbar")
+        return results
+
+    for n, batch in enumerate(_batches(list(results), batch_size)):
+        # Eigener Ordner je Batch: gleiche Dateinamen überschreiben sich nicht
+        batch_dir = output_dir / f"batch-{n:03d}"
+        batch_dir.mkdir(parents=True, exist_ok=True)
+
+        # Dauerhafte Instanz (ohne Startkosten), Rest in einem soffice-Aufruf
+        remaining = [p for p in batch if not _convert_via_server(p, batch_dir, format)]
+        if remaining:
+            cmd = [
+                soffice,
+                get_profile_argument(),
+                "--headless",
+                "--convert-to", format,
+                "--outdir", str(batch_dir),
+                *map(str, remaining)
+            ]
+            try:
+                subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=60 + 30 * len(remaining)
+                )
+            except subprocess.TimeoutExpired:
+                print(f"   ⚠️  LibreOffice Timeout (Batch mit {len(remaining)} Dateien)")
+            except Exception as e:
+                print(f"   ⚠️  Render-Fehler: {e}")
+
+        for p in batch:
+            output_path = batch_dir / f"{p.stem}.{format}"
+            if output_path.exists():
+                results[p] = output_path
+
+    return results
+
+
+def _batches(paths: list[Path], batch_size: int):
+    """Teilt Pfade in Batches; gleiche Dateinamen landen nie im selben Batch."""
+    batch: list[Path] = []
+    stems: set[str] = set()
+    for p in paths:
+        if len(batch) >= batch_size or p.stem in stems:
+            yield batch
+            batch, stems = [], set()
+        batch.append(p)
+        stems.add(p.stem)
+    if batch:
+        yield batch
 
 
 def extract_pptx_thumbnails(pptx_path: Path) -> list[bytes]:
@@ -195,18 +645,22 @@ def extract_pptx_thumbnails(pptx_path: Path) -> list[bytes]:
 
     PowerPoint speichert manchmal Slide-Thumbnails in:
     - docProps/thumbnail.jpeg (nur Titelbild)
-    - ppt/media/ (alle Medien)
+    - weiteren thumbnail*-Einträgen (je nach erzeugendem Programm)
+
+    Bilder aus ppt/media/ sind Folieninhalte, keine Folienansichten, und
+    werden deshalb nicht berücksichtigt.
 
     Returns:
-        Liste von Bild-Bytes (oft leer, da PPTX keine Slide-Thumbnails speichert)
+        Liste von Bild-Bytes, Titelbild zuerst (oft nur eins oder leer)
     """
     thumbnails = []
 
     try:
-        with zipfile.ZipFile(pptx_path, 'r') as zf:
-            # Titelbild
-            if 'docProps/thumbnail.jpeg' in zf.namelist():
-                thumbnails.append(zf.read('docProps/thumbnail.jpeg'))
+        names = _pptx_thumbnail_names(pptx_path)
+        # Ohne Thumbnails das Archiv gar nicht erst öffnen
+        if names:
+            with zipfile.ZipFile(pptx_path, 'r') as zf:
+                thumbnails = [zf.read(name) for name in names]
 
     except Exception as e:
         print(f"   Thumbnail-Extraktion fehlgeschlagen: {e}")
@@ -214,47 +668,334 @@ def extract_pptx_thumbnails(pptx_path: Path) -> list[bytes]:
     return thumbnails
 
 
-def populate_slide_images(model: SlideModel, pptx_path: Path) -> bool:
+def _pptx_thumbnail_names(pptx_path: Path) -> tuple[str, ...]:
+    """Thumbnail-Einträge der PPTX, Titelbild zuerst (gecacht pro Dateistand)."""
+    stat = os.stat(pptx_path)
+    return _thumbnail_names(str(pptx_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _thumbnail_names(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    # mtime und Größe im Schlüssel: geänderte Datei = neuer Eintrag
+    with zipfile.ZipFile(path, 'r') as zf:
+        names = [name for name in zf.namelist() if _THUMBNAIL_RE.search(name)]
+    # Titelbild (docProps) zuerst, dann nach Nummer
+    names.sort(key=lambda name: (
+        not name.startswith("docProps/"),
+        int(_THUMBNAIL_RE.search(name).group(1) or 0),
+        name,
+    ))
+    return tuple(names)
+
+
+def render_many(
+    pptx_paths: list[Path],
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    dpi: int = 150
+) -> dict[Path, list[Path]]:
+    """
+    Rendert mehrere PPTX-Dateien parallel als Folienbilder.
+
+    Args:
+        pptx_paths: Pfade zu den PPTX-Dateien
+        output_dir: Ausgabeverzeichnis (oder temp), je Datei ein Unterordner
+        workers: Parallele soffice-Prozesse (Standard: halbe Kernzahl)
+        dpi: Auflösung
+
+    Returns:
+        Dict PPTX-Pfad → Bildpfade (leer wenn das Rendern fehlschlug)
+    """
+    paths = [Path(p) for p in pptx_paths]
+    return dict(zip(paths, _render_decks(paths, output_dir, workers, dpi)))
+
+
+def _render_decks(
+    pptx_paths: list[Path],
+    output_dir: Optional[Path],
+    workers: Optional[int],
+    dpi: int
+) -> list[list[Path]]:
+    """Rendert mehrere Präsentationen, Ergebnis in Eingabereihenfolge."""
+    if output_dir is None:
+        output_dir = Path(tempfile.mkdtemp(prefix="pptx2ua_slides_"))
+
+    # Je Datei ein eigener Ordner: gleichnamige Dateien kollidieren sonst
+    output_dirs = [output_dir / f"deck-{i:04d}" for i in range(len(pptx_paths))]
+    dpis = [dpi] * len(pptx_paths)
+
+    if len(pptx_paths) <= 1:
+        return list(map(_render_deck, pptx_paths, output_dirs, dpis))
+
+    # Dateien reihum auf die Worker verteilen; jeder Worker konvertiert
+    # seinen Anteil gebündelt (render_batch) statt soffice pro Datei
+    workers = min(workers or max(1, (os.cpu_count() or 2) // 2), len(pptx_paths))
+    groups = [
+        (pptx_paths[i::workers], output_dirs[i::workers], dpi)
+        for i in range(workers)
+    ]
+    if workers == 1:
+        group_results = [_render_deck_group(*groups[0])]
+    else:
+        # Jeder Worker-Prozess startet sein eigenes soffice mit eigenem Profil
+        # (get_profile_argument() ist pro Prozess/Thread) – ein zweites soffice
+        # auf demselben Profil würde die Arbeit ans erste abgeben und mit 0 enden
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            group_results = list(pool.map(_render_deck_group, *zip(*groups)))
+
+    # Zurück in Eingabereihenfolge
+    results: list[list[Path]] = [[] for _ in pptx_paths]
+    for i, group_result in enumerate(group_results):
+        results[i::workers] = group_result
+    return results
+
+
+def _render_deck_group(
+    pptx_paths: list[Path],
+    output_dirs: list[Path],
+    dpi: int
+) -> list[list[Path]]:
+    """Rendert mehrere Präsentationen mit gebündelter PDF-Konvertierung."""
+    pdf_dir = output_dirs[0].parent / f"pdf-{os.getpid()}"
+    pdf_paths = render_batch(pptx_paths, pdf_dir, format="pdf")
+
+    results = []
+    for pptx_path, output_dir in zip(pptx_paths, output_dirs):
+        image_paths: list[Path] = []
+        pdf_path = pdf_paths.get(pptx_path)
+        if pdf_path is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            image_paths = _rasterize_pdf(pdf_path, output_dir, dpi)
+
+        # Nur nachrendern, wenn es gar keine Bilder gab (eine einzelne
+        # Folie ist ein gültiges Ergebnis): ohne PDF den ganzen Einzelweg,
+        # mit PDF nur noch den direkten PNG-Export
+        if not image_paths:
+            if pdf_path is None:
+                image_paths = _render_deck(pptx_path, output_dir, dpi)
+            else:
+                image_paths = render_slides_to_images(pptx_path, output_dir, dpi)
+        results.append(image_paths)
+    return results
+
+
+def _render_deck(pptx_path: Path, output_dir: Path, dpi: int = 150) -> list[Path]:
+    """Rendert eine Präsentation als Folienbilder (PDF-Umweg, sonst direkt)."""
+    # Methode 1: Über PDF (zuverlässiger für mehrere Seiten)
+    # LibreOffice PNG-Export erstellt nur 1 Bild für ganze Präsentation
+    image_paths = render_pptx_via_pdf(pptx_path, output_dir, dpi)
+
+    # Methode 2: Direkte PNG falls PDF fehlschlägt
+    if not image_paths or len(image_paths) == 1:
+        image_paths_direct = render_slides_to_images(pptx_path, output_dir, dpi)
+        if len(image_paths_direct) > len(image_paths):
+            image_paths = image_paths_direct
+
+    return image_paths
+
+
+class _ThumbnailCache:
+    """
+    Gerenderte Folienbilder auf Platte, Schlüssel: Inhalt der PPTX + Auflösung.
+
+    Ein erneuter Aufruf für eine unveränderte Präsentation liest nur noch
+    Dateien statt LibreOffice zu starten. Abschaltbar mit PPTX2UA_NO_CACHE=1,
+    begrenzt über cache.prune_cache().
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        if not enabled:
+            self.cache_dir = None
+        else:
+            self.cache_dir = cache_dir if cache_dir is not None else get_cache_dir("slides")
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def key(self, pptx_path: Path, dpi: int, format: str = "png") -> Optional[str]:
+        """Cache-Schlüssel aus Dateiinhalt, Auflösung und Format."""
+        if not self.enabled:
+            return None
+        try:
+            return f"{file_digest(pptx_path)}-{dpi}-{format}"
+        except OSError:
+            return None
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> Optional[list[Path]]:
+        """Gibt die gecachten Bildpfade in Folienreihenfolge zurück."""
+        entry = self._entry_dir(key)
+        if not entry.is_dir():
+            return None
+        images = _sort_by_slide_number(entry.glob("slide-*.png"))
+        if images:
+            touch_entry(entry)
+        return images or None
+
+    def prune(self):
+        """Hält den Cache unter Größen- und Altersgrenze."""
+        try:
+            prune_cache(self.cache_dir.glob("*/*"))
+        except OSError as e:
+            print(f"   ⚠️  Folienbild-Cache nicht aufräumbar: {e}")
+
+    def put(self, key: str, image_paths: list[Path]) -> list[Path]:
+        """Legt Bilder im Cache ab und gibt die Cache-Pfade zurück."""
+        # Schon vorhanden (z.B. paralleler Lauf): nicht erneut speichern
+        cached = self.get(key)
+        if cached:
+            return cached
+
+        entry = self._entry_dir(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # In ein Temp-Verzeichnis kopieren und atomar umbenennen,
+            # damit nie ein halb geschriebener Eintrag gelesen wird
+            tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+            for i, image_path in enumerate(image_paths, 1):
+                shutil.copyfile(image_path, tmp_dir / f"slide-{i:03d}.png")
+            try:
+                os.replace(tmp_dir, entry)
+            except OSError:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except OSError as e:
+            print(f"   ⚠️  Folienbild-Cache nicht beschreibbar: {e}")
+            return image_paths
+
+        self.prune()
+        return self.get(key) or image_paths
+
+
+def populate_slide_images(
+    model: SlideModel | list[SlideModel],
+    pptx_path: Path | list[Path],
+    workers: Optional[int] = None,
+    quality: Literal["preview", "full"] = "full",
+    use_cache: bool = True
+) -> bool:
     """
     Rendert alle Folien und speichert die Bilder im SlideModel.
 
     Args:
-        model: Das SlideModel das erweitert wird
-        pptx_path: Pfad zur Original-PPTX
+        model: Das SlideModel das erweitert wird (oder eine Liste davon)
+        pptx_path: Pfad zur Original-PPTX (oder Liste passend zu model)
+        workers: Parallele soffice-Prozesse bei mehreren Dateien
+        quality: "preview" nutzt eingebettete Thumbnails, wenn es für jede
+            Folie eins gibt, und startet LibreOffice nur sonst
+        use_cache: Folienbilder im persistenten Cache ablegen/suchen
+            (der Server schaltet das ab, Uploads bleiben nur kurz liegen)
 
     Returns:
-        True wenn erfolgreich
+        True wenn erfolgreich (bei Listen: für alle Dateien)
     """
+    models = model if isinstance(model, list) else [model]
+    pptx_paths = pptx_path if isinstance(pptx_path, list) else [pptx_path]
+
+    # Vorschau reicht: eingebettete Thumbnails statt LibreOffice
+    if quality == "preview":
+        pending = []
+        for slide_model, path in zip(models, pptx_paths):
+            # Erst die Einträge zählen, Bilder nur bei passender Anzahl lesen
+            try:
+                count = len(_pptx_thumbnail_names(path))
+            except Exception:
+                count = 0
+            thumbnails = extract_pptx_thumbnails(path) if count == len(slide_model.slides) else []
+            if thumbnails and len(thumbnails) == len(slide_model.slides):
+                slides = sorted(slide_model.slides, key=lambda s: s.number)
+                for slide, image in zip(slides, thumbnails):
+                    slide.slide_image = image
+            else:
+                pending.append((slide_model, path))
+
+        if not pending:
+            return True
+        models = [slide_model for slide_model, _ in pending]
+        pptx_paths = [path for _, path in pending]
+
+    # Unveränderte Präsentationen kommen aus dem Cache
+    cache = _ThumbnailCache(enabled=use_cache)
+    keys = [cache.key(Path(p), 150) for p in pptx_paths]
+    all_image_paths = [cache.get(key) if key else None for key in keys]
+    missing = [i for i, image_paths in enumerate(all_image_paths) if image_paths is None]
+
     # Versuche LibreOffice Rendering
     with tempfile.TemporaryDirectory(prefix="pptx2ua_") as tmpdir:
-        output_dir = Path(tmpdir)
+        if missing:
+            rendered = _render_decks(
+                [Path(pptx_paths[i]) for i in missing], Path(tmpdir), workers, 150
+            )
+            for i, image_paths in zip(missing, rendered):
+                if image_paths and keys[i]:
+                    image_paths = cache.put(keys[i], image_paths)
+                all_image_paths[i] = image_paths
 
-        # Methode 1: Über PDF (zuverlässiger für mehrere Seiten)
-        # LibreOffice PNG-Export erstellt nur 1 Bild für ganze Präsentation
-        image_paths = render_pptx_via_pdf(pptx_path, output_dir)
+        success = True
+        for slide_model, image_paths in zip(models, all_image_paths):
+            if not image_paths:
+                success = False
+                continue
 
-        # Methode 2: Direkte PNG falls PDF fehlschlägt
-        if not image_paths or len(image_paths) == 1:
-            image_paths_direct = render_slides_to_images(pptx_path, output_dir)
-            if len(image_paths_direct) > len(image_paths):
-                image_paths = image_paths_direct
+            # Bilder im Cache bleiben liegen: nur den Pfad merken (gelesen
+            # wird erst bei Bedarf); Temp-Bilder müssen jetzt gelesen werden
+            in_cache = cache.enabled and image_paths[0].is_relative_to(cache.cache_dir)
 
-        if not image_paths:
-            return False
+            # Ordne Bilder den Folien zu
+            for slide in slide_model.slides:
+                if slide.number <= len(image_paths):
+                    img_path = image_paths[slide.number - 1]
+                    if in_cache:
+                        slide.slide_image_path = img_path
+                    else:
+                        slide.slide_image = img_path.read_bytes()
 
-        # Ordne Bilder den Folien zu
-        for slide in model.slides:
-            if slide.number <= len(image_paths):
-                img_path = image_paths[slide.number - 1]
-                slide.slide_image = img_path.read_bytes()
+        return success
 
-        return True
+
+# Ein Thread für Folienbilder neben der übrigen Pipeline (bei Bedarf angelegt)
+_background_executor: Optional[ThreadPoolExecutor] = None
+_background_lock = threading.Lock()
+
+
+def populate_slide_images_in_background(
+    model: SlideModel | list[SlideModel],
+    pptx_path: Path | list[Path],
+    **kwargs
+) -> Future:
+    """
+    Startet populate_slide_images in einem Hintergrund-Thread.
+
+    Der Aufrufer kann währenddessen weiterarbeiten (z.B. Alt-Texte über
+    Ollama erzeugen) und holt das Ergebnis mit future.result() ab.
+    soffice läuft als eigener Prozess, pdfium gibt beim Rastern den GIL
+    frei - ein Thread genügt.
+
+    Returns:
+        Future mit dem Rückgabewert von populate_slide_images
+    """
+    global _background_executor
+    with _background_lock:
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pptx2ua-slides"
+            )
+    return _background_executor.submit(populate_slide_images, model, pptx_path, **kwargs)
+
+
+def _sort_by_slide_number(paths) -> list[Path]:
+    """Sortiert Bildpfade numerisch nach Foliennummer (slide-2 vor slide-10)."""
+    # Schlüssel einmal pro Pfad berechnen, dann Tupel sortieren
+    decorated = [(_extract_slide_number(p.name), p.name, p) for p in paths]
+    decorated.sort()
+    return [p for _, _, p in decorated]
 
 
 def _extract_slide_number(filename: str) -> int:
     """Extrahiert Foliennummer aus Dateinamen."""
-    import re
-    match = re.search(r'(\d+)', filename)
+    match = _SLIDE_NUMBER_RE.search(filename)
     if match:
         return int(match.group(1))
     return 0
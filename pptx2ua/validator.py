@@ -7,14 +7,50 @@ veraPDF ist der de-facto Standard für PDF/A und PDF/UA Validierung.
 Open Source und von der PDF Association empfohlen.
 """
 
+import hashlib
 import json
+import os
 import subprocess
 import shutil
-from dataclasses import dataclass, field
+import tempfile
+from dataclasses import asdict, dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 from xml.etree import ElementTree as ET
 
+from .cache import get_cache_dir, file_digest, prune_cache, touch_entry
+
+# Optional: lxml parst große XML-Reports in libxml2 statt in Python
+try:
+    from lxml import etree as lxml_etree
+    _lxml_available = True
+except ImportError:
+    _lxml_available = False
+
+
+# veraPDF-Aufruf für bis zu so vielen PDFs (eine JVM statt einer pro Datei)
+VERAPDF_BATCH_SIZE = 32
+
+# XML-Report (ältere veraPDF-Versionen): Abfragen mit und ohne Namespace
+_VERA_NAMESPACES = {'vera': 'http://www.verapdf.org/MachineReadableReport'}
+_VERA_NS = "{http://www.verapdf.org/MachineReadableReport}"
+_XML_QUERIES = {
+    prefix: {
+        name: f".//{prefix}{name}"
+        for name in ("job", "validationResult", "passedRules", "failedRules", "assertion", "rule")
+    }
+    for prefix in (_VERA_NS, "")
+}
+
+# Metadaten im XML-Report (Features): gezielte Abfragen, Namespace egal
+_METADATA_QUERIES = {
+    "tagged": (".//{*}tagged", ".//{*}isTagged", ".//{*}marked"),
+    "language": (".//{*}language", ".//{*}lang", ".//{*}Lang"),
+    "title": (".//{*}title", ".//{*}Title"),
+    "pdf_version": (".//{*}pdfVersion", ".//{*}version"),
+}
+
 
 @dataclass
 class ValidationIssue:
@@ -34,6 +70,13 @@ class ValidationIssue:
     @property
     def is_warning(self) -> bool:
         return self.severity.lower() == "warning"
+    
+    def to_dict(self) -> dict:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationIssue":
+        return cls(**data)
 
 
 @dataclass
@@ -59,18 +102,61 @@ class ValidationResult:
     # Rohdaten
     raw_output: str = ""
     
+    # Issues nach Schweregrad, beim Hinzufügen einsortiert
+    _error_issues: list[ValidationIssue] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _warning_issues: list[ValidationIssue] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Direkt übergebene Issues (z.B. aus dem Cache) einsortieren;
+        # die Zähler sind dann schon gesetzt
+        for issue in self.issues:
+            self._bucket(issue).append(issue)
+    
+    def _bucket(self, issue: ValidationIssue) -> list[ValidationIssue]:
+        severity = issue.severity.lower()
+        if severity == "error":
+            return self._error_issues
+        if severity == "warning":
+            return self._warning_issues
+        return []
+    
+    def add_issue(self, issue: ValidationIssue):
+        """Fügt ein Issue hinzu und aktualisiert Zähler und Listen."""
+        self.issues.append(issue)
+        bucket = self._bucket(issue)
+        bucket.append(issue)
+        if bucket is self._error_issues:
+            self.errors += 1
+        elif bucket is self._warning_issues:
+            self.warnings += 1
+    
     @property
     def error_issues(self) -> list[ValidationIssue]:
-        return [i for i in self.issues if i.is_error]
+        return self._error_issues
     
     @property
     def warning_issues(self) -> list[ValidationIssue]:
-        return [i for i in self.issues if i.is_warning]
+        return self._warning_issues
     
     def summary(self) -> str:
         """Kurze Zusammenfassung."""
         status = "✅ VALIDE" if self.is_compliant else "❌ NICHT VALIDE"
         return f"{status} | Fehler: {self.errors} | Warnungen: {self.warnings}"
+    
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["_error_issues"], data["_warning_issues"]
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationResult":
+        data = dict(data)
+        data["issues"] = [ValidationIssue.from_dict(i) for i in data.get("issues", [])]
+        return cls(**data)
 
 
 class PDFUAValidator:
@@ -96,6 +182,12 @@ class PDFUAValidator:
         """
         self.verapdf_path = verapdf_path or self._find_verapdf()
         self.available = self.verapdf_path is not None
+        # Ältere veraPDF-Versionen kennen --format json nicht
+        self._json_reports = True
+        # Ergebnis-Cache nach PDF-Inhalt und veraPDF-Installation
+        # (None wenn PPTX2UA_NO_CACHE=1)
+        self.cache_dir = get_cache_dir("verapdf")
+        self._verapdf_id = self._installation_id(self.verapdf_path)
     
     def _find_verapdf(self) -> Optional[str]:
         """Sucht veraPDF im System."""
@@ -134,70 +226,321 @@ class PDFUAValidator:
             ValidationResult mit allen Findings
         """
         pdf_path = Path(pdf_path)
+        return self.validate_many([pdf_path], profile)[pdf_path]
+    
+    def validate_many(
+        self,
+        pdf_paths: list[Path | str],
+        profile: str = "ua1",
+        batch_size: int = VERAPDF_BATCH_SIZE
+    ) -> dict[Path, ValidationResult]:
+        """
+        Validiert mehrere PDFs mit möglichst wenigen veraPDF-Aufrufen.
+        
+        veraPDF läuft in einer JVM, deren Start die Laufzeit dominiert -
+        ein Aufruf prüft daher bis zu batch_size Dateien auf einmal.
+        
+        Args:
+            pdf_paths: Pfade zu den PDFs
+            profile: Validierungsprofil (ua1 = PDF/UA-1)
+            batch_size: Maximale Anzahl PDFs pro veraPDF-Aufruf
+            
+        Returns:
+            Dict Pfad -> ValidationResult
+        """
+        paths = list(dict.fromkeys(Path(p) for p in pdf_paths))
         
         if not self.available:
-            return self._fallback_validation(pdf_path)
+            return {p: self._fallback_validation(p) for p in paths}
+        
+        # Unveränderte PDFs schon einmal geprüft?
+        results = {}
+        cache_paths = {}
+        pending = []
+        for pdf_path in paths:
+            cache_paths[pdf_path] = self._cache_path(pdf_path, profile)
+            cached = self._load_cached(cache_paths[pdf_path])
+            if cached is not None:
+                results[pdf_path] = cached
+            else:
+                pending.append(pdf_path)
         
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            for pdf_path, result in self._validate_batch(batch, profile).items():
+                self._store_cached(cache_paths[pdf_path], result)
+                results[pdf_path] = result
+        
+        if pending and self.cache_dir is not None:
+            self._prune_cache()
+        
+        return {p: results[p] for p in paths}
+    
+    @staticmethod
+    def _installation_id(verapdf_path: Optional[str]) -> str:
+        """
+        Kennung der veraPDF-Installation für den Cache-Schlüssel.
+
+        Pfad und Stand (mtime/Größe) des Programms: nach einem Update oder
+        mit einem anderen veraPDF werden keine alten Ergebnisse geliefert.
+        """
+        if not verapdf_path:
+            return "none"
+        path = os.path.realpath(verapdf_path)
         try:
-            # veraPDF aufrufen
-            result = subprocess.run(
-                [
-                    self.verapdf_path,
-                    "--format", "mrr",  # Machine-Readable Report (XML)
-                    "--profile", profile,
-                    str(pdf_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            stat = os.stat(path)
+            path += f":{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            pass
+        return hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+    
+    def _validate_batch(self, pdf_paths: list[Path], profile: str) -> dict[Path, ValidationResult]:
+        """Ein veraPDF-Aufruf für mehrere PDFs."""
+        try:
+            # veraPDF aufrufen: JSON-Report, sonst Machine-Readable Report (XML)
+            results = None
+            if self._json_reports:
+                process = self._run_verapdf(pdf_paths, profile, "json")
+                try:
+                    results = self._parse_verapdf_output(process.stdout, process.returncode, pdf_paths)
+                except ValueError:
+                    # Nur umschalten, wenn veraPDF das Format ablehnt; eine
+                    # leere oder kaputte Ausgabe betrifft nur diesen Aufruf
+                    if not self._rejects_json_format(process):
+                        return {
+                            p: ValidationResult(
+                                is_valid=False,
+                                is_compliant=False,
+                                raw_output="Unlesbarer veraPDF-Report"
+                            )
+                            for p in pdf_paths
+                        }
+                    self._json_reports = False
             
-            return self._parse_verapdf_output(result.stdout, result.returncode)
+            # XML-Reports einzeln auswerten
+            if results is None:
+                results = {}
+                for pdf_path in pdf_paths:
+                    process = self._run_verapdf([pdf_path], profile, "mrr")
+                    results[pdf_path] = self._parse_verapdf_xml(process.stdout, process.returncode)
+            
+            # Reports enthalten die Dokument-Metadaten nur mit --extract:
+            # direkt aus dem PDF lesen
+            for pdf_path, result in results.items():
+                if result.is_valid:
+                    try:
+                        self._read_metadata(pdf_path, result)
+                    except Exception:
+                        pass
+            return results
             
         except subprocess.TimeoutExpired:
-            return ValidationResult(
-                is_valid=False,
-                is_compliant=False,
-                raw_output="Timeout bei Validierung"
-            )
+            return {
+                p: ValidationResult(
+                    is_valid=False,
+                    is_compliant=False,
+                    raw_output="Timeout bei Validierung"
+                )
+                for p in pdf_paths
+            }
         except Exception as e:
-            return ValidationResult(
-                is_valid=False,
-                is_compliant=False,
-                raw_output=f"Fehler: {e}"
+            return {
+                p: ValidationResult(
+                    is_valid=False,
+                    is_compliant=False,
+                    raw_output=f"Fehler: {e}"
+                )
+                for p in pdf_paths
+            }
+    
+    def _cache_path(self, pdf_path: Path, profile: str) -> Optional[Path]:
+        """Cache-Datei für PDF-Inhalt und Profil."""
+        if self.cache_dir is None:
+            return None
+        try:
+            return self.cache_dir / self._verapdf_id / profile / f"{file_digest(pdf_path)}.json"
+        except OSError:
+            return None
+    
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[ValidationResult]:
+        """Liest ein gecachtes Ergebnis (None bei Miss oder defektem Eintrag)."""
+        if cache_path is None:
+            return None
+        try:
+            result = ValidationResult.from_dict(json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        touch_entry(cache_path)
+        return result
+    
+    def _store_cached(self, cache_path: Optional[Path], result: ValidationResult):
+        """Speichert ein Ergebnis atomar (nie halb geschriebene Einträge)."""
+        if cache_path is None or not result.is_valid:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=cache_path.parent)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            print(f"   ⚠️  Validierungs-Cache nicht beschreibbar: {e}")
+    
+    def _prune_cache(self):
+        """Hält den Cache unter Größen- und Altersgrenze (siehe cache.py)."""
+        try:
+            prune_cache(self.cache_dir.glob("*/*/*.json"))
+        except OSError as e:
+            print(f"   ⚠️  Validierungs-Cache nicht aufräumbar: {e}")
+    
+    def _run_verapdf(self, pdf_paths: list[Path], profile: str, report_format: str):
+        """Startet veraPDF mit dem gewünschten Report-Format."""
+        return subprocess.run(
+            [
+                self.verapdf_path,
+                "--format", report_format,
+                "--profile", profile,
+                *map(str, pdf_paths)
+            ],
+            # Report als Bytes (json/ET dekodieren selbst); stderr wird nur
+            # bei unlesbarem Report angesehen
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=120 * len(pdf_paths)
+        )
+    
+    @staticmethod
+    def _rejects_json_format(process) -> bool:
+        """Erkennt die Fehlermeldung älterer veraPDF-Versionen zu --format json."""
+        if process.returncode == 0:
+            return False
+        output = (process.stdout + process.stderr).lower()
+        return b"format" in output and (b"json" in output or b"allowed values" in output)
+    
+    def _parse_verapdf_output(
+        self,
+        json_output: bytes,
+        return_code: int,
+        pdf_paths: list[Path]
+    ) -> dict[Path, ValidationResult]:
+        """
+        Parst veraPDF JSON Output (--format json), ein Job pro Eingabedatei.
+        
+        Raises:
+            ValueError: Wenn die Ausgabe kein JSON ist
+        """
+        data = json.loads(json_output)
+        jobs = data.get("report", {}).get("jobs") or []
+        
+        # Jobs über itemDetails.name zuordnen, nur über den aufgelösten
+        # Pfad: gleiche Dateinamen in verschiedenen Ordnern dürfen sich
+        # nicht vertauschen
+        by_path = {}
+        for job in jobs:
+            name = (job.get("itemDetails") or {}).get("name")
+            if name:
+                by_path.setdefault(Path(name).resolve(), job)
+        
+        # Der Exit-Code gilt für den ganzen Aufruf, also nur bei einer Datei
+        # als Ersatz für eine fehlende Angabe im Job
+        single_compliant = len(pdf_paths) == 1 and return_code == 0
+        
+        results = {}
+        for pdf_path in pdf_paths:
+            job = by_path.get(pdf_path.resolve())
+            if job is None:
+                results[pdf_path] = ValidationResult(
+                    is_valid=False,
+                    is_compliant=False,
+                    raw_output=f"Kein veraPDF-Report für {pdf_path.name}"
+                )
+            else:
+                results[pdf_path] = self._parse_verapdf_job(job, single_compliant)
+        
+        return results
+    
+    def _parse_verapdf_job(self, job: dict, default_compliant: bool) -> ValidationResult:
+        """Parst einen Job aus dem veraPDF JSON-Report."""
+        result = ValidationResult(
+            is_valid=True,
+            is_compliant=default_compliant,
+            raw_output=json.dumps(job, ensure_ascii=False)
+        )
+        
+        validation = job.get("validationResult")
+        # Neuere Versionen liefern eine Liste (ein Eintrag pro Profil)
+        if isinstance(validation, list):
+            validation = validation[0] if validation else None
+        if not validation:
+            # Kein Prüfergebnis (z.B. Task-Exception bei verschlüsseltem oder
+            # defektem PDF): ungültig, damit es nicht gecacht wird
+            result.is_valid = False
+            result.is_compliant = False
+            return result
+        
+        result.is_compliant = bool(validation.get("compliant", result.is_compliant))
+        
+        # Regeln zählen
+        details = validation.get("details") or {}
+        result.passed_rules = int(details.get("passedRules") or 0)
+        result.failed_rules = int(details.get("failedRules") or 0)
+        
+        # Einzelne Issues: je fehlgeschlagenem Check (mit Fundstelle),
+        # ohne gemeldete Checks einmal pro Regel
+        failed_rules = [
+            rule for rule in details.get("ruleSummaries") or []
+            if str(rule.get("ruleStatus") or rule.get("status") or "").lower() != "passed"
+        ]
+        issues = [
+            ValidationIssue(
+                rule_id=f"{rule.get('clause', '')}-{rule.get('testNumber', '')}",
+                severity="error" if str(rule.get("status") or rule.get("ruleStatus") or "").lower() == "failed" else "warning",
+                message=(check or {}).get("errorMessage") or rule.get("description") or "",
+                specification=rule.get("specification") or "ISO 14289-1:2014",
+                clause=str(rule.get("clause", "")),
+                test=rule.get("test") or "",
+                location=(check or {}).get("context"),
             )
+            for rule in failed_rules
+            for check in [
+                c for c in rule.get("checks") or []
+                if str(c.get("status", "")).lower() != "passed"
+            ] or [None]
+        ]
+        for issue in issues:
+            result.add_issue(issue)
+        
+        return result
     
-    def _parse_verapdf_output(self, xml_output: str, return_code: int) -> ValidationResult:
-        """Parst veraPDF XML Output."""
+    def _parse_verapdf_xml(self, xml_output: bytes, return_code: int) -> ValidationResult:
+        """Parst veraPDF XML Output (ältere Versionen ohne JSON-Report)."""
         result = ValidationResult(
             is_valid=True,
             is_compliant=(return_code == 0),
-            raw_output=xml_output
+            raw_output=xml_output.decode("utf-8", "replace")
         )
         
         try:
-            root = ET.fromstring(xml_output)
+            root = self._parse_xml(xml_output)
             
-            # Namespace handling
-            ns = {
-                'vera': 'http://www.verapdf.org/MachineReadableReport'
-            }
+            # Namespace einmal am Wurzelelement erkennen statt je Abfrage
+            # beide Varianten zu probieren
+            q = _XML_QUERIES[_VERA_NS if root.tag.startswith(_VERA_NS) else ""]
             
             # Job-Ergebnis finden
-            job = root.find('.//vera:job', ns) or root.find('.//job')
+            job = root.find(q["job"])
             if job is None:
-                # Versuche ohne Namespace
                 job = root
             
             # Validation Result
-            val_result = job.find('.//vera:validationResult', ns) or job.find('.//validationResult')
+            val_result = job.find(q["validationResult"])
             
             if val_result is not None:
                 result.is_compliant = val_result.get('isCompliant', '').lower() == 'true'
                 
                 # Regeln zählen
-                passed = val_result.find('.//vera:passedRules', ns) or val_result.find('.//passedRules')
-                failed = val_result.find('.//vera:failedRules', ns) or val_result.find('.//failedRules')
+                passed = val_result.find(q["passedRules"])
+                failed = val_result.find(q["failedRules"])
                 
                 if passed is not None:
                     result.passed_rules = int(passed.text or 0)
@@ -205,24 +548,30 @@ class PDFUAValidator:
                     result.failed_rules = int(failed.text or 0)
             
             # Einzelne Issues extrahieren
-            for assertion in root.iter():
-                if 'assertion' in assertion.tag.lower() or 'rule' in assertion.tag.lower():
-                    issue = self._parse_assertion(assertion, ns)
-                    if issue:
-                        result.issues.append(issue)
-                        if issue.is_error:
-                            result.errors += 1
-                        elif issue.is_warning:
-                            result.warnings += 1
+            for assertion in chain(root.iterfind(q["assertion"]), root.iterfind(q["rule"])):
+                issue = self._parse_assertion(assertion, _VERA_NAMESPACES)
+                if issue:
+                    result.add_issue(issue)
             
             # Metadaten extrahieren
-            self._extract_metadata(root, result, ns)
+            self._extract_metadata(root, result, _VERA_NAMESPACES)
             
-        except ET.ParseError as e:
+        except (ET.ParseError, SyntaxError) as e:
             result.raw_output += f"\n\nXML Parse Error: {e}"
         
         return result
     
+    @staticmethod
+    def _parse_xml(xml_output: bytes):
+        """Parst XML mit lxml (falls installiert), sonst mit ElementTree."""
+        if _lxml_available:
+            # Kommentare/PIs entfernen: deren .tag ist kein String
+            parser = lxml_etree.XMLParser(
+                huge_tree=True, remove_blank_text=True, remove_comments=True, remove_pis=True
+            )
+            return lxml_etree.fromstring(xml_output, parser)
+        return ET.fromstring(xml_output)
+    
     def _parse_assertion(self, elem, ns: dict) -> Optional[ValidationIssue]:
         """Parst eine einzelne Assertion/Rule."""
         try:
@@ -264,19 +613,43 @@ class PDFUAValidator:
     
     def _extract_metadata(self, root, result: ValidationResult, ns: dict):
         """Extrahiert PDF Metadaten aus veraPDF Output."""
-        # Suche nach Features/Metadata Info
-        for elem in root.iter():
-            tag = elem.tag.lower()
-            text = (elem.text or "").lower()
-            
-            if 'tagged' in tag:
-                result.is_tagged = text in ('true', 'yes', '1')
-            elif 'language' in tag or 'lang' in tag:
-                result.has_language = bool(elem.text and len(elem.text) > 0)
-            elif 'title' in tag:
-                result.has_title = bool(elem.text and len(elem.text) > 0)
-            elif 'version' in tag and 'pdf' in tag:
-                result.pdf_version = elem.text or ""
+        def first(field: str):
+            for query in _METADATA_QUERIES[field]:
+                elem = root.find(query)
+                if elem is not None:
+                    return elem
+            return None
+        
+        tagged = first("tagged")
+        if tagged is not None:
+            result.is_tagged = (tagged.text or "").strip().lower() in ('true', 'yes', '1')
+        
+        language = first("language")
+        if language is not None:
+            result.has_language = bool(language.text)
+        
+        title = first("title")
+        if title is not None:
+            result.has_title = bool(title.text)
+        
+        version = first("pdf_version")
+        if version is not None:
+            result.pdf_version = version.text or ""
+    
+    def _read_metadata(self, pdf_path: Path, result: ValidationResult):
+        """Liest Tagging, Sprache, Titel und PDF-Version mit pikepdf."""
+        import pikepdf
+        
+        # Nur Katalog und Trailer werden gelesen: Datei mappen statt
+        # komplett einzulesen
+        with pikepdf.open(pdf_path, access_mode=pikepdf.AccessMode.mmap) as pdf:
+            root = pdf.Root
+            result.is_tagged = bool(root.get('/MarkInfo', {}).get('/Marked', False))
+            result.has_language = '/Lang' in root
+            # Info-Dictionary direkt aus dem Trailer (pdf.docinfo legt
+            # ein fehlendes Dictionary erst an)
+            result.has_title = bool(pdf.trailer.get('/Info', {}).get('/Title'))
+            result.pdf_version = f"PDF {pdf.pdf_version}"
     
     def _fallback_validation(self, pdf_path: Path) -> ValidationResult:
         """
@@ -291,58 +664,43 @@ class PDFUAValidator:
         )
         
         try:
-            import pikepdf
+            self._read_metadata(pdf_path, result)
             
-            with pikepdf.open(pdf_path) as pdf:
-                # 1. Getaggt?
-                if '/MarkInfo' in pdf.Root:
-                    mark_info = pdf.Root.MarkInfo
-                    result.is_tagged = mark_info.get('/Marked', False)
-                
-                if not result.is_tagged:
-                    result.issues.append(ValidationIssue(
-                        rule_id="PDFUA-7.1",
-                        severity="error",
-                        message="PDF ist nicht als getaggt markiert",
-                        specification="ISO 14289-1:2014",
-                        clause="7.1",
-                        test="MarkInfo.Marked == true"
-                    ))
-                    result.errors += 1
-                
-                # 2. Sprache?
-                if '/Lang' in pdf.Root:
-                    result.has_language = True
-                else:
-                    result.issues.append(ValidationIssue(
-                        rule_id="PDFUA-7.2",
-                        severity="error",
-                        message="Dokumentsprache nicht definiert",
-                        specification="ISO 14289-1:2014",
-                        clause="7.2",
-                        test="Document.Lang exists"
-                    ))
-                    result.errors += 1
-                
-                # 3. Titel?
-                if pdf.docinfo.get('/Title'):
-                    result.has_title = True
-                else:
-                    result.issues.append(ValidationIssue(
-                        rule_id="PDFUA-7.3",
-                        severity="warning",
-                        message="Dokumenttitel nicht definiert",
-                        specification="ISO 14289-1:2014",
-                        clause="7.3",
-                        test="Info.Title exists"
-                    ))
-                    result.warnings += 1
-                
-                # PDF Version
-                result.pdf_version = f"PDF {pdf.pdf_version}"
-                
-                # Compliant wenn keine Errors
-                result.is_compliant = (result.errors == 0)
+            # 1. Getaggt?
+            if not result.is_tagged:
+                result.add_issue(ValidationIssue(
+                    rule_id="PDFUA-7.1",
+                    severity="error",
+                    message="PDF ist nicht als getaggt markiert",
+                    specification="ISO 14289-1:2014",
+                    clause="7.1",
+                    test="MarkInfo.Marked == true"
+                ))
+            
+            # 2. Sprache?
+            if not result.has_language:
+                result.add_issue(ValidationIssue(
+                    rule_id="PDFUA-7.2",
+                    severity="error",
+                    message="Dokumentsprache nicht definiert",
+                    specification="ISO 14289-1:2014",
+                    clause="7.2",
+                    test="Document.Lang exists"
+                ))
+            
+            # 3. Titel?
+            if not result.has_title:
+                result.add_issue(ValidationIssue(
+                    rule_id="PDFUA-7.3",
+                    severity="warning",
+                    message="Dokumenttitel nicht definiert",
+                    specification="ISO 14289-1:2014",
+                    clause="7.3",
+                    test="Info.Title exists"
+                ))
+            
+            # Compliant wenn keine Errors
+            result.is_compliant = (result.errors == 0)
                 
         except ImportError:
             result.raw_output += "\npikepdf nicht installiert"
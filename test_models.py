@@ -3,14 +3,18 @@ Tests für pptx2ua
 =================
 
 Ausführen mit: pytest
+Parallel (pytest-xdist): pytest -n auto
+Ohne Integrationstests: pytest -m "not integration"
 """
 
+import copy
+
 import pytest
 from pathlib import Path
 
 from pptx2ua.models import (
     SlideModel, Slide, Block, BlockType,
-    Paragraph, TextRun, Figure, Table, TableCell
+    Paragraph, TextRun, Figure, Table, TableCell, BoundingBox
 )
 
 
@@ -117,64 +121,769 @@ class TestBlockTypes:
         assert block.figure.alt_text == "Ein Bild"
 
 
+@pytest.fixture(scope="class")
+def base_model():
+    """Zwei Folien mit drei Figures, eine davon ohne Alt-Text."""
+    slide1 = Slide(number=1)
+    slide1.blocks.append(Block(
+        block_type=BlockType.FIGURE,
+        reading_order=1,
+        figure=Figure(image_data=b"1", needs_alt_text=True)
+    ))
+    
+    slide2 = Slide(number=2)
+    slide2.blocks.append(Block(
+        block_type=BlockType.FIGURE,
+        reading_order=1,
+        figure=Figure(image_data=b"2", alt_text="Hat Alt", needs_alt_text=False)
+    ))
+    slide2.blocks.append(Block(
+        block_type=BlockType.FIGURE,
+        reading_order=2,
+        figure=Figure(image_data=b"3", alt_text="Hat auch Alt", needs_alt_text=False)
+    ))
+    
+    return SlideModel(slides=[slide1, slide2])
+
+
 class TestSlideModel:
     """Tests für SlideModel Aggregation."""
     
-    def test_all_figures(self):
+    def test_all_figures(self, base_model):
         """SlideModel sammelt alle Figures."""
-        model = SlideModel()
+        assert len(base_model.all_figures) == 3
+    
+    def test_figures_needing_alt_text(self, base_model):
+        """Erkennt Figures ohne Alt-Text."""
+        needing = base_model.figures_needing_alt_text
+        assert len(needing) == 1
+        assert needing[0][0] == 1  # Slide number
         
-        slide1 = Slide(number=1)
-        slide1.blocks.append(Block(
-            block_type=BlockType.FIGURE,
-            reading_order=1,
-            figure=Figure(image_data=b"1")
-        ))
+        # Änderungen nur an einer Kopie (Fixture wird geteilt)
+        model = copy.deepcopy(base_model)
+        model.slides[0].blocks[0].figure.alt_text = "Nachgetragen"
+        model.slides[0].blocks[0].figure.needs_alt_text = False
         
-        slide2 = Slide(number=2)
-        slide2.blocks.append(Block(
-            block_type=BlockType.FIGURE,
-            reading_order=1,
-            figure=Figure(image_data=b"2")
-        ))
-        slide2.blocks.append(Block(
-            block_type=BlockType.FIGURE,
-            reading_order=2,
-            figure=Figure(image_data=b"3")
-        ))
+        assert model.figures_needing_alt_text == []
+        assert len(base_model.figures_needing_alt_text) == 1
+
+
+def _positioned(name, x, y, width, height, block_type=BlockType.PARAGRAPH, **kwargs):
+    """Eintrag (shape, block, bbox) wie ihn _parse_slide sammelt."""
+    block = Block(block_type=block_type, reading_order=0, source_shape_id=name, **kwargs)
+    bbox = BoundingBox(x=x, y=y, width=width, height=height) if width else None
+    return (None, block, bbox)
+
+
+def _reading_order(items):
+    from pptx2ua.parser import PPTXParser
+    
+    blocks = PPTXParser()._determine_reading_order(items)
+    return [block.source_shape_id for block in blocks]
+
+
+class TestReadingOrder:
+    """Tests für die Lesereihenfolge über den Überlappungsgraphen."""
+    
+    def test_slightly_offset_row(self):
+        """Leicht versetzte Blöcke einer Zeile werden links vor rechts gelesen."""
+        # Y-Buckets (20mm) würden "rechts" (y=19) vor "links" (y=21) einordnen
+        items = [
+            _positioned("rechts", x=120, y=19, width=80, height=30),
+            _positioned("links", x=10, y=21, width=80, height=30),
+        ]
+        assert _reading_order(items) == ["links", "rechts"]
+    
+    def test_columns_with_tall_left_block(self):
+        """Ein hoher Block links kommt vor beiden Blöcken der rechten Spalte."""
+        items = [
+            _positioned("rechts-unten", x=110, y=100, width=80, height=40),
+            _positioned("rechts-oben", x=110, y=10, width=80, height=40),
+            _positioned("links", x=10, y=10, width=80, height=150),
+        ]
+        assert _reading_order(items) == ["links", "rechts-oben", "rechts-unten"]
+    
+    def test_overlapping_shapes_top_to_bottom(self):
+        """Überlappende Shapes einer Spalte werden von oben nach unten gelesen."""
+        items = [
+            _positioned("unten", x=20, y=60, width=100, height=50),
+            _positioned("oben", x=10, y=30, width=100, height=50),
+        ]
+        assert _reading_order(items) == ["oben", "unten"]
+    
+    def test_title_first_unpositioned_last(self):
+        """Titel steht vorne, Blöcke ohne Position hinten."""
+        items = [
+            _positioned("ohne-position", x=0, y=0, width=0, height=0),
+            _positioned("text", x=10, y=5, width=100, height=20),
+            _positioned(
+                "titel", x=10, y=150, width=100, height=20,
+                block_type=BlockType.HEADING, heading_level=1,
+            ),
+        ]
+        assert _reading_order(items) == ["titel", "text", "ohne-position"]
+    
+    def test_reading_order_numbers(self):
+        """reading_order wird fortlaufend ab 1 vergeben."""
+        from pptx2ua.parser import PPTXParser
         
-        model.slides = [slide1, slide2]
+        items = [
+            _positioned("b", x=10, y=50, width=50, height=20),
+            _positioned("a", x=10, y=10, width=50, height=20),
+        ]
+        blocks = PPTXParser()._determine_reading_order(items)
+        assert [block.reading_order for block in blocks] == [1, 2]
+
+
+@pytest.fixture
+def formatted_pptx(tmp_path):
+    """PPTX mit einer Textbox: formatierte Runs, Hyperlink, zentrierter Absatz."""
+    from pptx import Presentation
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Mm, Pt
+    
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Mm(10), Mm(10), Mm(100), Mm(40)).text_frame
+    
+    para = text_frame.paragraphs[0]
+    para.alignment = PP_ALIGN.CENTER
+    para.level = 1
+    
+    bold = para.add_run()
+    bold.text = "Fett "
+    bold.font.bold = True
+    bold.font.size = Pt(24)
+    bold.font.name = "Arial"
+    
+    link = para.add_run()
+    link.text = "Link"
+    link.font.italic = True
+    link.font.underline = True
+    link.hyperlink.address = "https://example.org/"
+    
+    path = tmp_path / "formatiert.pptx"
+    prs.save(path)
+    return path
+
+
+def _first_paragraph(model):
+    return model.slides[0].blocks[0].paragraphs[0]
+
+
+class TestRunProperties:
+    """Tests für Formatierung direkt aus a:rPr."""
+    
+    def test_apply_run_properties_from_xml(self):
+        """Attribute und Kind-Elemente von a:rPr werden übernommen."""
+        from pptx.oxml import parse_xml
+        from pptx2ua.parser import PPTXParser
+        
+        rPr = parse_xml(
+            '<a:rPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            ' b="1" i="0" u="sng" sz="1850"><a:latin typeface="Calibri"/></a:rPr>'
+        )
+        run = TextRun(text="x")
+        PPTXParser._apply_run_properties(run, rPr, part=None)
         
-        assert len(model.all_figures) == 3
+        assert run.bold
+        assert not run.italic
+        assert run.underline
+        assert run.font_size == 18.5
+        assert run.font_name == "Calibri"
+        assert run.hyperlink is None
     
-    def test_figures_needing_alt_text(self):
-        """Erkennt Figures ohne Alt-Text."""
-        model = SlideModel()
+    def test_underline_none(self):
+        """u="none" ist keine Unterstreichung."""
+        from pptx.oxml import parse_xml
+        from pptx2ua.parser import PPTXParser
         
-        slide = Slide(number=1)
-        slide.blocks.append(Block(
-            block_type=BlockType.FIGURE,
-            reading_order=1,
-            figure=Figure(image_data=b"1", alt_text="Hat Alt")
-        ))
-        slide.blocks.append(Block(
-            block_type=BlockType.FIGURE,
-            reading_order=2,
-            figure=Figure(image_data=b"2", needs_alt_text=True)
-        ))
+        rPr = parse_xml(
+            '<a:rPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            ' b="true" u="none"/>'
+        )
+        run = TextRun(text="x")
+        PPTXParser._apply_run_properties(run, rPr, part=None)
         
-        # Manuell needs_alt_text setzen
-        slide.blocks[0].figure.needs_alt_text = False
+        assert run.bold
+        assert not run.underline
+        assert run.font_size is None
+    
+    def test_xml_path_reads_runs(self, formatted_pptx):
+        """Der direkte XML-Weg liest Formatierung, Link und Absatz."""
+        from pptx2ua.parser import PPTXParser
         
-        model.slides = [slide]
+        para = _first_paragraph(PPTXParser(extract_images=False).parse(formatted_pptx))
+        bold, link = para.runs
         
-        needing = model.figures_needing_alt_text
-        assert len(needing) == 1
-        assert needing[0][0] == 1  # Slide number
+        assert para.alignment == "center"
+        assert para.level == 1
+        assert (bold.text, bold.bold, bold.font_size, bold.font_name) == ("Fett ", True, 24, "Arial")
+        assert link.italic and link.underline and not link.bold
+        assert link.hyperlink == "https://example.org/"
+    
+    def test_xml_path_matches_slow_path(self, formatted_pptx):
+        """XML-Weg und python-pptx-Weg liefern dieselben Absätze."""
+        from pptx2ua.parser import PPTXParser
+        
+        fast = PPTXParser(extract_images=False).parse(formatted_pptx)
+        slow = PPTXParser(extract_images=False, slow_path=True).parse(formatted_pptx)
+        
+        assert _first_paragraph(fast) == _first_paragraph(slow)
+
+
+def _png(image) -> bytes:
+    import io
+    
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestDecorativeImages:
+    """Tests für den Dekorativ-Vorfilter vor dem Vision-LLM."""
+    
+    def test_small_icon_is_not_decorative(self):
+        """Kleine Icons mit Inhalt gehen weiter ans Vision-LLM."""
+        Image = pytest.importorskip("PIL.Image")
+        from pptx2ua.enricher import _uniform_image_reason
+        
+        icon = Image.new("RGB", (16, 16), "white")
+        icon.putpixel((4, 4), (0, 0, 0))
+        assert _uniform_image_reason(_png(icon)) is None
+    
+    def test_uniform_image_is_decorative(self):
+        """Einfarbige Flächen gelten unabhängig von der Größe als dekorativ."""
+        Image = pytest.importorskip("PIL.Image")
+        from pptx2ua.enricher import _uniform_image_reason
+        
+        assert _uniform_image_reason(_png(Image.new("RGB", (800, 600), "red"))) == "einfarbig"
+        assert _uniform_image_reason(_png(Image.new("P", (4, 4), 7))) == "einfarbig"
+    
+    def test_transparent_image_is_decorative(self):
+        """Vollständig transparente Bilder gelten als dekorativ."""
+        Image = pytest.importorskip("PIL.Image")
+        from pptx2ua.enricher import _uniform_image_reason
+        
+        image = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
+        image.putpixel((2, 2), (255, 0, 0, 0))
+        assert _uniform_image_reason(_png(image)) == "vollständig transparent"
+    
+    def test_undecodable_image_is_not_decorative(self):
+        """Nicht dekodierbare Daten werden nicht stillschweigend übersprungen."""
+        from pptx2ua.enricher import _uniform_image_reason
+        
+        assert _uniform_image_reason(b"kein Bild") is None
+
+
+class TestBase64Batch:
+    """Tests für die gebündelte Base64-Kodierung kleiner Bilder."""
+    
+    def test_matches_single_encoding(self):
+        """Jeder Blob ergibt dasselbe wie ein einzelner b64encode-Aufruf."""
+        import base64
+        import random
+        from pptx2ua.renderer import _b64encode_batch
+        
+        rng = random.Random(0)
+        blobs = [bytes(rng.randrange(256) for _ in range(length)) for length in range(12)]
+        blobs += [rng.randbytes(rng.randrange(1, 5000)) for _ in range(20)]
+        
+        expected = [base64.b64encode(blob).decode('ascii') for blob in blobs]
+        assert _b64encode_batch(blobs) == expected
+    
+    def test_trailing_zero_bytes(self):
+        """Echte Nullbytes am Ende werden nicht als Füllung behandelt."""
+        import base64
+        from pptx2ua.renderer import _b64encode_batch
+        
+        blobs = [b"\0", b"a\0", b"ab\0\0", b""]
+        assert _b64encode_batch(blobs) == [base64.b64encode(blob).decode('ascii') for blob in blobs]
+
+
+@pytest.fixture
+def jobs_client(tmp_path, monkeypatch):
+    """
+    TestClient für die Jobs-API mit Threadpool statt Prozess-Pool.
+    
+    Die Pipeline selbst ist durch eine Konvertierung ersetzt, die nur
+    eine PDF-Datei schreibt; getestet wird der Ablauf der Jobs.
+    """
+    pytest.importorskip("fastapi.testclient")
+    from concurrent.futures import ThreadPoolExecutor
+    from fastapi.testclient import TestClient
+    from pptx2ua import server
+    
+    def fake_conversion(input_path, output_path, **options):
+        assert input_path.read_bytes() == b"PK pptx"
+        output_path.write_bytes(b"%PDF-1.7 test")
+        return {"stats": {"slides": 1}, "validation": {}}
+    
+    monkeypatch.setattr(server, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(server, "run_conversion", fake_conversion)
+    
+    with TestClient(server.app) as client:
+        process_pool = server.app.state.pool
+        server.app.state.pool = ThreadPoolExecutor(max_workers=1)
+        process_pool.shutdown(wait=False, cancel_futures=True)
+        yield client, server
+    server.JOBS.clear()
+
+
+def _wait_for_job(client, job_id):
+    import time
+    
+    for _ in range(100):
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["status"] == "done":
+            return job
+        assert job["status"] in ("queued", "running")
+        time.sleep(0.05)
+    pytest.fail("Job wurde nicht fertig")
+
+
+class TestJobsApi:
+    """Tests für den Ablauf 202 -> Polling -> Download."""
+    
+    def test_convert_poll_download(self, jobs_client):
+        """Angenommene Konvertierung lässt sich abfragen und herunterladen."""
+        client, server = jobs_client
+        
+        response = client.post(
+            "/api/convert",
+            files={"file": ("folien.pptx", b"PK pptx")},
+            data={"enable_ai": "false", "validate": "false"},
+        )
+        assert response.status_code == 202
+        accepted = response.json()
+        assert accepted["status"] == "queued"
+        
+        job = _wait_for_job(client, accepted["job_id"])
+        assert job["success"]
+        assert job["stats"] == {"slides": 1}
+        
+        download = client.get(f"/api/download/{job['download_id']}")
+        assert download.status_code == 200
+        assert download.content == b"%PDF-1.7 test"
+    
+    def test_job_state_from_other_worker(self, jobs_client):
+        """Ohne Eintrag in JOBS wird der Status aus der Datei gelesen."""
+        client, server = jobs_client
+        
+        job_id = client.post(
+            "/api/convert",
+            files={"file": ("folien.pptx", b"PK pptx")},
+            data={"enable_ai": "false", "validate": "false"},
+        ).json()["job_id"]
+        expected = _wait_for_job(client, job_id)
+        
+        server.JOBS.clear()
+        assert client.get(f"/api/jobs/{job_id}").json() == expected
+    
+    def test_input_removed_after_conversion(self, jobs_client, tmp_path):
+        """Die hochgeladene PPTX wird nach der Konvertierung gelöscht."""
+        client, server = jobs_client
+        
+        job_id = client.post(
+            "/api/convert",
+            files={"file": ("folien.pptx", b"PK pptx")},
+            data={"enable_ai": "false", "validate": "false"},
+        ).json()["job_id"]
+        _wait_for_job(client, job_id)
+        
+        assert not (tmp_path / f"{job_id}_input.pptx").exists()
+        assert (tmp_path / f"{job_id}_output.pdf").exists()
+    
+    def test_sweep_keeps_input_of_pending_job(self, jobs_client, tmp_path):
+        """Der Janitor löscht keine Inputs wartender oder laufender Jobs."""
+        import time
+        
+        client, server = jobs_client
+        input_path = tmp_path / "wartet_input.pptx"
+        input_path.write_bytes(b"PK pptx")
+        later = time.time() + server.INPUT_TTL + 1
+        
+        for status in ("queued", "running"):
+            server.write_job_state("wartet", status)
+            server.sweep_uploads(now=later)
+            assert input_path.exists()
+        
+        server.write_job_state("wartet", "done", {"success": False})
+        server.sweep_uploads(now=later)
+        assert not input_path.exists()
+    
+    def test_unknown_job(self, jobs_client):
+        """Unbekannte Jobs und Downloads liefern 404."""
+        client, server = jobs_client
+        
+        assert client.get("/api/jobs/unbekannt").status_code == 404
+        assert client.get("/api/download/unbekannt").status_code == 404
+    
+    def test_rejects_non_pptx(self, jobs_client):
+        """Andere Dateitypen werden vor dem Start abgelehnt."""
+        client, server = jobs_client
+        
+        response = client.post("/api/convert", files={"file": ("notiz.txt", b"x")})
+        assert response.status_code == 400
+        assert not server.JOBS
+
+
+def _issue(severity, clause="7.1"):
+    from pptx2ua.validator import ValidationIssue
+    
+    return ValidationIssue(
+        rule_id=f"{clause}-1",
+        severity=severity,
+        message=f"{severity} in {clause}",
+        specification="ISO 14289-1:2014",
+        clause=clause,
+        test="",
+    )
+
+
+class TestValidationResult:
+    """Tests für ValidationResult (Buckets und Serialisierung)."""
+    
+    def test_add_issue_buckets(self):
+        """add_issue sortiert nach Schweregrad und zählt mit."""
+        from pptx2ua.validator import ValidationResult
+        
+        result = ValidationResult(is_valid=True, is_compliant=False)
+        for severity in ("error", "WARNING", "info", "Error"):
+            result.add_issue(_issue(severity))
+        
+        assert (result.errors, result.warnings) == (2, 1)
+        assert [i.severity for i in result.error_issues] == ["error", "Error"]
+        assert [i.severity for i in result.warning_issues] == ["WARNING"]
+        assert len(result.issues) == 4
+    
+    def test_dict_round_trip(self):
+        """from_dict(to_dict()) ergibt dasselbe Ergebnis inkl. Buckets."""
+        import json
+        from pptx2ua.validator import ValidationResult
+        
+        result = ValidationResult(is_valid=True, is_compliant=False, pdf_version="PDF 1.7")
+        result.add_issue(_issue("error", "7.2"))
+        result.add_issue(_issue("warning", "7.3"))
+        
+        data = json.loads(json.dumps(result.to_dict()))
+        assert "_error_issues" not in data
+        
+        restored = ValidationResult.from_dict(data)
+        assert restored == result
+        assert restored.error_issues == result.error_issues
+        assert restored.warning_issues == result.warning_issues
+        assert (restored.errors, restored.warnings) == (1, 1)
+
+
+def _verapdf_job(path, compliant=True, failed_clause=None):
+    """Ein Job wie im veraPDF JSON-Report (--format json)."""
+    rules = []
+    if failed_clause:
+        rules.append({
+            "specification": "ISO 14289-1:2014",
+            "clause": failed_clause,
+            "testNumber": 1,
+            "status": "FAILED",
+            "description": "Regel verletzt",
+            "checks": [
+                {"status": "FAILED", "context": "root/doc[0]", "errorMessage": "Fehlt"},
+                {"status": "PASSED", "context": "root/doc[1]"},
+            ],
+        })
+    return {
+        "itemDetails": {"name": str(path)},
+        "validationResult": [{
+            "compliant": compliant,
+            "details": {
+                "passedRules": 100,
+                "failedRules": len(rules),
+                "ruleSummaries": rules,
+            },
+        }],
+    }
+
+
+def _verapdf_report(*jobs) -> bytes:
+    import json
+    
+    return json.dumps({"report": {"jobs": list(jobs)}}).encode()
+
+
+class TestVeraPDFReport:
+    """Tests für das Auswerten von veraPDF JSON-Reports."""
+    
+    def test_two_jobs_matched_by_path(self, tmp_path):
+        """Jobs werden über den Pfad zugeordnet, nicht über die Reihenfolge."""
+        from pptx2ua.validator import PDFUAValidator
+        
+        good, bad = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        output = _verapdf_report(
+            _verapdf_job(bad, compliant=False, failed_clause="7.1"),
+            _verapdf_job(good),
+        )
+        
+        results = PDFUAValidator("verapdf")._parse_verapdf_output(output, 1, [good, bad])
+        
+        assert results[good].is_valid and results[good].is_compliant
+        assert results[good].errors == 0
+        assert results[bad].is_valid and not results[bad].is_compliant
+        assert results[bad].failed_rules == 1
+        assert [(i.clause, i.message, i.location) for i in results[bad].error_issues] == [
+            ("7.1", "Fehlt", "root/doc[0]")
+        ]
+    
+    def test_same_file_name_in_different_folders(self, tmp_path):
+        """Gleiche Dateinamen in verschiedenen Ordnern vertauschen sich nicht."""
+        from pptx2ua.validator import PDFUAValidator
+        
+        first, second = tmp_path / "eins" / "deck.pdf", tmp_path / "zwei" / "deck.pdf"
+        # veraPDF meldet die Pfade nicht unbedingt in derselben Schreibweise
+        output = _verapdf_report(
+            _verapdf_job(tmp_path / "eins" / ".." / "zwei" / "deck.pdf", compliant=False, failed_clause="7.2"),
+            _verapdf_job(tmp_path / "zwei" / ".." / "eins" / "deck.pdf"),
+        )
+        
+        results = PDFUAValidator("verapdf")._parse_verapdf_output(output, 1, [first, second])
+        
+        assert results[first].is_compliant
+        assert not results[second].is_compliant
+    
+    def test_job_without_result_is_invalid(self, tmp_path):
+        """Jobs ohne Prüfergebnis und fehlende Jobs sind ungültig."""
+        from pptx2ua.validator import PDFUAValidator
+        
+        broken, missing = tmp_path / "kaputt.pdf", tmp_path / "fehlt.pdf"
+        output = _verapdf_report({
+            "itemDetails": {"name": str(broken)},
+            "taskException": {"message": "Verschlüsselt"},
+        })
+        
+        results = PDFUAValidator("verapdf")._parse_verapdf_output(output, 0, [broken, missing])
+        
+        assert not results[broken].is_valid
+        assert not results[broken].is_compliant
+        assert not results[missing].is_valid
+    
+    def test_invalid_json(self):
+        """Keine JSON-Ausgabe löst ValueError aus."""
+        from pptx2ua.validator import PDFUAValidator
+        
+        with pytest.raises(ValueError):
+            PDFUAValidator("verapdf")._parse_verapdf_output(b"Usage: verapdf", 1, [Path("x.pdf")])
+
+
+@pytest.fixture
+def fake_verapdf(tmp_path, monkeypatch):
+    """
+    PDFUAValidator mit Cache in tmp_path und protokollierten veraPDF-Aufrufen.
+    
+    Die Antworten liefert respond(paths, report_format) -> (returncode, stdout, stderr).
+    """
+    import subprocess
+    from pptx2ua.validator import PDFUAValidator
+    
+    validator = PDFUAValidator("verapdf")
+    validator.cache_dir = tmp_path / "cache"
+    validator.calls = []
+    validator.respond = lambda paths, report_format: (
+        0, _verapdf_report(*(_verapdf_job(p) for p in paths)), b""
+    )
+    
+    def run_verapdf(pdf_paths, profile, report_format):
+        validator.calls.append((report_format, [p.name for p in pdf_paths]))
+        returncode, stdout, stderr = validator.respond(pdf_paths, report_format)
+        return subprocess.CompletedProcess([], returncode, stdout, stderr)
+    
+    monkeypatch.setattr(validator, "_run_verapdf", run_verapdf)
+    return validator
+
+
+class TestValidationCache:
+    """Tests für den Ergebnis-Cache nach PDF-Inhalt."""
+    
+    def test_unchanged_pdfs_are_not_revalidated(self, tmp_path, fake_verapdf):
+        """Ein zweiter Lauf über unveränderte PDFs startet kein veraPDF."""
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.write_bytes(f"%PDF {path.name}".encode())
+        
+        first = fake_verapdf.validate_many(paths)
+        second = fake_verapdf.validate_many(paths)
+        
+        assert fake_verapdf.calls == [("json", ["a.pdf", "b.pdf"])]
+        assert second == first
+    
+    def test_changed_pdf_is_revalidated(self, tmp_path, fake_verapdf):
+        """Nur PDFs mit geändertem Inhalt werden erneut geprüft."""
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.write_bytes(f"%PDF {path.name}".encode())
+        fake_verapdf.validate_many(paths)
+        
+        paths[1].write_bytes(b"%PDF neu")
+        fake_verapdf.validate_many(paths)
+        
+        assert fake_verapdf.calls[-1] == ("json", ["b.pdf"])
+    
+    def test_other_verapdf_is_not_served_from_cache(self, tmp_path, fake_verapdf):
+        """Ergebnisse einer anderen veraPDF-Installation werden nicht verwendet."""
+        from pptx2ua.validator import PDFUAValidator
+        
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF a")
+        fake_verapdf.validate(path)
+        
+        other = PDFUAValidator(str(tmp_path / "anderes" / "verapdf"))
+        other.cache_dir = fake_verapdf.cache_dir
+        assert other._cache_path(path, "ua1") != fake_verapdf._cache_path(path, "ua1")
+        assert other._load_cached(other._cache_path(path, "ua1")) is None
+    
+    def test_invalid_results_are_not_cached(self, tmp_path, fake_verapdf):
+        """Fehlgeschlagene Prüfungen werden beim nächsten Lauf wiederholt."""
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF a")
+        fake_verapdf.respond = lambda paths, report_format: (0, _verapdf_report(), b"")
+        
+        assert not fake_verapdf.validate(path).is_valid
+        assert not fake_verapdf.validate(path).is_valid
+        assert len(fake_verapdf.calls) == 2
+    
+    def test_cache_disabled(self, tmp_path, fake_verapdf):
+        """Ohne Cache-Verzeichnis wird jedes Mal geprüft."""
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF a")
+        fake_verapdf.cache_dir = None
+        
+        fake_verapdf.validate(path)
+        fake_verapdf.validate(path)
+        assert len(fake_verapdf.calls) == 2
+
+
+def _write_pdf(path, tagged=False):
+    """Einseitiges PDF, optional mit MarkInfo, Sprache und Titel."""
+    pikepdf = pytest.importorskip("pikepdf")
+    
+    with pikepdf.new() as pdf:
+        pdf.add_blank_page()
+        if tagged:
+            pdf.Root.MarkInfo = pikepdf.Dictionary(Marked=True)
+            pdf.Root.Lang = pikepdf.String("de-DE")
+            pdf.docinfo["/Title"] = "Folien"
+        pdf.save(path)
+
+
+_MRR_REPORT = b"""<?xml version="1.0" encoding="utf-8"?>
+<report><jobs><job><validationResult isCompliant="true">
+<passedRules>10</passedRules><failedRules>0</failedRules>
+</validationResult></job></jobs></report>"""
+
+
+class TestVeraPDFFormats:
+    """Tests für Report-Formate und Metadaten."""
+    
+    def test_json_report_reads_metadata(self, tmp_path, fake_verapdf):
+        """Auch mit JSON-Report stehen Tagging, Sprache und Titel im Ergebnis."""
+        tagged, plain = tmp_path / "tagged.pdf", tmp_path / "plain.pdf"
+        _write_pdf(tagged, tagged=True)
+        _write_pdf(plain)
+        
+        results = fake_verapdf.validate_many([tagged, plain])
+        
+        assert (results[tagged].is_tagged, results[tagged].has_language, results[tagged].has_title) == (True, True, True)
+        assert (results[plain].is_tagged, results[plain].has_language, results[plain].has_title) == (False, False, False)
+        assert results[tagged].pdf_version.startswith("PDF 1.")
+    
+    def test_unreadable_output_keeps_json(self, tmp_path, fake_verapdf):
+        """Eine kaputte Ausgabe schaltet nicht dauerhaft auf XML um."""
+        path = tmp_path / "a.pdf"
+        _write_pdf(path)
+        fake_verapdf.respond = lambda paths, report_format: (1, b"", b"OutOfMemoryError")
+        
+        assert not fake_verapdf.validate(path).is_valid
+        assert fake_verapdf._json_reports
+        assert fake_verapdf.calls == [("json", ["a.pdf"])]
+    
+    def test_rejected_json_switches_to_xml(self, tmp_path, fake_verapdf):
+        """Lehnt veraPDF --format json ab, wird der XML-Report verwendet."""
+        path = tmp_path / "a.pdf"
+        _write_pdf(path, tagged=True)
+        
+        def respond(paths, report_format):
+            if report_format == "json":
+                return 2, b"", b"Parameter --format: allowed values are [xml, mrr, text, html]"
+            return 0, _MRR_REPORT, b""
+        
+        fake_verapdf.respond = respond
+        result = fake_verapdf.validate(path)
+        
+        assert result.is_valid and result.is_compliant
+        assert result.passed_rules == 10
+        assert result.is_tagged and result.has_title
+        assert not fake_verapdf._json_reports
+        assert [fmt for fmt, _ in fake_verapdf.calls] == ["json", "mrr"]
+
+
+class TestCachePruning:
+    """Tests für die Begrenzung der persistenten Caches."""
+    
+    def _entries(self, tmp_path, ages):
+        import os
+        import time
+        
+        now = time.time()
+        entries = []
+        for name, age in ages.items():
+            entry = tmp_path / name
+            entry.mkdir()
+            (entry / "slide-001.png").write_bytes(b"x" * 100)
+            os.utime(entry, (now - age, now - age))
+            entries.append(entry)
+        return entries, now
+    
+    def test_expired_entries_removed(self, tmp_path):
+        """Lange unbenutzte Einträge werden gelöscht."""
+        from pptx2ua.cache import prune_cache
+        
+        entries, now = self._entries(tmp_path, {"alt": 1000, "neu": 10})
+        
+        assert prune_cache(entries, max_bytes=10_000, max_age=100, now=now) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["neu"]
+    
+    def test_oldest_entries_removed_over_limit(self, tmp_path):
+        """Über der Größengrenze gehen die am längsten unbenutzten zuerst."""
+        from pptx2ua.cache import prune_cache
+        
+        entries, now = self._entries(tmp_path, {"a": 30, "b": 20, "c": 10})
+        
+        assert prune_cache(entries, max_bytes=200, max_age=1000, now=now) == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["b", "c"]
+    
+    def test_cache_hit_refreshes_entry(self, tmp_path):
+        """Gelesene Einträge zählen als benutzt."""
+        import os
+        from pptx2ua.slide_renderer import _ThumbnailCache
+        
+        image = tmp_path / "bild.png"
+        image.write_bytes(b"png")
+        cache = _ThumbnailCache(tmp_path / "cache")
+        cache.put("abcdef", [image])
+        entry = tmp_path / "cache" / "ab" / "abcdef"
+        os.utime(entry, (0, 0))
+        
+        assert cache.get("abcdef")
+        assert entry.stat().st_mtime > 0
+    
+    def test_cache_can_be_disabled(self, tmp_path):
+        """enabled=False schaltet den Folienbild-Cache ab."""
+        from pptx2ua.slide_renderer import _ThumbnailCache
+        
+        assert not _ThumbnailCache(tmp_path, enabled=False).enabled
 
 
 # Integration Tests (benötigen echte Dateien)
 
+@pytest.mark.integration
 @pytest.mark.skip(reason="Benötigt Test-PPTX")
 class TestParser:
     """Parser-Tests mit echten Dateien."""
@@ -187,6 +896,7 @@ class TestParser:
         pass
 
 
+@pytest.mark.integration
 @pytest.mark.skip(reason="Benötigt WeasyPrint")
 class TestRenderer:
     """Renderer-Tests."""